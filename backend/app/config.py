@@ -14,11 +14,31 @@ class Settings:
     POSTGRES_PORT: str = os.getenv("POSTGRES_PORT", "5432")
     POSTGRES_DB: str = os.getenv("POSTGRES_DB", "AfriTalent")
     
-    DATABASE_URL: str = f"postgresql://{POSTGRES_USER}:{POSTGRES_PASSWORD}@{POSTGRES_SERVER}:{POSTGRES_PORT}/{POSTGRES_DB}"
+    # DATABASE_URL overrides the Postgres settings (e.g. sqlite:///./test.db for tests)
+    DATABASE_URL: str = os.getenv("DATABASE_URL", f"postgresql://{POSTGRES_USER}:{POSTGRES_PASSWORD}@{POSTGRES_SERVER}:{POSTGRES_PORT}/{POSTGRES_DB}")
+    
+    # Connection pool (per engine, per worker process)
+    DB_POOL_SIZE: int = int(os.getenv("DB_POOL_SIZE", "10"))
+    DB_MAX_OVERFLOW: int = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+    DB_POOL_TIMEOUT: float = float(os.getenv("DB_POOL_TIMEOUT", "10"))
+    DB_POOL_RECYCLE: int = int(os.getenv("DB_POOL_RECYCLE", "1800")) # seconds, -1 disables
+    DB_POOL_PRE_PING: bool = os.getenv("DB_POOL_PRE_PING", "true").lower() == "true"
     
     SECRET_KEY: str = os.getenv("SECRET_KEY", "supersecretkeywhichshouldbechanged")
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
+    # Authenticated user cache (see utils/identity_cache.py), 0 disables it
+    AUTH_CACHE_TTL_SECONDS: float = float(os.getenv("AUTH_CACHE_TTL_SECONDS", "60"))
+    AUTH_CACHE_MAX_SIZE: int = int(os.getenv("AUTH_CACHE_MAX_SIZE", "10000"))
+
+    # Password hashing (see utils/password_hashing.py). Changing the argon2
+    # parameters rehashes each user's password on their next login.
+    ARGON2_TIME_COST: int = int(os.getenv("ARGON2_TIME_COST", "3"))
+    ARGON2_MEMORY_COST: int = int(os.getenv("ARGON2_MEMORY_COST", "65536")) # KiB
+    ARGON2_PARALLELISM: int = int(os.getenv("ARGON2_PARALLELISM", "4"))
+    PASSWORD_HASH_WORKERS: int = int(os.getenv("PASSWORD_HASH_WORKERS", "2")) # 0 hashes inline
+    PASSWORD_HASH_QUEUE_SIZE: int = int(os.getenv("PASSWORD_HASH_QUEUE_SIZE", "16"))
+    PASSWORD_HASH_TIMEOUT: float = float(os.getenv("PASSWORD_HASH_TIMEOUT", "10"))
 
     # Email Settings
     SMTP_HOST: str = os.getenv("SMTP_HOST", "smtp.gmail.com")
@@ -27,5 +47,46 @@ class Settings:
     SMTP_PASSWORD: str = os.getenv("SMTP_PASSWORD", "")
     EMAILS_FROM_EMAIL: str = os.getenv("EMAILS_FROM_EMAIL", "alerts@afritalent.com")
     EMAILS_FROM_NAME: str = os.getenv("EMAILS_FROM_NAME", "AfriTalent Alerts")
+    SMTP_USE_TLS: bool = os.getenv("SMTP_USE_TLS", "true").lower() == "true"
+    SMTP_TIMEOUT: int = int(os.getenv("SMTP_TIMEOUT", "30"))
+    # "smtp", "console" or "auto" (console unless SMTP credentials are configured)
+    EMAIL_BACKEND: str = os.getenv("EMAIL_BACKEND", "auto")
+
+    # Email outbox worker (python -m app.email_worker)
+    EMAIL_BATCH_SIZE: int = int(os.getenv("EMAIL_BATCH_SIZE", "100"))
+    EMAIL_MAX_ATTEMPTS: int = int(os.getenv("EMAIL_MAX_ATTEMPTS", "5"))
+    EMAIL_RETRY_BASE_SECONDS: int = int(os.getenv("EMAIL_RETRY_BASE_SECONDS", "30"))
+    EMAIL_POLL_INTERVAL: float = float(os.getenv("EMAIL_POLL_INTERVAL", "2"))
+    EMAIL_LEASE_SECONDS: int = int(os.getenv("EMAIL_LEASE_SECONDS", "600")) # A claimed email not sent by then is assumed lost and sent again
+
+    # Background task worker (python -m app.task_worker)
+    TASK_WORKER_CONCURRENCY: int = int(os.getenv("TASK_WORKER_CONCURRENCY", "4"))
+    TASK_MAX_ATTEMPTS: int = int(os.getenv("TASK_MAX_ATTEMPTS", "5"))
+    TASK_RETRY_BASE_SECONDS: int = int(os.getenv("TASK_RETRY_BASE_SECONDS", "10"))
+    TASK_LEASE_SECONDS: int = int(os.getenv("TASK_LEASE_SECONDS", "900")) # A running task not finished by then is assumed lost and re-run
+    TASK_POLL_INTERVAL: float = float(os.getenv("TASK_POLL_INTERVAL", "1"))
+
+    # Notification push (GET /notifications/stream, see utils/notification_stream.py).
+    # "postgres" relays notifications between processes with LISTEN/NOTIFY,
+    # "local" only pushes those created in the same API process, "auto" is
+    # postgres on a Postgres database.
+    NOTIFICATION_PUBSUB: str = os.getenv("NOTIFICATION_PUBSUB", "auto")
+    NOTIFICATION_STREAM_HEARTBEAT_SECONDS: float = float(os.getenv("NOTIFICATION_STREAM_HEARTBEAT_SECONDS", "15"))
+    NOTIFICATION_STREAM_QUEUE_SIZE: int = int(os.getenv("NOTIFICATION_STREAM_QUEUE_SIZE", "100"))
+    NOTIFICATION_STREAM_CATCHUP_MAX: int = int(os.getenv("NOTIFICATION_STREAM_CATCHUP_MAX", "1000")) # Beyond this a reconnect is told to resync
+    NOTIFICATION_LISTEN_CHECK_SECONDS: float = float(os.getenv("NOTIFICATION_LISTEN_CHECK_SECONDS", "5"))
+
+    # Job view counter buffering (see utils/view_counter.py)
+    VIEW_FLUSH_INTERVAL_SECONDS: float = float(os.getenv("VIEW_FLUSH_INTERVAL_SECONDS", "5"))
+    VIEW_FLUSH_THRESHOLD: int = int(os.getenv("VIEW_FLUSH_THRESHOLD", "1000"))
+    VIEW_DEDUP_UNIQUE: bool = os.getenv("VIEW_DEDUP_UNIQUE", "false").lower() == "true"
+    VIEW_DEDUP_WINDOW_SECONDS: int = int(os.getenv("VIEW_DEDUP_WINDOW_SECONDS", "1800"))
+    VIEW_DEDUP_MAX_ENTRIES: int = int(os.getenv("VIEW_DEDUP_MAX_ENTRIES", "100000")) # Oldest are forgotten beyond this
+    # Comma-separated addresses of the reverse proxies in front of the API;
+    # only their X-Forwarded-For is believed when telling anonymous viewers apart
+    TRUSTED_PROXIES: list = [p.strip() for p in os.getenv("TRUSTED_PROXIES", "").split(",") if p.strip()]
+
+    # HTTP caching of the public job listing (see utils/http_cache.py)
+    JOB_LIST_MAX_AGE_SECONDS: int = int(os.getenv("JOB_LIST_MAX_AGE_SECONDS", "30"))
 
 settings = Settings()
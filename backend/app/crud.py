@@ -1,22 +1,42 @@
 from typing import List, Optional
-from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import func, cast, Date
-from datetime import datetime, timedelta
+from sqlalchemy.orm import Session, joinedload, undefer_group
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import func, case, update, insert, select, true, false, values, column, Integer, Float
+from sqlalchemy.dialects import postgresql, sqlite
+from datetime import datetime, timedelta, timezone
 from . import models, schemas
-from passlib.context import CryptContext
-
-pwd_context = CryptContext(schemes=["argon2"], deprecated="auto")
+from .utils.search import apply_job_search
+from .utils.pagination import apply_keyset, InvalidCursor
+from .utils.skill_index import seeker_skill_tokens
+from .utils import password_hashing, cv_features, match_scoring, task_queue
+from .utils.notification_stream import publish_on_commit, has_listeners
 
 def get_password_hash(password):
-    return pwd_context.hash(password)
+    return password_hashing.hash_password(password)
 
 def verify_password(plain_password, hashed_password):
-    return pwd_context.verify(plain_password, hashed_password)
+    verified, _ = password_hashing.verify_and_update(plain_password, hashed_password)
+    return verified
+
+def verify_and_update_password(plain_password, hashed_password):
+    # Returns (verified, new_hash); new_hash is set when the argon2 parameters changed
+    return password_hashing.verify_and_update(plain_password, hashed_password)
 
 # --- User CRUD ---
 def get_user_by_email(db: Session, email: str):
     return db.query(models.User).filter(models.User.email == email).first()
 
+async def get_identity_async(db: AsyncSession, email: str):
+    # (user, seeker profile id, employer profile id) in one query, None if there's no such user
+    result = await db.execute(
+        select(models.User, models.SeekerProfile.id, models.EmployerProfile.id)
+        .outerjoin(models.SeekerProfile, models.SeekerProfile.user_id == models.User.id)
+        .outerjoin(models.EmployerProfile, models.EmployerProfile.user_id == models.User.id)
+        .filter(models.User.email == email)
+        .limit(1)
+    )
+    return result.first()
+
 def create_user(db: Session, user: schemas.UserCreate):
     hashed_password = get_password_hash(user.password)
     db_user = models.User(email=user.email, hashed_password=hashed_password, role=user.role)
@@ -28,10 +48,29 @@ def create_user(db: Session, user: schemas.UserCreate):
 def create_seeker_profile(db: Session, profile: schemas.SeekerProfileCreate, user_id: int):
     db_profile = models.SeekerProfile(**profile.dict(), user_id=user_id)
     db.add(db_profile)
+    sync_seeker_skills(db, db_profile)
     db.commit()
     db.refresh(db_profile)
     return db_profile
 
+def sync_seeker_skills(db: Session, profile: models.SeekerProfile):
+    """
+    Rebuilds the profile's rows in the seeker_skills index from profile.skills.
+    Only flushes; the caller commits together with the profile change.
+    """
+    if profile.id is None:
+        db.flush()
+    
+    wanted = seeker_skill_tokens(profile.skills)
+    existing = {row.skill: row for row in db.query(models.SeekerSkill).filter(models.SeekerSkill.seeker_id == profile.id)}
+    
+    for skill, row in existing.items():
+        if skill not in wanted:
+            db.delete(row)
+    for skill in wanted - existing.keys():
+        db.add(models.SeekerSkill(seeker_id=profile.id, skill=skill))
+    db.flush()
+
 def create_employer_profile(db: Session, profile: schemas.EmployerProfileCreate, user_id: int):
     db_profile = models.EmployerProfile(**profile.dict(), user_id=user_id)
     db.add(db_profile)
@@ -40,16 +79,23 @@ def create_employer_profile(db: Session, profile: schemas.EmployerProfileCreate,
     return db_profile
 
 # --- Job CRUD ---
-def get_jobs(db: Session, skip: int = 0, limit: int = 100, search: Optional[str] = None, location: Optional[str] = None, job_type: Optional[str] = None, experience_level: Optional[str] = None, salary_min: Optional[int] = None):
-    query = db.query(models.Job)
+def get_jobs(db: Session, skip: int = 0, limit: int = 100, search: Optional[str] = None, location: Optional[str] = None, job_type: Optional[str] = None, experience_level: Optional[str] = None, salary_min: Optional[int] = None, rank: bool = False, highlight: bool = False, cursor: Optional[str] = None, status: Optional[str] = None):
+    # JobResponse includes the description, so load it with the page rather than per job
+    query = db.query(models.Job).options(undefer_group("content"))
+    extra_columns = []
     
     if search:
-        search_filter = f"%{search}%"
-        query = query.filter(
-            (models.Job.title.ilike(search_filter)) | 
-            (models.Job.description.ilike(search_filter))
-        )
+        if cursor:
+            raise InvalidCursor("Cursor pagination is not available for search results, use skip/limit")
+        # Relevance-ranked full-text search (see utils/search.py)
+        query, extra_columns = apply_job_search(query, search, rank=rank, highlight=highlight)
+    else:
+        # Stable newest-first order; a cursor replaces the OFFSET scan with a keyset seek
+        query = apply_keyset(query, models.Job.created_at, models.Job.id, cursor)
     
+    if status:
+        query = query.filter(models.Job.status == status)
+        
     if location:
         query = query.filter(models.Job.location.ilike(f"%{location}%"))
         
@@ -62,30 +108,59 @@ def get_jobs(db: Session, skip: int = 0, limit: int = 100, search: Optional[str]
     if salary_min:
         query = query.filter(models.Job.salary_min >= salary_min)
         
-    return query.offset(skip).limit(limit).all()
+    if cursor:
+        results = query.limit(limit).all()
+    else:
+        results = query.offset(skip).limit(limit).all()
+    if not extra_columns:
+        return results
+    
+    # Attach rank / highlight to the Job objects for the response
+    jobs = []
+    for row in results:
+        job = row[0]
+        for name in extra_columns:
+            setattr(job, name, getattr(row, name))
+        jobs.append(job)
+    return jobs
 
-def get_job(db: Session, job_id: int):
-    return db.query(models.Job).filter(models.Job.id == job_id).first()
+def get_job(db: Session, job_id: int, with_content: bool = False):
+    query = db.query(models.Job).filter(models.Job.id == job_id)
+    if with_content:
+        query = query.options(undefer_group("content"))
+    return query.first()
 
 def create_job(db: Session, job: schemas.JobCreate, employer_id: int):
     db_job = models.Job(**job.dict(), employer_id=employer_id)
     db.add(db_job)
+    bump_listing_version(db)
+    db.flush()
+    # Job alerts go out from the task worker; queued in the job's own
+    # transaction so a published job always gets its alerts
+    task_queue.enqueue(db, "trigger_job_alerts", job_id=db_job.id)
     db.commit()
     db.refresh(db_job)
     return db_job
 
 # --- Application CRUD ---
 def create_application(db: Session, application: schemas.ApplicationCreate, seeker_id: int):
-    # Mock AI Match Score logic
-    import random
-    match_score = round(random.uniform(60.0, 95.0), 1)
-    
     cv_id = application.cv_id
-    if not cv_id:
+    cv = None
+    if cv_id:
+        cv = db.query(models.CV).filter(models.CV.id == cv_id, models.CV.seeker_id == seeker_id).first()
+    else:
         # Try to find primary CV
-        primary_cv = get_primary_cv(db, seeker_id)
-        if primary_cv:
-            cv_id = primary_cv.id
+        cv = get_primary_cv(db, seeker_id)
+        if cv:
+            cv_id = cv.id
+    
+    # Match score from the job and the seeker's profile + CV skills (see utils/match_scoring.py)
+    match_score = 0.0
+    job = get_job(db, application.job_id, with_content=True)
+    seeker = db.query(models.SeekerProfile).filter(models.SeekerProfile.id == seeker_id).first()
+    if job and seeker:
+        cv_skills = cv_features.get_features(cv)["skills"] if cv else ()
+        match_score = match_scoring.score_application(job, seeker, cv_skills)
     
     db_application = models.Application(
         job_id=application.job_id,
@@ -95,6 +170,16 @@ def create_application(db: Session, application: schemas.ApplicationCreate, seek
         cv_id=cv_id
     )
     db.add(db_application)
+    # Counted in the same transaction as the insert; updated_at is kept, a new applicant isn't an edit of the job
+    db.execute(
+        update(models.Job)
+        .where(models.Job.id == application.job_id)
+        .values(applicants_count=models.Job.applicants_count + 1, updated_at=models.Job.updated_at)
+        .execution_options(synchronize_session=False)
+    )
+    # The listing shows applicants_count
+    bump_listing_version(db)
+    bump_rollups(db, [{"job_id": application.job_id, "applications": 1}])
     db.commit()
     db.refresh(db_application)
     return db_application
@@ -116,8 +201,12 @@ def create_saved_job(db: Session, saved_job: schemas.SavedJobCreate, seeker_id:
     db.refresh(db_saved_job)
     return db_saved_job
 
-def get_saved_jobs_by_seeker(db: Session, seeker_id: int):
-    return db.query(models.SavedJob).filter(models.SavedJob.seeker_id == seeker_id).all()
+def get_saved_jobs_by_seeker(db: Session, seeker_id: int, limit: Optional[int] = None, cursor: Optional[str] = None):
+    query = db.query(models.SavedJob).filter(models.SavedJob.seeker_id == seeker_id)
+    query = apply_keyset(query, models.SavedJob.created_at, models.SavedJob.id, cursor)
+    if limit:
+        query = query.limit(limit)
+    return query.all()
 
 def get_saved_job_by_seeker_and_job(db: Session, seeker_id: int, job_id: int):
     return db.query(models.SavedJob).filter(
@@ -133,84 +222,166 @@ def delete_saved_job(db: Session, saved_job_id: int):
     return db_saved_job
 
 # --- Employer Analytics ---
-def get_employer_metrics(db: Session, employer_id: int):
-    active_jobs = db.query(models.Job).filter(
-        models.Job.employer_id == employer_id,
-        models.Job.status == models.JobStatus.OPEN
-    ).count()
+def get_employer_dashboard(db: Session, employer_id: int, days: int = 7, recent_limit: int = 5):
+    """
+    Everything the employer dashboard shows, in two queries: one row built
+    from the rollup tables (employer_stats, job_daily_stats) and the open
+    jobs count, and one projection of the most recent applicants. Neither
+    scans the employer's applications.
+    """
+    # Day buckets in UTC, oldest first
+    end_date = datetime.now(timezone.utc).date()
+    start_date = end_date - timedelta(days=days-1)
+    day_list = [start_date + timedelta(days=i) for i in range(days)]
     
-    total_applicants = db.query(models.Application).join(models.Job).filter(
-        models.Job.employer_id == employer_id
-    ).count()
+    job_stats = db.query(
+        func.count(case((models.Job.status == models.JobStatus.OPEN, 1))).label("active_jobs")
+    ).filter(models.Job.employer_id == employer_id).subquery()
     
-    interviews = db.query(models.Application).join(models.Job).filter(
-        models.Job.employer_id == employer_id,
-        models.Application.status == models.ApplicationStatus.INTERVIEWED
-    ).count()
+    # Aggregates so that an employer without a stats row still gets one row of zeros
+    totals = db.query(
+        func.coalesce(func.sum(models.EmployerStats.total_applicants), 0).label("total_applicants"),
+        func.coalesce(func.sum(models.EmployerStats.interviews), 0).label("interviews"),
+        func.coalesce(func.sum(models.EmployerStats.job_views), 0).label("job_views")
+    ).filter(models.EmployerStats.employer_id == employer_id).subquery()
     
-    # Real job views summed from the jobs table
-    job_views = db.query(func.sum(models.Job.views)).filter(
-        models.Job.employer_id == employer_id
-    ).scalar() or 0
+    daily = models.JobDailyStats
+    trend = db.query(*[
+        func.coalesce(func.sum(case((daily.day == day, daily.applications), else_=0)), 0).label(f"day_{i}")
+        for i, day in enumerate(day_list)
+    ]).filter(daily.employer_id == employer_id, daily.day >= start_date).subquery()
+    
+    # Each subquery returns exactly one row, so joining them on true yields one row
+    stats = db.query(job_stats, totals, trend).select_from(job_stats).join(totals, true()).join(trend, true()).one()
     
-    return active_jobs, total_applicants, interviews, job_views
+    application_trends = []
+    for i, day in enumerate(day_list):
+        application_trends.append({
+            "name": day.strftime("%a"), # Mon, Tue, etc.
+            "value": getattr(stats, f"day_{i}")
+        })
+    
+    return {
+        "active_jobs": stats.active_jobs,
+        "total_applicants": stats.total_applicants,
+        "interviews": stats.interviews,
+        "job_views": stats.job_views,
+        "application_trends": application_trends,
+        "recent_applicants": get_recent_applicants(db, employer_id, limit=recent_limit)
+    }
 
 def get_recent_applicants(db: Session, employer_id: int, limit: int = 5):
-    applications = db.query(models.Application).join(models.Job).join(models.SeekerProfile).filter(
+    # Only the columns the dashboard shows, no ORM objects or lazy loads
+    rows = db.query(
+        models.Application.match_score,
+        models.Application.applied_at,
+        models.SeekerProfile.first_name,
+        models.SeekerProfile.last_name,
+        models.Job.title
+    ).join(models.Job, models.Application.job_id == models.Job.id).join(
+        models.SeekerProfile, models.Application.seeker_id == models.SeekerProfile.id
+    ).filter(
         models.Job.employer_id == employer_id
     ).order_by(models.Application.applied_at.desc()).limit(limit).all()
     
     recent = []
-    for app in applications:
-        seeker = app.seeker
-        first_name = seeker.first_name or "Candidate"
-        last_initial = seeker.last_name[0] if seeker.last_name else ""
+    now = datetime.utcnow()
+    for row in rows:
+        first_name = row.first_name or "Candidate"
+        last_initial = row.last_name[0] if row.last_name else ""
         name = f"{first_name} {last_initial}." if last_initial else first_name
         
         # Calculate time ago
-        now = datetime.utcnow()
-        delta = now - app.applied_at.replace(tzinfo=None)
+        delta = now - row.applied_at.replace(tzinfo=None)
         if delta.seconds < 86400 and delta.days == 0:
             date_str = f"{delta.seconds // 3600}h ago"
         else:
-            date_str = app.applied_at.strftime("%d days ago")
+            date_str = row.applied_at.strftime("%d days ago")
             
         recent.append({
             "name": name,
-            "role": app.job.title,
-            "match": f"{int(app.match_score)}%",
+            "role": row.title,
+            "match": f"{int(row.match_score or 0)}%",
             "date": date_str
         })
     return recent
 
-def get_application_trends(db: Session, employer_id: int, days: int = 7):
-    # Calculate the date range
-    end_date = datetime.utcnow().date()
-    start_date = end_date - timedelta(days=days-1)
+# --- Analytics Rollups ---
+def _insert_for(db: Session, table):
+    # INSERT ... ON CONFLICT is dialect specific in SQLAlchemy
+    if db.get_bind().dialect.name == "postgresql":
+        return postgresql.insert(table)
+    return sqlite.insert(table)
+
+def bump_rollups(db: Session, deltas: list):
+    """
+    Adds counter deltas to employer_stats and today's job_daily_stats rows.
+    Each delta is {"job_id": ..., "applications"/"interviews"/"views": n}.
+    Runs in the caller's transaction, the caller commits.
+    """
+    if not deltas:
+        return
+    job_ids = {d["job_id"] for d in deltas}
+    employers = dict(db.query(models.Job.id, models.Job.employer_id).filter(models.Job.id.in_(job_ids)).all())
+    today = datetime.now(timezone.utc).date()
     
-    # Query real application counts grouped by date
-    # We join with Job to filter by employer_id
-    results = db.query(
-        cast(models.Application.applied_at, Date).label('date'),
-        func.count(models.Application.id).label('count')
-    ).join(models.Job).filter(
-        models.Job.employer_id == employer_id,
-        models.Application.applied_at >= start_date
-    ).group_by(cast(models.Application.applied_at, Date)).all()
+    # Merge per key first: one statement must not hit the same row twice
+    employer_rows, job_rows = {}, {}
+    for d in deltas:
+        employer_id = employers.get(d["job_id"])
+        if employer_id is None:
+            continue
+        row = employer_rows.setdefault(employer_id, {"employer_id": employer_id, "total_applicants": 0, "interviews": 0, "job_views": 0})
+        row["total_applicants"] += d.get("applications", 0)
+        row["interviews"] += d.get("interviews", 0)
+        row["job_views"] += d.get("views", 0)
+        if d.get("applications") or d.get("views"):
+            row = job_rows.setdefault(d["job_id"], {"job_id": d["job_id"], "day": today, "employer_id": employer_id, "applications": 0, "views": 0})
+            row["applications"] += d.get("applications", 0)
+            row["views"] += d.get("views", 0)
     
-    # Convert results to a dictionary for easy lookup
-    data_map = {r.date: r.count for r in results}
+    if employer_rows:
+        table = models.EmployerStats.__table__
+        stmt = _insert_for(db, table)
+        stmt = stmt.on_conflict_do_update(index_elements=[table.c.employer_id], set_={
+            "total_applicants": table.c.total_applicants + stmt.excluded.total_applicants,
+            "interviews": table.c.interviews + stmt.excluded.interviews,
+            "job_views": table.c.job_views + stmt.excluded.job_views,
+        })
+        db.execute(stmt, list(employer_rows.values()))
     
-    # Prepare the daily labels and values
-    trends = []
-    for i in range(days):
-        current_date = start_date + timedelta(days=i)
-        trends.append({
-            "name": current_date.strftime("%a"), # Mon, Tue, etc.
-            "value": data_map.get(current_date, 0)
+    if job_rows:
+        table = models.JobDailyStats.__table__
+        stmt = _insert_for(db, table)
+        stmt = stmt.on_conflict_do_update(index_elements=[table.c.job_id, table.c.day], set_={
+            "applications": table.c.applications + stmt.excluded.applications,
+            "views": table.c.views + stmt.excluded.views,
         })
-        
-    return trends
+        db.execute(stmt, list(job_rows.values()))
+
+# --- HTTP Cache Validators ---
+def get_listing_version(db: Session, name: str = "jobs"):
+    # (version, updated_at) of the listing, (0, None) until it first changes
+    row = db.query(models.ListingVersion.version, models.ListingVersion.updated_at).filter(models.ListingVersion.name == name).first()
+    return tuple(row) if row else (0, None)
+
+def bump_listing_version(db: Session, name: str = "jobs"):
+    # Runs in the caller's transaction, the caller commits
+    table = models.ListingVersion.__table__
+    stmt = _insert_for(db, table).values(name=name, version=1, updated_at=func.now())
+    stmt = stmt.on_conflict_do_update(index_elements=[table.c.name], set_={
+        "version": table.c.version + 1,
+        "updated_at": func.now(),
+    })
+    db.execute(stmt)
+
+def get_job_validators(db: Session, job_id: int):
+    # Just what GET /jobs/{id} needs to answer 304, without loading the job:
+    # (last_modified, views, applicants_count), None if there's no such job
+    row = db.query(
+        func.coalesce(models.Job.updated_at, models.Job.created_at), models.Job.views, models.Job.applicants_count
+    ).filter(models.Job.id == job_id).first()
+    return tuple(row) if row else None
 
 # --- Employer Profile CRUD ---
 def get_employer_profile(db: Session, user_id: int):
@@ -219,46 +390,62 @@ def get_employer_profile(db: Session, user_id: int):
 def update_employer_profile(db: Session, profile: models.EmployerProfile, update_data: dict):
     for key, value in update_data.items():
         setattr(profile, key, value)
+    if db.is_modified(profile):
+        # Job listings and job pages embed the employer (company name, logo):
+        # move their validators on so cached copies are refetched
+        bump_listing_version(db)
+        db.execute(
+            update(models.Job)
+            .where(models.Job.employer_id == profile.id)
+            .values(updated_at=func.now())
+            .execution_options(synchronize_session=False)
+        )
     db.commit()
     db.refresh(profile)
     return profile
 
 # --- Job CRUD (Extended) ---
 def get_employer_jobs(db: Session, employer_id: int):
-    # Get jobs with application counts
-    results = db.query(
-        models.Job,
-        func.count(models.Application.id).label('applicants_count')
-    ).outerjoin(models.Application).filter(
+    # applicants_count is a column on jobs, no join to applications needed
+    return db.query(models.Job).options(undefer_group("content")).filter(
         models.Job.employer_id == employer_id
-    ).group_by(models.Job.id).all()
-    
-    # Map back to models and attach the computed count
-    jobs = []
-    for job, count in results:
-        job.applicants_count = count
-        jobs.append(job)
-        
-    return jobs
+    ).all()
 
-def update_job(db: Session, job_id: int, update_data: dict):
+def update_job(db: Session, job_id: int, update_data: dict, rescore: bool = False):
+    """
+    rescore: also queue re-scoring of the job's applicants (task worker),
+    committed together with the change.
+    """
     db_job = db.query(models.Job).filter(models.Job.id == job_id).first()
     if db_job:
         for key, value in update_data.items():
             setattr(db_job, key, value)
+        if db.is_modified(db_job):
+            bump_listing_version(db)
+        if rescore:
+            task_queue.enqueue(db, "rescore_job_applications", job_id=job_id)
         db.commit()
         db.refresh(db_job)
     return db_job
 
-def increment_job_view(db: Session, job_id: int):
-    # This will be run as a background task
-    db.query(models.Job).filter(models.Job.id == job_id).update(
-        {models.Job.views: models.Job.views + 1}
+def increment_job_views(db: Session, view_counts: dict):
+    # Applies buffered view counts {job_id: n} in one UPDATE (see utils/view_counter.py)
+    if not view_counts:
+        return
+    db.execute(
+        update(models.Job)
+        .where(models.Job.id.in_(view_counts.keys()))
+        # Keep updated_at: a view isn't an edit, and it's the job's Last-Modified
+        .values(views=func.coalesce(models.Job.views, 0) + case(view_counts, value=models.Job.id, else_=0), updated_at=models.Job.updated_at)
+        .execution_options(synchronize_session=False)
     )
+    # The listing shows the view counts; one bump per flush, not per view
+    bump_listing_version(db)
+    bump_rollups(db, [{"job_id": job_id, "views": n} for job_id, n in view_counts.items()])
     db.commit()
 
 # --- Application CRUD (Extended) ---
-def get_employer_applications(db: Session, employer_id: int, job_id: int = None, status: str = None):
+def get_employer_applications(db: Session, employer_id: int, job_id: int = None, status: str = None, limit: Optional[int] = None, cursor: Optional[str] = None):
     query = db.query(models.Application).join(models.Job).options(
         joinedload(models.Application.seeker),
         joinedload(models.Application.job),
@@ -268,19 +455,105 @@ def get_employer_applications(db: Session, employer_id: int, job_id: int = None,
         query = query.filter(models.Application.job_id == job_id)
     if status:
         query = query.filter(models.Application.status == status)
+    query = apply_keyset(query, models.Application.applied_at, models.Application.id, cursor)
+    if limit:
+        query = query.limit(limit)
     return query.all()
 
+def get_ranked_candidates(db: Session, job_id: int, status: str = None, limit: int = 20, cursor: Optional[str] = None):
+    """
+    The job's applicants, best match first, as a projection of the
+    application, seeker name/headline and CV title. Ordered on
+    (match_score, id) so both the first page and the cursor seek are a
+    range read of ix_applications_job_score.
+    """
+    query = db.query(
+        models.Application.id,
+        models.Application.job_id,
+        models.Application.seeker_id,
+        models.Application.status,
+        models.Application.match_score,
+        models.Application.applied_at,
+        models.Application.cv_id,
+        models.CV.title.label("cv_title"),
+        models.SeekerProfile.first_name,
+        models.SeekerProfile.last_name,
+        models.SeekerProfile.headline,
+        models.SeekerProfile.location,
+    ).join(
+        models.SeekerProfile, models.SeekerProfile.id == models.Application.seeker_id
+    ).outerjoin(
+        models.CV, models.CV.id == models.Application.cv_id
+    ).filter(models.Application.job_id == job_id)
+    if status:
+        query = query.filter(models.Application.status == status)
+    query = apply_keyset(query, models.Application.match_score, models.Application.id, cursor)
+    return query.limit(limit).all()
+
+def set_application_status(db: Session, db_app: models.Application, status: str):
+    # Every application status change goes through here so employer_stats.interviews stays in sync
+    was_interviewed = db_app.status == models.ApplicationStatus.INTERVIEWED
+    is_interviewed = status == models.ApplicationStatus.INTERVIEWED
+    db_app.status = status
+    if was_interviewed != is_interviewed:
+        bump_rollups(db, [{"job_id": db_app.job_id, "interviews": 1 if is_interviewed else -1}])
+
 def update_application_status(db: Session, application_id: int, status: str):
     db_app = db.query(models.Application).filter(models.Application.id == application_id).first()
     if db_app:
-        db_app.status = status
+        set_application_status(db, db_app, status)
         db.commit()
         db.refresh(db_app)
     return db_app
 
+def get_applicants_for_scoring(db: Session, job_id: int):
+    """
+    One row per application to the job with just what match_scoring reads:
+    the seeker's preference columns and the stored features of the CV they
+    applied with. A projection, so 50k applicants don't become 50k ORM objects.
+    """
+    return db.query(
+        models.Application.id,
+        models.Application.match_score,
+        models.Application.cv_id,
+        models.SeekerProfile.skills,
+        models.SeekerProfile.experience_level,
+        models.SeekerProfile.job_type,
+        models.SeekerProfile.location,
+        models.SeekerProfile.preferred_locations,
+        models.SeekerProfile.min_salary,
+        models.CV.features_json,
+    ).join(
+        models.SeekerProfile, models.SeekerProfile.id == models.Application.seeker_id
+    ).outerjoin(
+        models.CV, models.CV.id == models.Application.cv_id
+    ).filter(models.Application.job_id == job_id).all()
+
+def update_match_scores(db: Session, scores: list):
+    """
+    Writes [{"id": application_id, "match_score": score}, ...] in one statement:
+    UPDATE ... FROM (VALUES ...) on Postgres, an executemany elsewhere.
+    """
+    if not scores:
+        return
+    if db.get_bind().dialect.name == "postgresql":
+        new_scores = values(
+            column("id", Integer), column("match_score", Float), name="new_scores"
+        ).data([(s["id"], s["match_score"]) for s in scores])
+        db.execute(
+            update(models.Application)
+            .where(models.Application.id == new_scores.c.id)
+            .values(match_score=new_scores.c.match_score)
+            .execution_options(synchronize_session=False)
+        )
+    else:
+        db.execute(update(models.Application), scores)
+    db.commit()
+
 # --- CV CRUD ---
 def create_cv(db: Session, cv: schemas.CVCreate, seeker_id: int):
     db_cv = models.CV(**cv.dict(), seeker_id=seeker_id)
+    cv_features.refresh_features(db_cv)
     db.add(db_cv)
     db.commit()
     db.refresh(db_cv)
@@ -289,8 +562,11 @@ def create_cv(db: Session, cv: schemas.CVCreate, seeker_id: int):
 def get_cvs(db: Session, seeker_id: int):
     return db.query(models.CV).filter(models.CV.seeker_id == seeker_id).order_by(models.CV.created_at.desc()).all()
 
-def get_cv(db: Session, cv_id: int):
-    return db.query(models.CV).filter(models.CV.id == cv_id).first()
+def get_cv(db: Session, cv_id: int, with_content: bool = False):
+    query = db.query(models.CV).filter(models.CV.id == cv_id)
+    if with_content:
+        query = query.options(undefer_group("content"))
+    return query.first()
 
 def delete_cv(db: Session, cv_id: int):
     db_cv = db.query(models.CV).filter(models.CV.id == cv_id).first()
@@ -304,10 +580,19 @@ def update_cv(db: Session, cv_id: int, update_data: dict):
     if db_cv:
         for key, value in update_data.items():
             setattr(db_cv, key, value)
+        # Only re-extracts when the title or content actually changed
+        cv_features.refresh_features(db_cv)
         db.commit()
         db.refresh(db_cv)
     return db_cv
 
+def get_cv_features(db: Session, cv: models.CV):
+    features = cv_features.get_features(cv)
+    if db.is_modified(cv):
+        # Computed lazily for a CV saved before features existed
+        db.commit()
+    return features
+
 def set_primary_cv(db: Session, seeker_id: int, cv_id: int):
     # Unset existing primary
     db.query(models.CV).filter(
@@ -362,7 +647,7 @@ def create_interview(db: Session, interview: schemas.InterviewCreate, employer_i
     # Also update application status to INVITED
     app = db.query(models.Application).filter(models.Application.id == interview.application_id).first()
     if app and app.status in [models.ApplicationStatus.APPLIED, models.ApplicationStatus.SHORTLISTED]:
-        app.status = models.ApplicationStatus.INVITED
+        set_application_status(db, app, models.ApplicationStatus.INVITED)
         
     db.commit()
     db.refresh(db_interview)
@@ -392,14 +677,74 @@ def create_notification(db: Session, user_id: int, title: str, message: str):
         message=message
     )
     db.add(db_notification)
-    db.commit()
+    db.flush()
     db.refresh(db_notification)
+    publish_on_commit(db, [{c.key: getattr(db_notification, c.key) for c in models.Notification.__table__.columns}])
+    db.commit()
     return db_notification
 
-def get_notifications(db: Session, user_id: int):
-    return db.query(models.Notification).filter(
+def create_notifications(db: Session, notifications: list):
+    """
+    Inserts many notifications, [{"user_id": ..., "title": ..., "message": ...}, ...],
+    in one executemany INSERT (sent as multi-row VALUES pages on Postgres)
+    and pushes them to the users' open streams. For fan-out to many users;
+    runs in the caller's transaction, the caller commits.
+    """
+    if not notifications:
+        return 0
+    if not has_listeners():
+        db.execute(insert(models.Notification), notifications)
+        return len(notifications)
+    # RETURNING is batched with the pages, it only adds the generated columns
+    created = db.execute(
+        insert(models.Notification).returning(
+            models.Notification.id, models.Notification.created_at, sort_by_parameter_order=True
+        ),
+        notifications
+    ).all()
+    publish_on_commit(db, [
+        dict(n, id=row.id, created_at=row.created_at, is_read=False)
+        for n, row in zip(notifications, created)
+    ])
+    return len(notifications)
+
+async def get_notifications_since_async(db: AsyncSession, user_id: int, since_id: int, limit: int = 100):
+    # Oldest first, for a stream catching up after a reconnect
+    result = await db.execute(
+        select(models.Notification)
+        .filter(models.Notification.user_id == user_id, models.Notification.id > since_id)
+        .order_by(models.Notification.id)
+        .limit(limit)
+    )
+    return result.scalars().all()
+
+async def get_newest_notification_id_async(db: AsyncSession, user_id: int):
+    result = await db.execute(select(func.max(models.Notification.id)).filter(models.Notification.user_id == user_id))
+    return result.scalar()
+
+def get_notifications(db: Session, user_id: int, limit: Optional[int] = None, cursor: Optional[str] = None, since_id: Optional[int] = None):
+    query = db.query(models.Notification).filter(
+        models.Notification.user_id == user_id
+    )
+    if since_id is not None:
+        # Incremental sync: only what was created after the newest one the client has
+        query = query.filter(models.Notification.id > since_id)
+    query = apply_keyset(query, models.Notification.created_at, models.Notification.id, cursor)
+    if limit:
+        query = query.limit(limit)
+    return query.all()
+
+async def get_notifications_async(db: AsyncSession, user_id: int, limit: Optional[int] = None, cursor: Optional[str] = None, since_id: Optional[int] = None):
+    query = select(models.Notification).filter(
         models.Notification.user_id == user_id
-    ).order_by(models.Notification.created_at.desc()).all()
+    )
+    if since_id is not None:
+        query = query.filter(models.Notification.id > since_id)
+    query = apply_keyset(query, models.Notification.created_at, models.Notification.id, cursor)
+    if limit:
+        query = query.limit(limit)
+    result = await db.execute(query)
+    return result.scalars().all()
 
 def mark_notification_read(db: Session, notification_id: int, user_id: int):
     notification = db.query(models.Notification).filter(
@@ -411,6 +756,29 @@ def mark_notification_read(db: Session, notification_id: int, user_id: int):
         db.commit()
     return notification
 
+async def count_unread_notifications_async(db: AsyncSession, user_id: int):
+    # Served by the partial index ix_notifications_user_unread (is_read = false)
+    result = await db.execute(
+        select(func.count()).select_from(models.Notification).filter(
+            models.Notification.user_id == user_id,
+            models.Notification.is_read == false()
+        )
+    )
+    return result.scalar_one()
+
+def mark_all_notifications_read(db: Session, user_id: int):
+    """
+    Marks all the user's unread notifications read in one UPDATE. Returns how many.
+    """
+    result = db.execute(
+        update(models.Notification)
+        .where(models.Notification.user_id == user_id, models.Notification.is_read == false())
+        .values(is_read=True)
+        .execution_options(synchronize_session=False)
+    )
+    db.commit()
+    return result.rowcount
+
 def respond_to_interview(db: Session, interview_id: int, status: str, seeker_id: int, notes: str = None):
     interview = db.query(models.Interview).filter(
         models.Interview.id == interview_id,
@@ -440,7 +808,7 @@ def respond_to_interview(db: Session, interview_id: int, status: str, seeker_id:
     if status == models.InterviewStatus.ACCEPTED:
         app = db.query(models.Application).filter(models.Application.id == interview.application_id).first()
         if app:
-            app.status = models.ApplicationStatus.SCHEDULED
+            set_application_status(db, app, models.ApplicationStatus.SCHEDULED)
             
     # Notify Employer
     seeker = db.query(models.SeekerProfile).filter(models.SeekerProfile.id == seeker_id).first()
@@ -0,0 +1,199 @@
+"""
+Email outbox worker.
+
+Drains the email_outbox table in batches over one persistent SMTP session
+(a single TLS handshake + LOGIN for as long as the server keeps the
+connection open), retrying failed messages with exponential backoff and
+dead-lettering them after EMAIL_MAX_ATTEMPTS or a permanent (5xx) error.
+A batch is claimed (status sending) and committed before any SMTP traffic
+and each outcome is committed as soon as it is known, so no row lock or
+transaction is held while talking to the server. Emails a dead worker had
+claimed are sent again once their lease (EMAIL_LEASE_SECONDS) expires.
+
+Run it next to the API (several workers can run side by side, rows are
+claimed with SELECT ... FOR UPDATE SKIP LOCKED):
+
+    cd backend && python -m app.email_worker
+
+To try it against a local SMTP stand-in:
+
+    python -m aiosmtpd -n -l localhost:8025
+    EMAIL_BACKEND=smtp SMTP_HOST=localhost SMTP_PORT=8025 SMTP_USE_TLS=false python -m app.email_worker
+"""
+import smtplib
+import time
+from datetime import datetime, timedelta, timezone
+from sqlalchemy import and_, or_, update
+from sqlalchemy.orm import Session
+from . import models
+from .config import settings
+from .database import SessionLocal
+from .utils.email_utils import build_message, smtp_enabled
+
+MAX_RETRY_DELAY_SECONDS = 6 * 60 * 60
+
+class ConnectionFailed(Exception):
+    """
+    The SMTP session could not be set up (connect, STARTTLS or login), so
+    nothing can be said about the message that was about to be sent.
+    """
+
+class SMTPSession:
+    """
+    Lazily opened SMTP connection that is reused across messages and
+    re-established once if the server dropped it.
+    """
+    def __init__(self):
+        self._server = None
+        self.connect_failures = 0 # In a row, for the backoff while the server is unreachable
+
+    def _connect(self):
+        server = None
+        try:
+            server = smtplib.SMTP(settings.SMTP_HOST, settings.SMTP_PORT, timeout=settings.SMTP_TIMEOUT)
+            server.ehlo()
+            if settings.SMTP_USE_TLS:
+                server.starttls()
+                server.ehlo()
+            if settings.SMTP_USER:
+                server.login(settings.SMTP_USER, settings.SMTP_PASSWORD)
+        except (smtplib.SMTPException, OSError) as e:
+            if server is not None:
+                server.close()
+            self.connect_failures += 1
+            raise ConnectionFailed(f"Could not connect to {settings.SMTP_HOST}:{settings.SMTP_PORT}: {e}") from e
+        self.connect_failures = 0
+        self._server = server
+
+    def send(self, email: models.EmailOutbox):
+        msg = build_message(email)
+        if self._server is None:
+            self._connect()
+        try:
+            self._server.sendmail(settings.EMAILS_FROM_EMAIL, email.to_email, msg.as_string())
+        except smtplib.SMTPServerDisconnected:
+            # Idle connection was closed by the server, reconnect and retry once
+            self._server = None
+            self._connect()
+            self._server.sendmail(settings.EMAILS_FROM_EMAIL, email.to_email, msg.as_string())
+
+    def close(self):
+        if self._server is not None:
+            try:
+                self._server.quit()
+            except (smtplib.SMTPException, OSError):
+                pass
+            self._server = None
+
+class ConsoleSession:
+    """
+    Development stand-in that prints emails instead of sending them.
+    """
+    def send(self, email: models.EmailOutbox):
+        print(f"--- DEVELOPMENT MODE: EMAIL LOG ---")
+        print(f"To: {email.to_email}")
+        if email.reply_to: print(f"Reply-To: {email.reply_to}")
+        print(f"Subject: {email.subject}")
+        print(f"Body: {email.body_html}")
+        print(f"-----------------------------------")
+
+    def close(self):
+        pass
+
+def is_permanent_error(error: Exception):
+    # Only a 5xx reply to this message's MAIL, RCPT or DATA condemns the
+    # message; connection and login errors or 4xx replies are retried
+    if isinstance(error, smtplib.SMTPRecipientsRefused):
+        return all(code >= 500 for code, _ in error.recipients.values())
+    return isinstance(error, (smtplib.SMTPSenderRefused, smtplib.SMTPDataError)) and error.smtp_code >= 500
+
+def retry_delay(attempts: int):
+    return min(settings.EMAIL_RETRY_BASE_SECONDS * 2 ** (attempts - 1), MAX_RETRY_DELAY_SECONDS)
+
+def claim_batch(db: Session, size: int):
+    """
+    Marks the next due emails as sending and returns them detached from db.
+    The row locks only last for this short claim transaction; an email whose
+    worker died before recording the outcome is claimable again once its
+    lease expires.
+    """
+    now = datetime.now(timezone.utc)
+    lease_expired = now - timedelta(seconds=settings.EMAIL_LEASE_SECONDS)
+    batch = db.query(models.EmailOutbox).filter(or_(
+        and_(models.EmailOutbox.status == models.EmailStatus.PENDING, models.EmailOutbox.next_attempt_at <= now),
+        and_(models.EmailOutbox.status == models.EmailStatus.SENDING, models.EmailOutbox.locked_at < lease_expired),
+    )).order_by(
+        models.EmailOutbox.next_attempt_at, models.EmailOutbox.id
+    ).limit(size).with_for_update(skip_locked=True).all()
+    for email in batch:
+        email.status = models.EmailStatus.SENDING
+        email.locked_at = now
+    db.flush()
+    for email in batch:
+        # Keeps the loaded fields for sending instead of expiring them on commit
+        db.expunge(email)
+    db.commit()
+    return batch
+
+def _record(db: Session, email_ids, **values):
+    db.execute(
+        update(models.EmailOutbox)
+        .where(models.EmailOutbox.id.in_(email_ids))
+        .values(locked_at=None, **values)
+        .execution_options(synchronize_session=False)
+    )
+    db.commit()
+
+def process_batch(db: Session, session, size: int = None):
+    """
+    Sends one batch of due emails, committing the outcome of each as soon
+    as it is known. Returns the number of emails that were attempted.
+    """
+    batch = claim_batch(db, size or settings.EMAIL_BATCH_SIZE)
+    for i, email in enumerate(batch):
+        try:
+            session.send(email)
+        except ConnectionFailed as e:
+            # Says nothing about the messages: put the rest of the batch back
+            # without using up attempts and wait for the server to come back
+            retry_at = datetime.now(timezone.utc) + timedelta(seconds=retry_delay(session.connect_failures))
+            _record(db, [m.id for m in batch[i:]], status=models.EmailStatus.PENDING, next_attempt_at=retry_at, last_error=str(e))
+            print(f"Email worker paused, {len(batch) - i} emails requeued: {e}")
+            return i
+        except Exception as e:
+            attempts = (email.attempts or 0) + 1
+            if is_permanent_error(e) or attempts >= settings.EMAIL_MAX_ATTEMPTS:
+                _record(db, [email.id], status=models.EmailStatus.DEAD, attempts=attempts, last_error=str(e))
+                print(f"Email {email.id} to {email.to_email} dead-lettered: {e}")
+            else:
+                retry_at = datetime.now(timezone.utc) + timedelta(seconds=retry_delay(attempts))
+                _record(db, [email.id], status=models.EmailStatus.PENDING, attempts=attempts, next_attempt_at=retry_at, last_error=str(e))
+            if not is_permanent_error(e):
+                # The connection may be in a bad state, start fresh for the next message
+                session.close()
+        else:
+            _record(db, [email.id], status=models.EmailStatus.SENT, attempts=(email.attempts or 0) + 1,
+                    sent_at=datetime.now(timezone.utc), last_error=None)
+    return len(batch)
+
+def run():
+    session = SMTPSession() if smtp_enabled() else ConsoleSession()
+    print(f"Email worker started ({'smtp' if smtp_enabled() else 'console'} backend)")
+    try:
+        while True:
+            db = SessionLocal()
+            try:
+                processed = process_batch(db, session)
+            finally:
+                db.close()
+            if not processed or getattr(session, "connect_failures", 0):
+                # Nothing due (the SMTP connection stays open for the next
+                # batch) or the server is unreachable
+                time.sleep(settings.EMAIL_POLL_INTERVAL)
+    except KeyboardInterrupt:
+        print("Email worker stopping")
+    finally:
+        session.close()
+
+if __name__ == "__main__":
+    run()
@@ -2,11 +2,13 @@ from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 from fastapi.responses import JSONResponse
-from .database import engine, Base
-from .routers import auth, jobs, applications, analytics, saved_jobs, seeker_profile, employer_profile, cv, interviews, notifications, settings
+from .utils.pagination import InvalidCursor
+from .utils.view_counter import view_buffer
+from .utils.notification_stream import notification_hub
+from .utils.password_hashing import HashingBusy, hashing_pool
+from .routers import auth, jobs, applications, analytics, saved_jobs, seeker_profile, employer_profile, cv, interviews, notifications, settings, metrics
 
-# Create tables
-Base.metadata.create_all(bind=engine)
+# The schema is managed by migrations, run `alembic upgrade head` before starting (see alembic.ini)
 
 app = FastAPI(
     title="AfriTalent API",
@@ -32,6 +34,25 @@ app.add_middleware(
     expose_headers=["*"],
 )
 
+@app.on_event("startup")
+def start_view_buffer():
+    view_buffer.start()
+
+@app.on_event("shutdown")
+def flush_view_buffer():
+    # Write out buffered job views before the worker exits
+    view_buffer.stop()
+    hashing_pool.shutdown()
+
+@app.on_event("startup")
+async def start_notification_hub():
+    # Async: the hub delivers to the SSE streams on this event loop
+    await notification_hub.start()
+
+@app.on_event("shutdown")
+async def stop_notification_hub():
+    await notification_hub.stop()
+
 # Custom exception handler to ensure CORS headers are sent on errors
 @app.exception_handler(Exception)
 async def global_exception_handler(request: Request, exc: Exception):
@@ -46,6 +67,30 @@ async def global_exception_handler(request: Request, exc: Exception):
         }
     )
 
+@app.exception_handler(HashingBusy)
+async def hashing_busy_handler(request: Request, exc: HashingBusy):
+    # Shed load instead of queueing unbounded argon2 work during login spikes
+    return JSONResponse(
+        status_code=429,
+        content={"detail": str(exc)},
+        headers={
+            "Retry-After": "1",
+            "Access-Control-Allow-Origin": "*",
+            "Access-Control-Allow-Credentials": "true",
+        }
+    )
+
+@app.exception_handler(InvalidCursor)
+async def invalid_cursor_handler(request: Request, exc: InvalidCursor):
+    return JSONResponse(
+        status_code=400,
+        content={"detail": str(exc)},
+        headers={
+            "Access-Control-Allow-Origin": "*",
+            "Access-Control-Allow-Credentials": "true",
+        }
+    )
+
 # Mount static files for uploads
 import os
 uploads_dir = os.path.join(os.path.dirname(__file__), "..", "uploads")
@@ -68,3 +113,4 @@ app.include_router(cv.router)
 app.include_router(interviews.router)
 app.include_router(notifications.router)
 app.include_router(settings.router)
+app.include_router(metrics.router)
@@ -1,9 +1,14 @@
-from sqlalchemy import Column, Integer, String, Text, Boolean, ForeignKey, DateTime, Enum, Float
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, Integer, String, Text, Boolean, ForeignKey, DateTime, Date, Enum, Float, UniqueConstraint, Index, text, false
+from sqlalchemy.orm import relationship, deferred
 from sqlalchemy.sql import func
 import enum
 from .database import Base
 
+# Large text bodies (CV HTML/JSON, job description/requirements) are in a
+# deferred "content" group: they are not selected when rows are loaded for
+# lists, joins or ownership checks, and are fetched on first access or
+# up front with undefer_group("content") where a detail view needs them.
+
 class UserRole(str, enum.Enum):
     SEEKER = "seeker"
     EMPLOYER = "employer"
@@ -37,11 +42,28 @@ class User(Base):
     seeker_profile = relationship("SeekerProfile", back_populates="user", uselist=False)
     employer_profile = relationship("EmployerProfile", back_populates="user", uselist=False)
 
+    # (seeker profile id, employer profile id) as known to the identity cache
+    # (utils/identity_cache.py), saving the profile lookup on authenticated requests
+    _profile_ids = (None, None)
+
+    @property
+    def seeker_profile_id(self):
+        # No cached id may just mean the profile was created since: load it then
+        if self._profile_ids[0] is not None:
+            return self._profile_ids[0]
+        return self.seeker_profile.id if self.seeker_profile else None
+
+    @property
+    def employer_profile_id(self):
+        if self._profile_ids[1] is not None:
+            return self._profile_ids[1]
+        return self.employer_profile.id if self.employer_profile else None
+
 class SeekerProfile(Base):
     __tablename__ = "seeker_profiles"
     
     id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(Integer, ForeignKey("users.id"))
+    user_id = Column(Integer, ForeignKey("users.id"), index=True)
     first_name = Column(String)
     last_name = Column(String)
     headline = Column(String)
@@ -49,7 +71,7 @@ class SeekerProfile(Base):
     location = Column(String)
     phone = Column(String)
     cv_url = Column(String)
-    cv_html = Column(Text) # Store generated CV HTML
+    cv_html = deferred(Column(Text), group="content") # Store generated CV HTML
     skills = Column(Text) # JSON or comma-separated string
     education = Column(Text) # JSON string
     experience = Column(Text) # JSON string
@@ -64,12 +86,24 @@ class SeekerProfile(Base):
     user = relationship("User", back_populates="seeker_profile")
     applications = relationship("Application", back_populates="seeker")
     cvs = relationship("CV", back_populates="seeker")
+    skill_index = relationship("SeekerSkill", back_populates="seeker", cascade="all, delete-orphan")
+
+class SeekerSkill(Base):
+    # Inverted index of SeekerProfile.skills used for job alert matching
+    __tablename__ = "seeker_skills"
+    __table_args__ = (UniqueConstraint("skill", "seeker_id", name="uq_seeker_skills_skill_seeker"),)
+    
+    id = Column(Integer, primary_key=True, index=True)
+    seeker_id = Column(Integer, ForeignKey("seeker_profiles.id", ondelete="CASCADE"), nullable=False, index=True)
+    skill = Column(String, nullable=False, index=True) # Normalized, see utils/skill_index.py
+    
+    seeker = relationship("SeekerProfile", back_populates="skill_index")
 
 class EmployerProfile(Base):
     __tablename__ = "employer_profiles"
     
     id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(Integer, ForeignKey("users.id"))
+    user_id = Column(Integer, ForeignKey("users.id"), index=True)
     first_name = Column(String)
     last_name = Column(String)
     phone = Column(String)
@@ -85,12 +119,17 @@ class EmployerProfile(Base):
 
 class Job(Base):
     __tablename__ = "jobs"
+    __table_args__ = (
+        Index("ix_jobs_employer_status", "employer_id", "status"), # Employer dashboards, my-jobs
+        Index("ix_jobs_created", "created_at", "id"), # Newest-first listing / keyset cursor
+        Index("ix_jobs_open_created", "created_at", "id", postgresql_where=text("status = 'open'"), sqlite_where=text("status = 'open'")), # Public job board (status=open)
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     employer_id = Column(Integer, ForeignKey("employer_profiles.id"))
     title = Column(String, index=True)
-    description = Column(Text)
-    requirements = Column(Text)
+    description = deferred(Column(Text), group="content")
+    requirements = deferred(Column(Text), group="content")
     location = Column(String)
     salary_range = Column(String) # For display text
     salary_min = Column(Integer, default=0) # For filtering
@@ -99,13 +138,29 @@ class Job(Base):
     experience_level = Column(String) # Entry Level, Mid Level, etc.
     status = Column(String, default=JobStatus.OPEN)
     views = Column(Integer, default=0)
+    applicants_count = Column(Integer, nullable=False, default=0, server_default="0") # Maintained by crud.create_application
     created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now()) # Last-Modified / ETag of GET /jobs/{id}; not bumped by view or applicant counts (they are in the ETag)
     
     employer = relationship("EmployerProfile", back_populates="jobs")
     applications = relationship("Application", back_populates="job")
 
+class ListingVersion(Base):
+    # Change counter of a public listing (name="jobs": GET /jobs/), bumped by
+    # crud.bump_listing_version whenever what the listing shows changes; the
+    # listing's ETag / Last-Modified come from here
+    __tablename__ = "listing_versions"
+    
+    name = Column(String, primary_key=True)
+    version = Column(Integer, nullable=False, default=0)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now())
+
 class Application(Base):
     __tablename__ = "applications"
+    __table_args__ = (
+        UniqueConstraint("seeker_id", "job_id", name="uq_applications_seeker_job"), # One application per job, also serves seeker_id lookups
+        Index("ix_applications_job_applied", "job_id", "applied_at"), # Employer applicant lists and dashboards join on job_id
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     job_id = Column(Integer, ForeignKey("jobs.id"))
@@ -122,9 +177,36 @@ class Application(Base):
     cv = relationship("CV")
     interviews = relationship("Interview", back_populates="application")
 
+# Ranked candidates per job (top-K by match score + keyset cursor), read in index order
+Index("ix_applications_job_score", Application.job_id, Application.match_score.desc(), Application.id.desc())
+
+class EmployerStats(Base):
+    # Running dashboard totals per employer, kept up to date by crud.bump_rollups
+    __tablename__ = "employer_stats"
+    
+    employer_id = Column(Integer, ForeignKey("employer_profiles.id", ondelete="CASCADE"), primary_key=True)
+    total_applicants = Column(Integer, nullable=False, default=0, server_default="0")
+    interviews = Column(Integer, nullable=False, default=0, server_default="0") # Applications currently INTERVIEWED
+    job_views = Column(Integer, nullable=False, default=0, server_default="0")
+
+class JobDailyStats(Base):
+    # Per job, per UTC day counters for the dashboard trend charts, kept up to date by crud.bump_rollups
+    __tablename__ = "job_daily_stats"
+    __table_args__ = (Index("ix_job_daily_stats_employer_day", "employer_id", "day"),)
+    
+    job_id = Column(Integer, ForeignKey("jobs.id", ondelete="CASCADE"), primary_key=True)
+    day = Column(Date, primary_key=True)
+    employer_id = Column(Integer, ForeignKey("employer_profiles.id", ondelete="CASCADE"), nullable=False) # Denormalized from jobs
+    applications = Column(Integer, nullable=False, default=0, server_default="0")
+    views = Column(Integer, nullable=False, default=0, server_default="0")
 
 class SavedJob(Base):
     __tablename__ = "saved_jobs"
+    __table_args__ = (
+        UniqueConstraint("seeker_id", "job_id", name="uq_saved_jobs_seeker_job"),
+        Index("ix_saved_jobs_seeker_created", "seeker_id", "created_at", "id"),
+        Index("ix_saved_jobs_job_id", "job_id"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     job_id = Column(Integer, ForeignKey("jobs.id"))
@@ -136,15 +218,18 @@ class SavedJob(Base):
 
 class CV(Base):
     __tablename__ = "cvs"
+    __table_args__ = (Index("ix_cvs_seeker_created", "seeker_id", "created_at"),)
     
     id = Column(Integer, primary_key=True, index=True)
     seeker_id = Column(Integer, ForeignKey("seeker_profiles.id"))
     title = Column(String) # e.g. "Software Engineer CV - v1"
-    content_html = Column(Text) # For builder CVs
-    content_json = Column(Text) # Store JSON state for builder
+    content_html = deferred(Column(Text), group="content") # For builder CVs
+    content_json = deferred(Column(Text), group="content") # Store JSON state for builder
     file_url = Column(String) # For uploaded PDFs
     is_uploaded = Column(Boolean, default=False)
     is_primary = Column(Boolean, default=False)
+    content_hash = Column(String(64)) # Hash of the inputs of features_json, see utils/cv_features.py
+    features_json = Column(Text) # Extracted skills / certifications / role hints
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     
     seeker = relationship("SeekerProfile", back_populates="cvs")
@@ -161,9 +246,13 @@ class InterviewStatus(str, enum.Enum):
 
 class Interview(Base):
     __tablename__ = "interviews"
+    __table_args__ = (
+        Index("ix_interviews_employer_start", "employer_id", "start_time"), # Calendar listing and overlap check
+        Index("ix_interviews_seeker_start", "seeker_id", "start_time"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
-    application_id = Column(Integer, ForeignKey("applications.id"))
+    application_id = Column(Integer, ForeignKey("applications.id"), index=True)
     employer_id = Column(Integer, ForeignKey("employer_profiles.id"))
     seeker_id = Column(Integer, ForeignKey("seeker_profiles.id"))
     title = Column(String)
@@ -182,6 +271,8 @@ class Interview(Base):
 
 class Notification(Base):
     __tablename__ = "notifications"
+    # B-tree indexes are read backwards just as fast, so this also serves "newest first"
+    __table_args__ = (Index("ix_notifications_user_created", "user_id", "created_at", "id"),)
     
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"))
@@ -192,11 +283,19 @@ class Notification(Base):
     
     user = relationship("User")
 
+# Partial index over the unread rows only: the unread badge count reads a
+# handful of entries per user however long their read history gets
+Index(
+    "ix_notifications_user_unread", Notification.user_id,
+    postgresql_where=Notification.is_read == false(),
+    sqlite_where=Notification.is_read == false(),
+)
+
 class InterviewHistory(Base):
     __tablename__ = "interview_history"
     
     id = Column(Integer, primary_key=True, index=True)
-    interview_id = Column(Integer, ForeignKey("interviews.id"))
+    interview_id = Column(Integer, ForeignKey("interviews.id"), index=True)
     user_id = Column(Integer, ForeignKey("users.id"))
     message = Column(Text)
     status_at_time = Column(String)
@@ -205,6 +304,52 @@ class InterviewHistory(Base):
     interview = relationship("Interview", back_populates="history")
     user = relationship("User")
 
+class EmailStatus(str, enum.Enum):
+    PENDING = "pending"
+    SENDING = "sending" # Claimed by a worker; picked up again once its lease expires
+    SENT = "sent"
+    DEAD = "dead" # Gave up after EMAIL_MAX_ATTEMPTS or a permanent SMTP error
+
+class EmailOutbox(Base):
+    # Emails waiting to be delivered by the email worker (app/email_worker.py)
+    __tablename__ = "email_outbox"
+    
+    id = Column(Integer, primary_key=True, index=True)
+    to_email = Column(String, nullable=False)
+    subject = Column(String)
+    body_html = Column(Text)
+    reply_to = Column(String)
+    from_name = Column(String)
+    status = Column(String, default=EmailStatus.PENDING, index=True)
+    attempts = Column(Integer, default=0)
+    next_attempt_at = Column(DateTime(timezone=True), server_default=func.now(), index=True)
+    last_error = Column(Text)
+    locked_at = Column(DateTime(timezone=True)) # When a worker claimed it (status sending)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    sent_at = Column(DateTime(timezone=True))
+
+class TaskStatus(str, enum.Enum):
+    PENDING = "pending"
+    RUNNING = "running"
+    DONE = "done"
+    DEAD = "dead" # Gave up after TASK_MAX_ATTEMPTS
+
+class Task(Base):
+    # Background work queued by the API and run by the task worker (app/task_worker.py)
+    __tablename__ = "task_queue"
+    __table_args__ = (Index("ix_task_queue_due", "status", "next_attempt_at"),)
+    
+    id = Column(Integer, primary_key=True, index=True)
+    name = Column(String, nullable=False) # Registered handler, see utils/task_queue.py
+    payload = Column(Text) # JSON keyword arguments
+    status = Column(String, nullable=False, default=TaskStatus.PENDING)
+    attempts = Column(Integer, nullable=False, default=0)
+    next_attempt_at = Column(DateTime(timezone=True), server_default=func.now())
+    locked_at = Column(DateTime(timezone=True)) # When a worker claimed it; expired leases are picked up again
+    last_error = Column(Text)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    finished_at = Column(DateTime(timezone=True))
+
 class UserSettings(Base):
     __tablename__ = "user_settings"
     
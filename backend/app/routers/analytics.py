@@ -3,70 +3,7 @@ from sqlalchemy.orm import Session
 from .. import crud, models, schemas
 from ..database import get_db
 from .auth import get_current_user
-import re
-
-def extract_skills_from_text(text: str):
-    if not text:
-        return []
-    
-    # Comprehensive skill keywords across multiple domains
-    skill_keywords = [
-        # Tech & Development
-        "python", "javascript", "typescript", "react", "node.js", "next.js", 
-        "html", "css", "tailwind", "sql", "postgresql", "mongodb", 
-        "docker", "kubernetes", "aws", "azure", "google cloud", "ci/cd",
-        "git", "java", "c++", "go", "rust", "flutter", "react native",
-        # Design & Creative
-        "figma", "ui/ux", "adobe xd", "photoshop", "illustrator", "branding", 
-        "graphic design", "product design", "user research", "prototyping",
-        # Marketing & Growth
-        "marketing", "digital marketing", "seo", "sem", "content writing", 
-        "copywriting", "social media", "email marketing", "google analytics",
-        "growth hacking", "public relations", "advertising",
-        # Business & Management
-        "agile", "scrum", "project management", "product management", "leadership",
-        "strategy", "business development", "sales", "crm", "operations",
-        "stakeholder management", "strategic planning", "financial analysis",
-        # Data & AI
-        "analytics", "data science", "machine learning", "tensorflow", "pytorch", 
-        "pandas", "numpy", "powerbi", "tableau", "big data", "r", "nlp",
-        # HR & Professional
-        "recruitment", "human resources", "talent acquisition", "training",
-        "coaching", "soft skills", "communication", "negotiation", "customer success"
-    ]
-    
-    found_skills = []
-    text_lower = text.lower()
-    
-    for skill in skill_keywords:
-        pattern = r'\b' + re.escape(skill) + r'\b'
-        if re.search(pattern, text_lower):
-            found_skills.append(skill)
-            
-    return found_skills
-
-def extract_certifications(text: str):
-    if not text:
-        return []
-    
-    # Look for common certification markers
-    cert_patterns = [
-        r'certified\s+[\w\s]+',
-        r'[\w\s]+\s+certification',
-        r'[\w\s]+\s+certified',
-        r'aws\s+[\w\s]+',
-        r'google\s+[\w\s]+\s+certified',
-        r'microsoft\s+[\w\s]+'
-    ]
-    
-    certs = []
-    text_lower = text.lower()
-    for pattern in cert_patterns:
-        matches = re.finditer(pattern, text_lower)
-        for match in matches:
-            certs.append(match.group().title())
-            
-    return list(set(certs))[:5] # Limit to top 5
+from ..utils.cv_features import role_flags
 
 router = APIRouter(prefix="/analytics", tags=["analytics"])
 
@@ -75,11 +12,11 @@ def get_seeker_analytics(db: Session = Depends(get_db), current_user: models.Use
     if current_user.role != models.UserRole.SEEKER:
         raise HTTPException(status_code=403, detail="Only seekers can access this data")
     
-    if not current_user.seeker_profile:
+    if current_user.seeker_profile_id is None:
          raise HTTPException(status_code=400, detail="Profile required")
 
     # Real data
-    applications = crud.get_applications_by_seeker(db, seeker_id=current_user.seeker_profile.id)
+    applications = crud.get_applications_by_seeker(db, seeker_id=current_user.seeker_profile_id)
     applications_count = len(applications)
 
     # Mixed/Mock data for other metrics not yet fully implemented
@@ -91,7 +28,7 @@ def get_seeker_analytics(db: Session = Depends(get_db), current_user: models.Use
     profile_views = 145 + random.randint(0, 5) # Slight variation to show liveliness
     
     # Real data for saved jobs
-    saved_jobs = crud.get_saved_jobs_by_seeker(db, seeker_id=current_user.seeker_profile.id)
+    saved_jobs = crud.get_saved_jobs_by_seeker(db, seeker_id=current_user.seeker_profile_id)
     saved_jobs_count = len(saved_jobs)
     
     return {
@@ -106,7 +43,7 @@ def get_skills_analytics(db: Session = Depends(get_db), current_user: models.Use
     if current_user.role != models.UserRole.SEEKER:
         raise HTTPException(status_code=403, detail="Only seekers can access this data")
     
-    if not current_user.seeker_profile:
+    if current_user.seeker_profile_id is None:
          raise HTTPException(status_code=400, detail="Profile required")
 
     seeker_profile = current_user.seeker_profile
@@ -115,25 +52,13 @@ def get_skills_analytics(db: Session = Depends(get_db), current_user: models.Use
     user_skills_raw = seeker_profile.skills or ""
     user_skills = set([s.strip().lower() for s in user_skills_raw.split(',') if s.strip()])
     
-    # Try to extract more skills from the Primary (Starred) CV
+    # Add the skills found in the Primary (Starred) CV, precomputed when the CV was saved
     primary_cv = crud.get_primary_cv(db, seeker_id=seeker_profile.id)
-    if primary_cv:
-        if primary_cv.content_html:
-            cv_skills = extract_skills_from_text(primary_cv.content_html)
-            user_skills.update(cv_skills)
-        elif primary_cv.title:
-            cv_skills = extract_skills_from_text(primary_cv.title)
-            user_skills.update(cv_skills)
-    else:
-        # Fallback to latest CV if no primary is set (optional, but keeps data from vanishing)
-        latest_cv = crud.get_latest_cv(db, seeker_id=seeker_profile.id)
-        if latest_cv:
-            if latest_cv.content_html:
-                cv_skills = extract_skills_from_text(latest_cv.content_html)
-                user_skills.update(cv_skills)
-            elif latest_cv.title:
-                cv_skills = extract_skills_from_text(latest_cv.title)
-                user_skills.update(cv_skills)
+    # Fallback to latest CV if no primary is set (optional, but keeps data from vanishing)
+    source_cv = primary_cv or crud.get_latest_cv(db, seeker_id=seeker_profile.id)
+    cv_features = crud.get_cv_features(db, source_cv) if source_cv else None
+    if cv_features:
+        user_skills.update(cv_features["skills"])
             
     user_skills = list(user_skills)
     
@@ -200,8 +125,8 @@ def get_skills_analytics(db: Session = Depends(get_db), current_user: models.Use
     
     # Extract certifications from primary CV
     certs_found = []
-    if primary_cv and primary_cv.content_html:
-        certs_found = extract_certifications(primary_cv.content_html)
+    if primary_cv:
+        certs_found = cv_features["certifications"]
     
     # Determine dominant category for trends
     dominant_cat = "Tech"
@@ -310,7 +235,7 @@ def get_career_guidance(db: Session = Depends(get_db), current_user: models.User
     if current_user.role != models.UserRole.SEEKER:
         raise HTTPException(status_code=403, detail="Only seekers can access this data")
     
-    if not current_user.seeker_profile:
+    if current_user.seeker_profile_id is None:
          raise HTTPException(status_code=400, detail="Profile required")
 
     seeker_profile = current_user.seeker_profile
@@ -320,29 +245,25 @@ def get_career_guidance(db: Session = Depends(get_db), current_user: models.User
     # Get user skills from profile + CV
     user_skills = set([s.strip().lower() for s in profile_skills.split(',') if s.strip()])
     
-    cv_content = ""
     cv_title = ""
+    cv_roles = {}
     # Prioritize Starred CV for career insights
     primary_cv = crud.get_primary_cv(db, seeker_id=seeker_profile.id)
     target_cv = primary_cv or crud.get_latest_cv(db, seeker_id=seeker_profile.id)
     
     if target_cv:
         cv_title = target_cv.title.lower() if target_cv.title else ""
-        if target_cv.content_html:
-            cv_content = target_cv.content_html.lower()
-            cv_skills = extract_skills_from_text(cv_content)
-            user_skills.update(cv_skills)
-        elif cv_title:
-             cv_skills = extract_skills_from_text(cv_title)
-             user_skills.update(cv_skills)
-             
-    all_content = f"{headline} {' '.join(user_skills)} {cv_title} {cv_content}"
+        # Skills and role hints in the CV text were extracted when the CV was saved
+        cv_features = crud.get_cv_features(db, target_cv)
+        user_skills.update(cv_features["skills"])
+        cv_roles = cv_features["roles"]
     
     # Enhanced Role Detection
-    is_tech = any(x in all_content for x in ["software", "developer", "engineer", "react", "python", "tech", "coding", "web developer"])
-    is_marketing = any(x in all_content for x in ["marketing", "social", "seo", "content", "copywriting", "digital marketing"])
-    is_design = any(x in all_content for x in ["design", "ui/ux", "figma", "graphic", "product design"])
-    is_data = any(x in all_content for x in ["data", "analytics", "data science", "machine learning", "tensorflow", "sql"])
+    roles = role_flags(f"{headline} {' '.join(user_skills)} {cv_title}")
+    is_tech = roles["tech"] or cv_roles.get("tech", False)
+    is_marketing = roles["marketing"] or cv_roles.get("marketing", False)
+    is_design = roles["design"] or cv_roles.get("design", False)
+    is_data = roles["data"] or cv_roles.get("data", False)
     
     # Default is Tech if undeterminable
     base_role = "Professional"
@@ -618,7 +539,7 @@ def get_employer_analytics(db: Session = Depends(get_db), current_user: models.U
         raise HTTPException(status_code=403, detail="Only employers can access this data")
     
     # Lazy initialization: Create profile if it doesn't exist
-    if not current_user.employer_profile:
+    if current_user.employer_profile_id is None:
         employer_profile = models.EmployerProfile(user_id=current_user.id)
         db.add(employer_profile)
         db.commit()
@@ -626,16 +547,4 @@ def get_employer_analytics(db: Session = Depends(get_db), current_user: models.U
         # Update current_user in session to reflect the new profile
         db.refresh(current_user)
     
-    employer_id = current_user.employer_profile.id
-    active_jobs, total_applicants, interviews, job_views = crud.get_employer_metrics(db, employer_id)
-    recent_applicants = crud.get_recent_applicants(db, employer_id)
-    application_trends = crud.get_application_trends(db, employer_id)
-    
-    return {
-        "active_jobs": active_jobs,
-        "total_applicants": total_applicants,
-        "interviews": interviews,
-        "job_views": job_views,
-        "application_trends": application_trends,
-        "recent_applicants": recent_applicants
-    }
+    return crud.get_employer_dashboard(db, current_user.employer_profile_id)
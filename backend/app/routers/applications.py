@@ -1,10 +1,11 @@
-from fastapi import APIRouter, Depends, HTTPException, status, BackgroundTasks
+from fastapi import APIRouter, Depends, HTTPException, status, BackgroundTasks, Query, Response
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional
 from .. import crud, models, schemas
 from ..database import get_db
 from .auth import get_current_user
 from ..utils.email_utils import send_application_status_alert, send_new_applicant_alert
+from ..utils.pagination import NEXT_CURSOR_HEADER, next_cursor
 
 router = APIRouter(prefix="/applications", tags=["applications"])
 
@@ -18,15 +19,15 @@ def apply_for_job(
     if current_user.role != models.UserRole.SEEKER:
         raise HTTPException(status_code=403, detail="Only seekers can apply for jobs")
         
-    if not current_user.seeker_profile:
+    if current_user.seeker_profile_id is None:
         raise HTTPException(status_code=400, detail="Seeker profile required. Please complete your profile first.")
 
     # Check if already applied
-    existing_application = crud.get_application_by_seeker_and_job(db, seeker_id=current_user.seeker_profile.id, job_id=application.job_id)
+    existing_application = crud.get_application_by_seeker_and_job(db, seeker_id=current_user.seeker_profile_id, job_id=application.job_id)
     if existing_application:
         raise HTTPException(status_code=400, detail="You have already applied for this job")
 
-    db_application = crud.create_application(db=db, application=application, seeker_id=current_user.seeker_profile.id)
+    db_application = crud.create_application(db=db, application=application, seeker_id=current_user.seeker_profile_id)
     
     # Notify Employer (Email)
     job = db_application.job
@@ -39,7 +40,7 @@ def apply_for_job(
             to_email=employer_user.email,
             job_title=job.title,
             applicant_name=f"{current_user.seeker_profile.first_name} {current_user.seeker_profile.last_name}",
-            applicant_id=current_user.seeker_profile.id
+            applicant_id=current_user.seeker_profile_id
         )
 
     return db_application
@@ -49,17 +50,55 @@ def read_my_applications(db: Session = Depends(get_db), current_user: models.Use
     if current_user.role != models.UserRole.SEEKER:
         raise HTTPException(status_code=403, detail="Only seekers can view their applications")
     
-    if not current_user.seeker_profile:
+    if current_user.seeker_profile_id is None:
         raise HTTPException(status_code=400, detail="Seeker profile required to view applications.")
         
-    return crud.get_applications_by_seeker(db, seeker_id=current_user.seeker_profile.id)
+    return crud.get_applications_by_seeker(db, seeker_id=current_user.seeker_profile_id)
 
 @router.get("/employer", response_model=List[schemas.ApplicationResponse])
-def read_employer_applications(job_id: int = None, status: str = None, db: Session = Depends(get_db), current_user: models.User = Depends(get_current_user)):
-    if current_user.role != models.UserRole.EMPLOYER or not current_user.employer_profile:
+def read_employer_applications(
+    response: Response,
+    job_id: int = None,
+    status: str = None,
+    limit: Optional[int] = Query(None, ge=1, le=100),
+    cursor: Optional[str] = None,
+    db: Session = Depends(get_db),
+    current_user: models.User = Depends(get_current_user)
+):
+    if current_user.role != models.UserRole.EMPLOYER or current_user.employer_profile_id is None:
+        raise HTTPException(status_code=403, detail="Only employers can view applications")
+    
+    applications = crud.get_employer_applications(db, employer_id=current_user.employer_profile_id, job_id=job_id, status=status, limit=limit, cursor=cursor)
+    cursor_value = next_cursor(applications, limit, "applied_at")
+    if cursor_value:
+        response.headers[NEXT_CURSOR_HEADER] = cursor_value
+    return applications
+
+@router.get("/employer/jobs/{job_id}/candidates", response_model=List[schemas.RankedCandidate])
+def read_ranked_candidates(
+    job_id: int,
+    response: Response,
+    status: Optional[models.ApplicationStatus] = None,
+    limit: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = None,
+    db: Session = Depends(get_db),
+    current_user: models.User = Depends(get_current_user)
+):
+    if current_user.role != models.UserRole.EMPLOYER or current_user.employer_profile_id is None:
         raise HTTPException(status_code=403, detail="Only employers can view applications")
     
-    return crud.get_employer_applications(db, employer_id=current_user.employer_profile.id, job_id=job_id, status=status)
+    job = crud.get_job(db, job_id=job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+    if job.employer_id != current_user.employer_profile_id:
+        raise HTTPException(status_code=403, detail="Not authorized to view this job's applicants")
+    
+    # Top `limit` applicants by match score; X-Next-Cursor fetches the next `limit`
+    candidates = crud.get_ranked_candidates(db, job_id=job_id, status=status, limit=limit, cursor=cursor)
+    cursor_value = next_cursor(candidates, limit, "match_score")
+    if cursor_value:
+        response.headers[NEXT_CURSOR_HEADER] = cursor_value
+    return candidates
 
 @router.patch("/{application_id}/status", response_model=schemas.ApplicationResponse)
 def update_app_status(
@@ -2,9 +2,11 @@ from datetime import datetime, timedelta
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer, OAuth2PasswordRequestForm
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from .. import crud, models, schemas
-from ..database import get_db
+from ..database import get_db, get_async_db
 from ..config import settings
+from ..utils.identity_cache import identity_cache, snapshot_user, attach_user
 from jose import JWTError, jwt
 
 router = APIRouter(prefix="/auth", tags=["auth"])
@@ -21,7 +23,14 @@ def create_access_token(data: dict, expires_delta: timedelta | None = None):
     encoded_jwt = jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
     return encoded_jwt
 
-async def get_current_user(token: str = Depends(oauth2_scheme), db: Session = Depends(get_db)):
+async def get_current_user(
+    token: str = Depends(oauth2_scheme),
+    db: Session = Depends(get_db),
+    async_db: AsyncSession = Depends(get_async_db)
+):
+    # Runs on the event loop: the lookup goes through the cache or the async
+    # session, and the user is then attached to the request's sync session
+    # (merge with load=False does no I/O) for the endpoint to use.
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
@@ -34,10 +43,21 @@ async def get_current_user(token: str = Depends(oauth2_scheme), db: Session = De
             raise credentials_exception
     except JWTError:
         raise credentials_exception
-    user = crud.get_user_by_email(db, email=email)
-    if user is None:
+    user = identity_cache.get(db, email)
+    if user is not None:
+        return user
+    try:
+        identity = await crud.get_identity_async(async_db, email=email)
+    finally:
+        # Ends the transaction and hands the connection back to the pool now
+        # rather than when the request finishes (the dependency's teardown)
+        await async_db.close()
+    if identity is None:
         raise credentials_exception
-    return user
+    user, *profile_ids = identity
+    snapshot = snapshot_user(user)
+    identity_cache.put(email, snapshot, profile_ids)
+    return attach_user(db, snapshot, profile_ids)
 
 @router.post("/register", response_model=schemas.UserResponse)
 def register(user: schemas.UserCreate, db: Session = Depends(get_db)):
@@ -49,12 +69,18 @@ def register(user: schemas.UserCreate, db: Session = Depends(get_db)):
 @router.post("/token")
 def login_for_access_token(form_data: OAuth2PasswordRequestForm = Depends(), db: Session = Depends(get_db)):
     user = crud.get_user_by_email(db, email=form_data.username)
-    if not user or not crud.verify_password(form_data.password, user.hashed_password):
+    verified, new_hash = crud.verify_and_update_password(form_data.password, user.hashed_password) if user else (False, None)
+    if not verified:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect username or password",
             headers={"WWW-Authenticate": "Bearer"},
         )
+    if new_hash:
+        # Stored hash used outdated argon2 parameters, upgrade it transparently
+        user.hashed_password = new_hash
+        db.commit()
+        identity_cache.invalidate(user.email)
     access_token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
     access_token = create_access_token(
         data={"sub": user.email, "role": user.role}, expires_delta=access_token_expires
@@ -19,12 +19,12 @@ def create_cv(
     if current_user.role != models.UserRole.SEEKER:
         raise HTTPException(status_code=403, detail="Only seekers can create CVs")
     
-    if not current_user.seeker_profile:
+    if current_user.seeker_profile_id is None:
         raise HTTPException(status_code=400, detail="Profile required")
         
-    return crud.create_cv(db, cv, current_user.seeker_profile.id)
+    return crud.create_cv(db, cv, current_user.seeker_profile_id)
 
-@router.get("/", response_model=List[schemas.CVResponse])
+@router.get("/", response_model=List[schemas.CVSummary])
 def get_cvs(
     db: Session = Depends(get_db),
     current_user: models.User = Depends(get_current_user)
@@ -32,10 +32,10 @@ def get_cvs(
     if current_user.role != models.UserRole.SEEKER:
         raise HTTPException(status_code=403, detail="Only seekers can access their CVs")
     
-    if not current_user.seeker_profile:
+    if current_user.seeker_profile_id is None:
         return []
         
-    return crud.get_cvs(db, current_user.seeker_profile.id)
+    return crud.get_cvs(db, current_user.seeker_profile_id)
 
 @router.post("/upload", response_model=schemas.CVResponse)
 async def upload_cv(
@@ -47,7 +47,7 @@ async def upload_cv(
     if current_user.role != models.UserRole.SEEKER:
         raise HTTPException(status_code=403, detail="Only seekers can upload CVs")
         
-    if not current_user.seeker_profile:
+    if current_user.seeker_profile_id is None:
         raise HTTPException(status_code=400, detail="Profile required")
     
     # Save file
@@ -70,7 +70,7 @@ async def upload_cv(
         content_html=None
     )
     
-    return crud.create_cv(db, cv_data, current_user.seeker_profile.id)
+    return crud.create_cv(db, cv_data, current_user.seeker_profile_id)
     
 @router.get("/{cv_id}", response_model=schemas.CVBase) # Using Base to include content/url
 def get_cv(
@@ -78,19 +78,21 @@ def get_cv(
     db: Session = Depends(get_db),
     current_user: models.User = Depends(get_current_user)
 ):
-    cv = crud.get_cv(db, cv_id)
+    cv = crud.get_cv(db, cv_id, with_content=True)
     if not cv:
         raise HTTPException(status_code=404, detail="CV not found")
         
     # Check ownership
     if current_user.role == models.UserRole.SEEKER:
-         if not current_user.seeker_profile or cv.seeker_id != current_user.seeker_profile.id:
+         if current_user.seeker_profile_id is None or cv.seeker_id != current_user.seeker_profile_id:
              raise HTTPException(status_code=403, detail="Not authorized")
     
     # Employers - simplistic check for now
     if current_user.role == models.UserRole.EMPLOYER:
         # TODO: verify application exists
         pass
+    
+    return cv
 
 from fastapi.responses import HTMLResponse, RedirectResponse
 
@@ -103,7 +105,7 @@ def delete_cv(
     cv = crud.get_cv(db, cv_id)
     if not cv:
         raise HTTPException(status_code=404, detail="CV not found")
-    if cv.seeker_id != current_user.seeker_profile.id:
+    if cv.seeker_id != current_user.seeker_profile_id:
         raise HTTPException(status_code=403, detail="Not authorized")
     
     # Also delete physical file if uploaded? 
@@ -120,7 +122,7 @@ def update_cv(
     cv = crud.get_cv(db, cv_id)
     if not cv:
         raise HTTPException(status_code=404, detail="CV not found")
-    if cv.seeker_id != current_user.seeker_profile.id:
+    if cv.seeker_id != current_user.seeker_profile_id:
         raise HTTPException(status_code=403, detail="Not authorized")
     
     return crud.update_cv(db, cv_id, cv_update.dict(exclude_unset=True))
@@ -134,17 +136,17 @@ def set_primary_cv(
     cv = crud.get_cv(db, cv_id)
     if not cv:
         raise HTTPException(status_code=404, detail="CV not found")
-    if cv.seeker_id != current_user.seeker_profile.id:
+    if cv.seeker_id != current_user.seeker_profile_id:
         raise HTTPException(status_code=403, detail="Not authorized")
     
-    return crud.set_primary_cv(db, current_user.seeker_profile.id, cv_id)
+    return crud.set_primary_cv(db, current_user.seeker_profile_id, cv_id)
 
 @router.get("/{cv_id}/view", response_class=HTMLResponse)
 def view_cv_html(
     cv_id: int,
     db: Session = Depends(get_db)
 ):
-    cv = crud.get_cv(db, cv_id)
+    cv = crud.get_cv(db, cv_id, with_content=True)
     if not cv:
         return HTMLResponse(content="<h1>CV not found</h1>", status_code=404)
         
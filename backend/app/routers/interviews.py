@@ -23,18 +23,18 @@ def schedule_interview(
     if not application:
         raise HTTPException(status_code=404, detail="Application not found")
     
-    if application.job.employer_id != current_user.employer_profile.id:
+    if application.job.employer_id != current_user.employer_profile_id:
         raise HTTPException(status_code=403, detail="Not authorized for this application")
     
     # Check for overlap
-    overlap = crud.check_interview_overlap(db, current_user.employer_profile.id, interview.start_time, interview.end_time)
+    overlap = crud.check_interview_overlap(db, current_user.employer_profile_id, interview.start_time, interview.end_time)
     if overlap:
         raise HTTPException(
             status_code=400, 
             detail=f"Interview overlap detected with '{overlap.title}' ({overlap.start_time.strftime('%H:%M')} - {overlap.end_time.strftime('%H:%M')})"
         )
 
-    db_interview = crud.create_interview(db, interview, current_user.employer_profile.id, application.seeker_id)
+    db_interview = crud.create_interview(db, interview, current_user.employer_profile_id, application.seeker_id)
     
     # Notify Seeker (In-app)
     crud.create_notification(
@@ -65,13 +65,13 @@ def get_my_interviews(
     current_user: models.User = Depends(get_current_user)
 ):
     if current_user.role == models.UserRole.EMPLOYER:
-        if not current_user.employer_profile:
+        if current_user.employer_profile_id is None:
             return []
-        return crud.get_interviews_for_employer(db, current_user.employer_profile.id)
+        return crud.get_interviews_for_employer(db, current_user.employer_profile_id)
     else:
-        if not current_user.seeker_profile:
+        if current_user.seeker_profile_id is None:
             return []
-        return crud.get_interviews_for_seeker(db, current_user.seeker_profile.id)
+        return crud.get_interviews_for_seeker(db, current_user.seeker_profile_id)
 
 @router.put("/{interview_id}/respond", response_model=schemas.InterviewResponse)
 def respond_to_invite(
@@ -88,7 +88,7 @@ def respond_to_invite(
     if status not in [models.InterviewStatus.ACCEPTED, models.InterviewStatus.DECLINED, models.InterviewStatus.RESCHEDULE_REQUESTED]:
         raise HTTPException(status_code=400, detail="Invalid status. Use 'accepted', 'declined', or 'reschedule_requested'.")
         
-    updated = crud.respond_to_interview(db, interview_id, status, current_user.seeker_profile.id, notes)
+    updated = crud.respond_to_interview(db, interview_id, status, current_user.seeker_profile_id, notes)
     if not updated:
         raise HTTPException(status_code=404, detail="Interview invite not found")
     
@@ -119,7 +119,7 @@ def update_interview(
     if current_user.role != models.UserRole.EMPLOYER:
         raise HTTPException(status_code=403, detail="Only employers can update interviews")
     
-    updated = crud.update_interview(db, interview_id, interview_update.dict(exclude_unset=True), current_user.employer_profile.id)
+    updated = crud.update_interview(db, interview_id, interview_update.dict(exclude_unset=True), current_user.employer_profile_id)
     if not updated:
         raise HTTPException(status_code=404, detail="Interview not found")
     
@@ -147,7 +147,7 @@ def delete_interview(
     if current_user.role != models.UserRole.EMPLOYER:
         raise HTTPException(status_code=403, detail="Only employers can delete interviews")
     
-    deleted = crud.delete_interview(db, interview_id, current_user.employer_profile.id)
+    deleted = crud.delete_interview(db, interview_id, current_user.employer_profile_id)
     if not deleted:
         raise HTTPException(status_code=404, detail="Interview not found")
     
@@ -1,15 +1,21 @@
 from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException, status, BackgroundTasks
+from fastapi import APIRouter, Depends, HTTPException, status, Request, Response
 from sqlalchemy.orm import Session
 from .. import crud, models, schemas
 from ..database import get_db
 from .auth import get_current_user
-from ..utils.notification_logic import trigger_job_alerts
+from ..utils.rescoring import SCORED_JOB_FIELDS
+from ..utils.pagination import NEXT_CURSOR_HEADER, next_cursor
+from ..utils.view_counter import view_buffer, viewer_id
+from ..utils.http_cache import make_etag, is_not_modified, not_modified, set_cache_headers
+from ..config import settings
 
 router = APIRouter(prefix="/jobs", tags=["jobs"])
 
 @router.get("/", response_model=List[schemas.JobResponse])
 def read_jobs(
+    request: Request,
+    response: Response,
     skip: int = 0, 
     limit: int = 100, 
     search: Optional[str] = None, 
@@ -17,21 +23,39 @@ def read_jobs(
     job_type: Optional[str] = None,
     experience_level: Optional[str] = None,
     salary_min: Optional[int] = None,
+    rank: bool = False,
+    highlight: bool = False,
+    cursor: Optional[str] = None,
+    status: Optional[models.JobStatus] = None,
     db: Session = Depends(get_db)
 ):
-    jobs = crud.get_jobs(db, skip=skip, limit=limit, search=search, location=location, job_type=job_type, experience_level=experience_level, salary_min=salary_min)
+    # Any change to a listed job bumps the listing version, so one small
+    # lookup tells whether the client's (or CDN's) copy is still current
+    version, last_modified = crud.get_listing_version(db)
+    etag = make_etag("jobs", version)
+    cache_control = f"public, max-age={settings.JOB_LIST_MAX_AGE_SECONDS}"
+    if is_not_modified(request, etag, last_modified):
+        return not_modified(etag, last_modified, cache_control)
+    set_cache_headers(response, etag, last_modified, cache_control)
+    
+    jobs = crud.get_jobs(db, skip=skip, limit=limit, search=search, location=location, job_type=job_type, experience_level=experience_level, salary_min=salary_min, rank=rank, highlight=highlight, cursor=cursor, status=status)
+    
+    # Search results are relevance-ordered, so only plain listings can be continued with a cursor
+    if not search:
+        cursor_value = next_cursor(jobs, limit, "created_at")
+        if cursor_value:
+            response.headers[NEXT_CURSOR_HEADER] = cursor_value
     return jobs
 
 @router.get("/my-jobs", response_model=List[schemas.JobResponse])
 def read_my_jobs(db: Session = Depends(get_db), current_user: models.User = Depends(get_current_user)):
-    if current_user.role != models.UserRole.EMPLOYER or not current_user.employer_profile:
+    if current_user.role != models.UserRole.EMPLOYER or current_user.employer_profile_id is None:
         raise HTTPException(status_code=403, detail="Only employers can view their jobs")
-    return crud.get_employer_jobs(db, employer_id=current_user.employer_profile.id)
+    return crud.get_employer_jobs(db, employer_id=current_user.employer_profile_id)
 
 @router.post("/", response_model=schemas.JobResponse)
 def create_job(
     job: schemas.JobCreate, 
-    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db), 
     current_user: models.User = Depends(get_current_user)
 ):
@@ -39,34 +63,41 @@ def create_job(
         raise HTTPException(status_code=403, detail="Only employers can post jobs")
     
     # Ensure employer profile exists
-    if not current_user.employer_profile:
+    if current_user.employer_profile_id is None:
         employer_profile = models.EmployerProfile(user_id=current_user.id)
         db.add(employer_profile)
         db.commit()
         db.refresh(employer_profile)
         db.refresh(current_user)
     
-    db_job = crud.create_job(db=db, job=job, employer_id=current_user.employer_profile.id)
-    
-    # Trigger background notifications
-    background_tasks.add_task(trigger_job_alerts, db, db_job.id)
+    # Also queues the job alerts (task worker) in the same transaction
+    db_job = crud.create_job(db=db, job=job, employer_id=current_user.employer_profile_id)
     
     return db_job
 
 @router.get("/{job_id}", response_model=schemas.JobResponse)
-def read_job(job_id: int, background_tasks: BackgroundTasks, db: Session = Depends(get_db)):
-    db_job = crud.get_job(db, job_id=job_id)
-    if db_job is None:
+def read_job(job_id: int, request: Request, response: Response, db: Session = Depends(get_db)):
+    validators = crud.get_job_validators(db, job_id)
+    if validators is None:
         raise HTTPException(status_code=404, detail="Job not found")
+    last_modified, views, applicants_count = validators
     
-    # Increment view count in background
-    background_tasks.add_task(crud.increment_job_view, db, job_id)
+    # Count the view in the in-process buffer; it is written in batches
+    view_buffer.record(job_id, viewer=viewer_id(request))
     
-    # Refresh model to get current views (even if slightly behind, it's fine for the immediate return)
-    # or just return the current cached value.
+    # no-cache: caches keep the body but revalidate every time, so views
+    # are still counted here and an unchanged job costs a 304. The counts are
+    # part of the ETag; updated_at doesn't move with them, so If-Modified-Since
+    # alone is not enough to answer 304.
+    etag = make_etag("job", job_id, last_modified.isoformat(), views or 0, applicants_count or 0)
+    cache_control = "public, no-cache"
+    if is_not_modified(request, etag):
+        return not_modified(etag, last_modified, cache_control)
+    set_cache_headers(response, etag, last_modified, cache_control)
     
-    # Attach applicant count for response consistency
-    db_job.applicants_count = len(db_job.applications)
+    db_job = crud.get_job(db, job_id=job_id, with_content=True)
+    
+    # The returned view count leaves out views not flushed yet, that's fine for display
     
     return db_job
 
@@ -75,17 +106,22 @@ def update_job(job_id: int, job_update: schemas.JobBase, db: Session = Depends(g
     db_job = crud.get_job(db, job_id=job_id)
     if not db_job:
         raise HTTPException(status_code=404, detail="Job not found")
-    if db_job.employer_id != current_user.employer_profile.id:
+    if db_job.employer_id != current_user.employer_profile_id:
         raise HTTPException(status_code=403, detail="Not authorized to update this job")
     
-    return crud.update_job(db, job_id=job_id, update_data=job_update.dict(exclude_unset=True))
+    update_data = job_update.dict(exclude_unset=True)
+    # Applicants' match scores depend on the job text and requirements
+    rescore = any(getattr(db_job, key) != value for key, value in update_data.items() if key in SCORED_JOB_FIELDS)
+    db_job = crud.update_job(db, job_id=job_id, update_data=update_data, rescore=rescore)
+    
+    return db_job
 
 @router.patch("/{job_id}/status", response_model=schemas.JobResponse)
 def update_job_status(job_id: int, status_update: dict, db: Session = Depends(get_db), current_user: models.User = Depends(get_current_user)):
     db_job = crud.get_job(db, job_id=job_id)
     if not db_job:
         raise HTTPException(status_code=404, detail="Job not found")
-    if db_job.employer_id != current_user.employer_profile.id:
+    if db_job.employer_id != current_user.employer_profile_id:
         raise HTTPException(status_code=403, detail="Not authorized to update this job")
     
     new_status = status_update.get("status")
@@ -0,0 +1,15 @@
+from fastapi import APIRouter, Depends, HTTPException
+from .. import models
+from ..database import engine, async_engine
+from ..utils.pool_metrics import pool_report
+from .auth import get_current_user
+
+router = APIRouter(prefix="/metrics", tags=["metrics"])
+
+@router.get("/db-pool")
+def get_db_pool_metrics(current_user: models.User = Depends(get_current_user)):
+    if current_user.role != models.UserRole.ADMIN:
+        raise HTTPException(status_code=403, detail="Only admins can view metrics")
+    
+    # Reported by whichever worker process served the request (see "pid")
+    return pool_report(engine, async_engine)
@@ -1,18 +1,135 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+import asyncio
+import json
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Response, Request, Header
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
-from typing import List
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Optional
 from .. import crud, models, schemas
-from ..database import get_db
+from ..database import get_db, get_async_db
 from .auth import get_current_user
+from ..utils.pagination import NEXT_CURSOR_HEADER, next_cursor
+from ..utils.notification_stream import notification_hub
+from ..config import settings
 
 router = APIRouter(prefix="/notifications", tags=["notifications"])
 
 @router.get("/", response_model=List[schemas.NotificationResponse])
-def get_my_notifications(
+async def get_my_notifications(
+    response: Response,
+    limit: Optional[int] = Query(None, ge=1, le=100),
+    cursor: Optional[str] = None,
+    since_id: Optional[int] = None,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: models.User = Depends(get_current_user)
+):
+    # since_id: only notifications newer than the newest one the client already has
+    notifications = await crud.get_notifications_async(db, current_user.id, limit=limit, cursor=cursor, since_id=since_id)
+    cursor_value = next_cursor(notifications, limit, "created_at")
+    if cursor_value:
+        response.headers[NEXT_CURSOR_HEADER] = cursor_value
+    return notifications
+
+@router.get("/unread-count", response_model=schemas.UnreadCount)
+async def get_unread_count(
+    db: AsyncSession = Depends(get_async_db),
+    current_user: models.User = Depends(get_current_user)
+):
+    # For the badge, without downloading the notifications themselves
+    return {"unread": await crud.count_unread_notifications_async(db, current_user.id)}
+
+@router.put("/read-all", response_model=schemas.MarkedRead)
+def mark_all_read(
+    db: Session = Depends(get_db),
+    current_user: models.User = Depends(get_current_user)
+):
+    return {"updated": crud.mark_all_notifications_read(db, current_user.id)}
+
+CATCHUP_PAGE_SIZE = 100
+
+def _sse(event: dict, name: str = "notification"):
+    return f"id: {event['id']}\nevent: {name}\ndata: {json.dumps(event)}\n\n"
+
+async def _catch_up(db: AsyncSession, user_id: int, last_event_id: int):
+    """
+    What a reconnecting client missed, oldest first, in pages. Returns
+    (events, resync_id): past NOTIFICATION_STREAM_CATCHUP_MAX the rest is
+    not replayed and resync_id is the newest notification's id instead.
+    """
+    events, since_id = [], last_event_id
+    while len(events) < settings.NOTIFICATION_STREAM_CATCHUP_MAX:
+        limit = min(CATCHUP_PAGE_SIZE, settings.NOTIFICATION_STREAM_CATCHUP_MAX - len(events))
+        rows = await crud.get_notifications_since_async(db, user_id, since_id, limit=limit)
+        events.extend(schemas.NotificationResponse.model_validate(n).model_dump(mode="json") for n in rows)
+        if len(rows) < limit:
+            return events, None
+        since_id = rows[-1].id
+    newest_id = await crud.get_newest_notification_id_async(db, user_id)
+    return events, (newest_id if newest_id > since_id else None)
+
+async def _notification_events(request: Request, user_id: int, queue, missed: list, resync_id: int = None):
+    try:
+        yield "retry: 5000\n\n"
+        last_id = 0
+        for event in missed:
+            last_id = event["id"]
+            yield _sse(event)
+        if resync_id is not None:
+            # Too much missed to replay: the client reloads its list, and its
+            # Last-Event-ID moves past everything it was told about
+            last_id = resync_id
+            yield _sse({"id": resync_id}, "resync")
+        while True:
+            try:
+                event = await asyncio.wait_for(queue.get(), settings.NOTIFICATION_STREAM_HEARTBEAT_SECONDS)
+            except asyncio.TimeoutError:
+                if await request.is_disconnected():
+                    break
+                # Comment line, keeps proxies from closing an idle connection
+                yield ": keep-alive\n\n"
+                continue
+            if event is None:
+                # Fell behind, the client reconnects with Last-Event-ID
+                break
+            if event["id"] <= last_id:
+                continue # Already sent in the catch-up
+            last_id = event["id"]
+            yield _sse(event)
+    finally:
+        notification_hub.unsubscribe(user_id, queue)
+
+@router.get("/stream")
+async def stream_notifications(
+    request: Request,
+    last_event_id: Optional[int] = Header(None),
     db: Session = Depends(get_db),
+    async_db: AsyncSession = Depends(get_async_db),
     current_user: models.User = Depends(get_current_user)
 ):
-    return crud.get_notifications(db, current_user.id)
+    """
+    Server-Sent Events stream of the user's new notifications, replacing
+    polling of GET /notifications/. A reconnecting client sends the
+    Last-Event-ID header and first gets what it missed, or a "resync" event
+    when that is more than NOTIFICATION_STREAM_CATCHUP_MAX notifications.
+    """
+    user_id = current_user.id
+    # Subscribe before the catch-up query so nothing created in between is lost
+    queue = notification_hub.subscribe(user_id)
+    try:
+        missed, resync_id = [], None
+        if last_event_id is not None:
+            missed, resync_id = await _catch_up(async_db, user_id, last_event_id)
+    except Exception:
+        notification_hub.unsubscribe(user_id, queue)
+        raise
+    # Give the connections back now, the stream stays open for as long as the page does
+    await async_db.close()
+    db.close()
+    return StreamingResponse(
+        _notification_events(request, user_id, queue, missed, resync_id),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
 
 @router.put("/{notification_id}/read", response_model=schemas.NotificationResponse)
 def mark_read(
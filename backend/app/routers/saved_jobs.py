@@ -1,9 +1,10 @@
-from typing import List
-from fastapi import APIRouter, Depends, HTTPException, status
+from typing import List, Optional
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Response
 from sqlalchemy.orm import Session
 from .. import crud, models, schemas
 from ..database import get_db
 from .auth import get_current_user
+from ..utils.pagination import NEXT_CURSOR_HEADER, next_cursor
 
 router = APIRouter(prefix="/saved-jobs", tags=["saved-jobs"])
 
@@ -12,32 +13,42 @@ def save_job(saved_job: schemas.SavedJobCreate, db: Session = Depends(get_db), c
     if current_user.role != models.UserRole.SEEKER:
         raise HTTPException(status_code=403, detail="Only seekers can save jobs")
         
-    if not current_user.seeker_profile:
+    if current_user.seeker_profile_id is None:
         raise HTTPException(status_code=400, detail="Seeker profile required.")
 
     # Check if already saved
-    existing = crud.get_saved_job_by_seeker_and_job(db, seeker_id=current_user.seeker_profile.id, job_id=saved_job.job_id)
+    existing = crud.get_saved_job_by_seeker_and_job(db, seeker_id=current_user.seeker_profile_id, job_id=saved_job.job_id)
     if existing:
         raise HTTPException(status_code=400, detail="Job already saved")
 
-    return crud.create_saved_job(db=db, saved_job=saved_job, seeker_id=current_user.seeker_profile.id)
+    return crud.create_saved_job(db=db, saved_job=saved_job, seeker_id=current_user.seeker_profile_id)
 
 @router.get("/", response_model=List[schemas.SavedJobResponse])
-def get_saved_jobs(db: Session = Depends(get_db), current_user: models.User = Depends(get_current_user)):
+def get_saved_jobs(
+    response: Response,
+    limit: Optional[int] = Query(None, ge=1, le=100),
+    cursor: Optional[str] = None,
+    db: Session = Depends(get_db),
+    current_user: models.User = Depends(get_current_user)
+):
     if current_user.role != models.UserRole.SEEKER:
         raise HTTPException(status_code=403, detail="Only seekers can view saved jobs")
         
-    if not current_user.seeker_profile:
+    if current_user.seeker_profile_id is None:
         raise HTTPException(status_code=400, detail="Seeker profile required.")
         
-    return crud.get_saved_jobs_by_seeker(db, seeker_id=current_user.seeker_profile.id)
+    saved_jobs = crud.get_saved_jobs_by_seeker(db, seeker_id=current_user.seeker_profile_id, limit=limit, cursor=cursor)
+    cursor_value = next_cursor(saved_jobs, limit, "created_at")
+    if cursor_value:
+        response.headers[NEXT_CURSOR_HEADER] = cursor_value
+    return saved_jobs
 
 @router.delete("/{job_id}", status_code=status.HTTP_204_NO_CONTENT)
 def unsave_job(job_id: int, db: Session = Depends(get_db), current_user: models.User = Depends(get_current_user)):
     if current_user.role != models.UserRole.SEEKER:
         raise HTTPException(status_code=403, detail="Only seekers can unsave jobs")
         
-    if not current_user.seeker_profile:
+    if current_user.seeker_profile_id is None:
          raise HTTPException(status_code=400, detail="Seeker profile required.")
          
     # We need to find the saved_job entry first based on job_id and seeker_id
@@ -45,7 +56,7 @@ def unsave_job(job_id: int, db: Session = Depends(get_db), current_user: models.
     # However, purely from UX, unsaving by Job ID is often more convenient if we don't have the SavedJob ID handy.
     # Let's support unsaving by Job ID for simplicity in frontend integration, OR find the SavedJob record first.
     
-    saved_job = crud.get_saved_job_by_seeker_and_job(db, seeker_id=current_user.seeker_profile.id, job_id=job_id)
+    saved_job = crud.get_saved_job_by_seeker_and_job(db, seeker_id=current_user.seeker_profile_id, job_id=job_id)
     if not saved_job:
         raise HTTPException(status_code=404, detail="Saved job not found")
         
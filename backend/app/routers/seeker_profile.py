@@ -4,6 +4,7 @@ from pydantic import BaseModel
 from .. import crud, models, schemas
 from ..database import get_db
 from .auth import get_current_user
+from ..utils.identity_cache import identity_cache
 
 router = APIRouter(prefix="/seeker-profile", tags=["seeker-profile"])
 
@@ -122,7 +123,10 @@ def update_my_profile(
         existing_user = db.query(models.User).filter(models.User.email == profile_update.email).first()
         if existing_user:
             raise HTTPException(status_code=400, detail="Email already in use")
+        old_email = current_user.email
         current_user.email = profile_update.email
+    else:
+        old_email = None
 
     # Update only provided fields
     if profile_update.first_name is not None:
@@ -139,6 +143,7 @@ def update_my_profile(
         profile.phone = profile_update.phone
     if profile_update.skills is not None:
         profile.skills = profile_update.skills
+        crud.sync_seeker_skills(db, profile)
     if profile_update.education is not None:
         profile.education = profile_update.education
     if profile_update.experience is not None:
@@ -159,6 +164,10 @@ def update_my_profile(
         profile.preferred_locations = profile_update.preferred_locations
     
     db.commit()
+    # After the commit: invalidating earlier would let a concurrent request
+    # re-cache the old identity before the change lands
+    if old_email:
+        identity_cache.invalidate(old_email)
     db.refresh(profile)
     
     return {"message": "Profile updated successfully", "profile": profile}
@@ -3,6 +3,7 @@ from sqlalchemy.orm import Session
 from .. import crud, models, schemas
 from ..database import get_db
 from .auth import get_current_user
+from ..utils.identity_cache import identity_cache
 
 router = APIRouter(prefix="/settings", tags=["settings"])
 
@@ -42,5 +43,6 @@ def change_password(
         
     current_user.hashed_password = crud.get_password_hash(new_password)
     db.commit()
+    identity_cache.invalidate(current_user.email)
     
     return {"message": "Password updated successfully"}
@@ -24,14 +24,13 @@ class UserResponse(UserBase):
         from_attributes = True
 
 # --- Profile Schemas ---
-class SeekerProfileCreate(BaseModel):
+class SeekerProfileBase(BaseModel):
     first_name: Optional[str] = None
     last_name: Optional[str] = None
     headline: Optional[str] = None
     location: Optional[str] = None
     phone: Optional[str] = None
     skills: Optional[str] = None
-    cv_html: Optional[str] = None
     # Job Preferences
     job_type: Optional[str] = None
     work_mode: Optional[str] = None
@@ -39,7 +38,10 @@ class SeekerProfileCreate(BaseModel):
     min_salary: Optional[str] = None
     preferred_locations: Optional[str] = None
 
-class SeekerProfileResponse(SeekerProfileCreate):
+class SeekerProfileCreate(SeekerProfileBase):
+    cv_html: Optional[str] = None
+
+class SeekerProfileResponse(SeekerProfileBase): # No cv_html, it's served by /seeker-profile/{id}/cv
     id: int
     user_id: int
     cv_url: Optional[str] = None
@@ -90,6 +92,19 @@ class CVResponse(CVBase):
     class Config:
         from_attributes = True
 
+class CVSummary(BaseModel):
+    # CV in lists: no content_html / content_json (GET /cvs/{id} has them)
+    id: int
+    seeker_id: int
+    title: str
+    file_url: Optional[str] = None
+    is_uploaded: bool = False
+    is_primary: bool = False
+    created_at: datetime
+    
+    class Config:
+        from_attributes = True
+
 # --- Job Schemas ---
 class JobBase(BaseModel):
     title: str
@@ -113,6 +128,26 @@ class JobResponse(JobBase):
     applicants_count: int = 0
     created_at: datetime
     employer: Optional[EmployerProfileResponse] = None # Include employer details
+    rank: Optional[float] = None # Search relevance (only with ?rank=true)
+    highlight: Optional[str] = None # Matched snippet (only with ?highlight=true)
+    
+    class Config:
+        from_attributes = True
+
+class JobSummary(BaseModel):
+    # Job nested in application / saved job lists: no description / requirements
+    id: int
+    employer_id: int
+    title: str
+    location: Optional[str] = None
+    salary_range: Optional[str] = None
+    salary_min: Optional[int] = 0
+    salary_max: Optional[int] = 0
+    job_type: Optional[str] = None
+    experience_level: Optional[str] = None
+    status: JobStatus
+    created_at: datetime
+    employer: Optional[EmployerProfileResponse] = None
     
     class Config:
         from_attributes = True
@@ -132,13 +167,31 @@ class ApplicationResponse(BaseModel):
     applied_at: datetime
     cover_letter: Optional[str] = None
     cv_id: Optional[int] = None
-    job: Optional[JobResponse] = None
+    job: Optional[JobSummary] = None
     seeker: Optional[SeekerProfileResponse] = None
-    cv: Optional[CVResponse] = None
+    cv: Optional[CVSummary] = None
     
     class Config:
         from_attributes = True
 
+class RankedCandidate(BaseModel):
+    # Applicant row of the ranked candidates list; no CV / profile bodies
+    id: int
+    job_id: int
+    seeker_id: int
+    status: ApplicationStatus
+    match_score: float
+    applied_at: datetime
+    cv_id: Optional[int] = None
+    cv_title: Optional[str] = None
+    first_name: Optional[str] = None
+    last_name: Optional[str] = None
+    headline: Optional[str] = None
+    location: Optional[str] = None
+
+    class Config:
+        from_attributes = True
+
 # --- Saved Job Schemas ---
 class SavedJobBase(BaseModel):
     job_id: int
@@ -150,7 +203,7 @@ class SavedJobResponse(SavedJobBase):
     id: int
     seeker_id: int
     created_at: datetime
-    job: Optional[JobResponse] = None
+    job: Optional[JobSummary] = None
     
     class Config:
         from_attributes = True
@@ -234,6 +287,12 @@ class NotificationResponse(NotificationBase):
     class Config:
         from_attributes = True
 
+class UnreadCount(BaseModel):
+    unread: int
+
+class MarkedRead(BaseModel):
+    updated: int
+
 # --- User Settings Schemas ---
 class UserSettingsBase(BaseModel):
     email_job_alerts: bool = True
@@ -0,0 +1,173 @@
+"""
+Background task worker.
+
+Runs the tasks the API queues in the task_queue table (see
+utils/task_queue.py): job alert fan-out and applicant re-scoring. Each task
+runs in a pool thread with its own database session. Failures are retried
+with exponential backoff and dead-lettered after TASK_MAX_ATTEMPTS; a task
+whose worker died mid-run is picked up again once its lease
+(TASK_LEASE_SECONDS) expires.
+
+Needs nothing but the application database. Run it next to the API
+(several workers can run side by side, a task is claimed with a
+conditional UPDATE so only one of them gets it):
+
+    cd backend && python -m app.task_worker
+"""
+import json
+import threading
+import time
+import traceback
+from datetime import datetime, timedelta, timezone
+from sqlalchemy import and_, or_, update
+from sqlalchemy.orm import Session
+from . import models
+from .config import settings
+from .database import SessionLocal
+from .utils.task_queue import TASKS
+# Modules whose handlers this worker runs (registered on import)
+from .utils import notification_logic, rescoring # noqa: F401
+
+MAX_RETRY_DELAY_SECONDS = 60 * 60
+
+def retry_delay(attempts: int):
+    return min(settings.TASK_RETRY_BASE_SECONDS * 2 ** (attempts - 1), MAX_RETRY_DELAY_SECONDS)
+
+def _claimable(now: datetime):
+    lease_expired = now - timedelta(seconds=settings.TASK_LEASE_SECONDS)
+    return or_(
+        and_(models.Task.status == models.TaskStatus.PENDING, models.Task.next_attempt_at <= now),
+        and_(models.Task.status == models.TaskStatus.RUNNING, models.Task.locked_at < lease_expired),
+    )
+
+def claim_task(db: Session, exclude_names=()):
+    """
+    Marks the next due task as running and returns its id, or None. The
+    UPDATE re-checks that the task is still claimable, so when two workers
+    race for it only one UPDATE matches.
+    """
+    now = datetime.now(timezone.utc)
+    query = db.query(models.Task.id).filter(_claimable(now))
+    if exclude_names:
+        query = query.filter(models.Task.name.notin_(exclude_names))
+    candidates = [row.id for row in query.order_by(models.Task.next_attempt_at, models.Task.id).limit(10)]
+    for task_id in candidates:
+        result = db.execute(
+            update(models.Task)
+            .where(models.Task.id == task_id, _claimable(now))
+            .values(status=models.TaskStatus.RUNNING, locked_at=now, attempts=models.Task.attempts + 1)
+            .execution_options(synchronize_session=False)
+        )
+        db.commit()
+        if result.rowcount == 1:
+            return task_id
+    return None
+
+def run_task(task_id: int, session_factory=SessionLocal):
+    """
+    Runs one claimed task and records the outcome. Returns True on success.
+    """
+    db = session_factory()
+    try:
+        task = db.get(models.Task, task_id)
+        try:
+            handler, _ = TASKS[task.name]
+            payload = json.loads(task.payload or "{}")
+            handler(db, **payload)
+            # Committed together with whatever the handler left uncommitted, so
+            # a handler that doesn't commit itself runs exactly once
+            task = db.get(models.Task, task_id)
+            task.status = models.TaskStatus.DONE
+            task.finished_at = datetime.now(timezone.utc)
+            task.last_error = None
+            db.commit()
+            return True
+        except Exception as e:
+            db.rollback()
+            task = db.get(models.Task, task_id)
+            task.last_error = "".join(traceback.format_exception_only(type(e), e)).strip()
+            if task.name not in TASKS or task.attempts >= settings.TASK_MAX_ATTEMPTS:
+                task.status = models.TaskStatus.DEAD
+                print(f"Task {task.id} ({task.name}) dead-lettered after {task.attempts} attempts: {e}")
+            else:
+                task.status = models.TaskStatus.PENDING
+                task.next_attempt_at = datetime.now(timezone.utc) + timedelta(seconds=retry_delay(task.attempts))
+                print(f"Task {task.id} ({task.name}) failed, attempt {task.attempts}: {e}")
+            db.commit()
+            return False
+    finally:
+        db.close()
+
+class TaskWorker:
+    """
+    Pool of threads that each claim and run one task at a time, honouring
+    the per-task max_concurrency given at registration.
+    """
+    def __init__(self, concurrency: int = None, session_factory=SessionLocal):
+        self._concurrency = concurrency or settings.TASK_WORKER_CONCURRENCY
+        self._session_factory = session_factory
+        self._lock = threading.Lock()
+        self._running = {} # task name -> number running in this process
+        self._stopped = threading.Event()
+        self._threads = []
+
+    def _saturated(self):
+        # Task names at their concurrency limit, not to be claimed right now
+        return [name for name, (_, limit) in TASKS.items() if limit and self._running.get(name, 0) >= limit]
+
+    def _claim(self):
+        with self._lock:
+            db = self._session_factory()
+            try:
+                task_id = claim_task(db, self._saturated())
+                if task_id is None:
+                    return None, None
+                name = db.get(models.Task, task_id).name
+            finally:
+                db.close()
+            self._running[name] = self._running.get(name, 0) + 1
+            return task_id, name
+
+    def _loop(self):
+        while not self._stopped.is_set():
+            try:
+                task_id, name = self._claim()
+            except Exception as e:
+                print(f"Task worker could not claim a task: {e}")
+                task_id = None
+            if task_id is None:
+                self._stopped.wait(settings.TASK_POLL_INTERVAL)
+                continue
+            try:
+                run_task(task_id, self._session_factory)
+            finally:
+                with self._lock:
+                    self._running[name] -= 1
+
+    def start(self):
+        for i in range(self._concurrency):
+            thread = threading.Thread(target=self._loop, name=f"task-worker-{i}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+    def stop(self):
+        # Lets running tasks finish; unclaimed ones stay queued
+        self._stopped.set()
+        for thread in self._threads:
+            thread.join()
+        self._threads = []
+
+def run():
+    worker = TaskWorker()
+    print(f"Task worker started ({worker._concurrency} threads, tasks: {', '.join(sorted(TASKS))})")
+    worker.start()
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        print("Task worker stopping")
+    finally:
+        worker.stop()
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,72 @@
+import hashlib
+import json
+from .skill_extraction import extract_skills_from_text, extract_certifications, strip_html
+
+# Features derived from a CV's text (skills, certifications, role hints),
+# computed when the CV is written and stored on the row (cvs.features_json)
+# together with a hash of the inputs (cvs.content_hash), so analytics reads
+# them instead of re-scanning the CV HTML on every request.
+#
+# Bump FEATURES_VERSION whenever the extraction logic changes: stored
+# features from an older version are recomputed the next time they are read.
+
+FEATURES_VERSION = 1
+
+# Substrings that hint at the CV owner's field, used for career guidance
+ROLE_HINTS = {
+    "tech": ["software", "developer", "engineer", "react", "python", "tech", "coding", "web developer"],
+    "marketing": ["marketing", "social", "seo", "content", "copywriting", "digital marketing"],
+    "design": ["design", "ui/ux", "figma", "graphic", "product design"],
+    "data": ["data", "analytics", "data science", "machine learning", "tensorflow", "sql"],
+}
+
+def role_flags(text: str):
+    text = text.lower()
+    return {role: any(hint in text for hint in hints) for role, hints in ROLE_HINTS.items()}
+
+def content_hash(cv):
+    digest = hashlib.sha256()
+    for part in (str(FEATURES_VERSION), cv.title or "", cv.content_html or ""):
+        digest.update(part.encode())
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+def compute_features(cv):
+    if cv.content_html:
+        skills = extract_skills_from_text(cv.content_html)
+        certifications = extract_certifications(cv.content_html)
+        text = f"{cv.title or ''} {strip_html(cv.content_html)}"
+    else:
+        skills = extract_skills_from_text(cv.title)
+        certifications = []
+        text = cv.title or ""
+    return {
+        "version": FEATURES_VERSION,
+        "skills": skills,
+        "certifications": certifications,
+        "roles": role_flags(text),
+    }
+
+def refresh_features(cv):
+    """
+    Recomputes the stored features if the CV's title/content changed since
+    they were computed. Returns True when the row was modified.
+    """
+    new_hash = content_hash(cv)
+    if cv.content_hash == new_hash and cv.features_json:
+        return False
+    cv.content_hash = new_hash
+    cv.features_json = json.dumps(compute_features(cv))
+    return True
+
+def get_features(cv):
+    """
+    The CV's stored features. CVs written before features existed (or by an
+    older FEATURES_VERSION) are computed here once; the caller commits.
+    """
+    if cv.features_json:
+        features = json.loads(cv.features_json)
+        if features.get("version") == FEATURES_VERSION:
+            return features
+    refresh_features(cv)
+    return json.loads(cv.features_json)
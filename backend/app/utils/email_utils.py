@@ -1,46 +1,68 @@
-import smtplib
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
+from sqlalchemy.orm import Session
+from .. import models
 from ..config import settings
+from ..database import SessionLocal
 
-def send_email(to_email: str, subject: str, body_html: str, reply_to: str = None, from_name: str = None):
-    """
-    Sends an email using SMTP.
-    If SMTP_USER is not set, it logs the email to console for development.
-    """
-    if not settings.SMTP_USER or not settings.SMTP_PASSWORD or settings.SMTP_PASSWORD == "your_16_character_app_password_here":
-        print(f"--- DEVELOPMENT MODE: EMAIL LOG ---")
-        print(f"To: {to_email}")
-        if reply_to: print(f"Reply-To: {reply_to}")
-        print(f"Subject: {subject}")
-        print(f"Body: {body_html}")
-        print(f"-----------------------------------")
-        return True
+def smtp_enabled():
+    """
+    Whether emails go out over SMTP. With EMAIL_BACKEND=auto (the default) this
+    is only the case once real SMTP credentials are configured; otherwise the
+    email worker logs emails to the console for development.
+    """
+    if settings.EMAIL_BACKEND != "auto":
+        return settings.EMAIL_BACKEND == "smtp"
+    return bool(settings.SMTP_USER and settings.SMTP_PASSWORD and settings.SMTP_PASSWORD != "your_16_character_app_password_here")
 
-    try:
-        msg = MIMEMultipart()
-        display_name = from_name or settings.EMAILS_FROM_NAME
-        msg['From'] = f"{display_name} <{settings.EMAILS_FROM_EMAIL}>"
-        msg['To'] = to_email
-        msg['Subject'] = subject
-        
-        if reply_to:
-            msg['Reply-To'] = reply_to
+def build_message(email: models.EmailOutbox):
+    msg = MIMEMultipart()
+    display_name = email.from_name or settings.EMAILS_FROM_NAME
+    msg['From'] = f"{display_name} <{settings.EMAILS_FROM_EMAIL}>"
+    msg['To'] = email.to_email
+    msg['Subject'] = email.subject
+    
+    if email.reply_to:
+        msg['Reply-To'] = email.reply_to
 
-        msg.attach(MIMEText(body_html, 'html'))
+    msg.attach(MIMEText(email.body_html, 'html'))
+    return msg
 
-        server = smtplib.SMTP(settings.SMTP_HOST, settings.SMTP_PORT)
-        server.starttls()
-        server.login(settings.SMTP_USER, settings.SMTP_PASSWORD)
-        text = msg.as_string()
-        server.sendmail(settings.EMAILS_FROM_EMAIL, to_email, text)
-        server.quit()
+def send_email(to_email: str, subject: str, body_html: str, reply_to: str = None, from_name: str = None, db: Session = None):
+    """
+    Queues an email in the outbox; delivery is done by the email worker
+    (python -m app.email_worker), never in the API process.
+    
+    Pass `db` to enqueue inside the caller's transaction (the caller commits,
+    which lets a fan-out queue thousands of emails with one commit). Without
+    it the email is committed right away in a short-lived session.
+    """
+    email = models.EmailOutbox(
+        to_email=to_email,
+        subject=subject,
+        body_html=body_html,
+        reply_to=reply_to,
+        from_name=from_name,
+        status=models.EmailStatus.PENDING,
+        attempts=0
+    )
+    if db is not None:
+        db.add(email)
+        return True
+
+    session = SessionLocal()
+    try:
+        session.add(email)
+        session.commit()
         return True
     except Exception as e:
-        print(f"Failed to send email: {e}")
+        session.rollback()
+        print(f"Failed to queue email: {e}")
         return False
+    finally:
+        session.close()
 
-def send_job_alert(to_email: str, job_title: str, company_name: str, job_id: int):
+def send_job_alert(to_email: str, job_title: str, company_name: str, job_id: int, db: Session = None):
     subject = f"New Job Alert: {job_title} at {company_name}"
     job_url = f"http://localhost:5173/jobs/{job_id}"
     
@@ -59,7 +81,7 @@ def send_job_alert(to_email: str, job_title: str, company_name: str, job_id: int
         </body>
     </html>
     """
-    return send_email(to_email, subject, body)
+    return send_email(to_email, subject, body, db=db)
 
 def send_interview_alert(to_email: str, job_title: str, company_name: str, start_time: str, location: str, status: str = "scheduled", reply_to: str = None):
     """
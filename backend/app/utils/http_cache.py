@@ -0,0 +1,64 @@
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from fastapi import Request, Response
+
+# Conditional GET support (ETag / Last-Modified -> 304 Not Modified).
+#
+# Endpoints work out their validators from a cheap query (a version counter,
+# an updated_at column) before doing the expensive one, and return
+# not_modified() when the client's cached copy is still current, so the
+# response isn't rebuilt or resent.
+#
+# ETags are weak (W/"..."): they identify the version of the data, not the
+# exact bytes of its serialization.
+
+def make_etag(*parts):
+    return 'W/"' + "-".join(str(p) for p in parts) + '"'
+
+def _utc(value: datetime):
+    # SQLite hands back naive datetimes; they are UTC
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+def http_date(value: datetime):
+    return format_datetime(_utc(value), usegmt=True)
+
+def _etag_matches(header: str, etag: str):
+    if header.strip() == "*":
+        return True
+    # Weak comparison: W/"x" and "x" are the same
+    opaque = etag.removeprefix("W/")
+    return any(tag.strip().removeprefix("W/") == opaque for tag in header.split(","))
+
+def is_not_modified(request: Request, etag: str = None, last_modified: datetime = None):
+    """
+    True when the request's If-None-Match / If-Modified-Since show the client
+    already has this version. If-None-Match wins when both are sent.
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        return etag is not None and _etag_matches(if_none_match, etag)
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since and last_modified is not None:
+        try:
+            since = _utc(parsedate_to_datetime(if_modified_since))
+        except (TypeError, ValueError):
+            return False
+        # HTTP dates have whole seconds
+        return _utc(last_modified).replace(microsecond=0) <= since
+    return False
+
+def set_cache_headers(response: Response, etag: str = None, last_modified: datetime = None, cache_control: str = None):
+    if etag:
+        response.headers["ETag"] = etag
+    if last_modified:
+        response.headers["Last-Modified"] = http_date(last_modified)
+    if cache_control:
+        response.headers["Cache-Control"] = cache_control
+
+def not_modified(etag: str = None, last_modified: datetime = None, cache_control: str = None):
+    response = Response(status_code=304)
+    set_cache_headers(response, etag, last_modified, cache_control)
+    return response
@@ -0,0 +1,109 @@
+import threading
+import time
+from collections import OrderedDict
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session, make_transient_to_detached
+from .. import models
+from ..config import settings
+
+def snapshot_user(user: models.User):
+    """
+    Returns a detached copy of the user's column data that can be attached to
+    any session with session.merge(snapshot, load=False), without a query.
+    """
+    snapshot = models.User(**{
+        attr.key: getattr(user, attr.key) for attr in inspect(models.User).column_attrs
+    })
+    make_transient_to_detached(snapshot)
+    return snapshot
+
+def attach_user(db: Session, snapshot: models.User, profile_ids=(None, None)):
+    """
+    Attaches a snapshot to db without a query, with the profile ids
+    (seeker, employer) known for it (user.seeker_profile_id etc.).
+    """
+    user = db.merge(snapshot, load=False)
+    user._profile_ids = tuple(profile_ids)
+    return user
+
+class IdentityCache:
+    """
+    Per-process, TTL-bounded cache of authenticated users keyed by the token
+    subject (the user's email).
+    
+    Entries are detached snapshots of the users row (role included) plus
+    the ids of the user's seeker and employer profiles. On a hit the
+    snapshot is merged into the request's session with load=False, which
+    attaches a regular User instance without querying the database;
+    user.seeker_profile_id / employer_profile_id come from the entry, while
+    relationships such as seeker_profile still lazy-load when used.
+    
+    Call invalidate() whenever the users row changes (email, password).
+    Entries of users whose profile is created or deleted are dropped on
+    commit (see _invalidate_profile_changes below). Other workers pick up
+    the change once their entry expires.
+    """
+    def __init__(self, ttl_seconds: float, max_size: int):
+        self.ttl_seconds = ttl_seconds
+        self.max_size = max_size
+        self._lock = threading.Lock()
+        self._entries = OrderedDict() # subject -> (expires_at, snapshot, profile_ids)
+
+    def get(self, db: Session, subject: str):
+        with self._lock:
+            entry = self._entries.get(subject)
+            if entry is None:
+                return None
+            expires_at, snapshot, profile_ids = entry
+            if expires_at < time.monotonic():
+                del self._entries[subject]
+                return None
+            self._entries.move_to_end(subject)
+        return attach_user(db, snapshot, profile_ids)
+
+    def put(self, subject: str, snapshot: models.User, profile_ids=(None, None)):
+        if self.ttl_seconds <= 0:
+            return
+        with self._lock:
+            self._entries[subject] = (time.monotonic() + self.ttl_seconds, snapshot, tuple(profile_ids))
+            self._entries.move_to_end(subject)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, subject: str):
+        with self._lock:
+            self._entries.pop(subject, None)
+
+    def invalidate_users(self, user_ids):
+        # By user id, for changes that don't know the email; profile changes are rare
+        with self._lock:
+            for subject in [s for s, (_, snapshot, _) in self._entries.items() if snapshot.id in user_ids]:
+                del self._entries[subject]
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+identity_cache = IdentityCache(settings.AUTH_CACHE_TTL_SECONDS, settings.AUTH_CACHE_MAX_SIZE)
+
+_PROFILE_CHANGES_KEY = "identity_profile_changes"
+
+@event.listens_for(Session, "after_flush")
+def _note_profile_changes(session, flush_context):
+    user_ids = {
+        obj.user_id for obj in (*session.new, *session.deleted)
+        if isinstance(obj, (models.SeekerProfile, models.EmployerProfile))
+    }
+    if user_ids:
+        session.info.setdefault(_PROFILE_CHANGES_KEY, set()).update(user_ids)
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_profile_changes(session):
+    user_ids = session.info.pop(_PROFILE_CHANGES_KEY, None)
+    if user_ids:
+        identity_cache.invalidate_users(user_ids)
+
+@event.listens_for(Session, "after_soft_rollback")
+def _drop_profile_changes(session, previous_transaction):
+    if not previous_transaction.nested:
+        session.info.pop(_PROFILE_CHANGES_KEY, None)
@@ -0,0 +1,216 @@
+import re
+import zlib
+import numpy as np
+from scipy import sparse
+from .skill_extraction import SKILL_KEYWORDS, extract_skills_from_text
+
+# Job <-> seeker match score (Application.match_score, 0-100).
+#
+# Seekers are rows of a sparse matrix over a fixed feature space and a job is
+# a dense weight vector over the same space, laid out so that
+# `seeker_row . job_vector` is the weighted sum of the per-feature matches:
+#
+#   skills      cosine similarity of the skill sets (both sides unit-normalized)
+#   level       1 for the same experience level, 0.5 for an adjacent one
+#   job type    1 for the same job type
+#   location    1 if the job's location is one of the seeker's, or the job is remote
+#
+# Scoring every applicant of a job is then one sparse matrix-vector product.
+# Salary fit (seeker minimum vs job maximum) isn't linear in the features and
+# is computed separately, elementwise over the same batch.
+#
+# When either side hasn't filled something in, that feature scores half
+# marks for everyone rather than rewarding or penalizing the gap.
+
+WEIGHTS = {
+    "skills": 0.5,
+    "level": 0.15,
+    "job_type": 0.1,
+    "location": 0.1,
+    "salary": 0.15,
+}
+UNKNOWN_SCORE = 0.5
+
+# Ordinal experience levels, matched on the first word of the stored value ("Entry Level", "entry", ...)
+LEVELS = {
+    "intern": 0, "internship": 0,
+    "entry": 1, "junior": 1, "graduate": 1,
+    "mid": 2, "intermediate": 2,
+    "senior": 3,
+    "lead": 4, "manager": 4,
+    "director": 5,
+    "executive": 6,
+}
+JOB_TYPES = ["full-time", "part-time", "contract", "internship", "freelance", "remote"]
+LOCATION_BUCKETS = 1024
+
+# Feature layout
+_SKILL_INDEX = {skill: i for i, skill in enumerate(SKILL_KEYWORDS)}
+_LEVEL_BASE = len(SKILL_KEYWORDS)
+_LEVEL_COUNT = max(LEVELS.values()) + 1
+_TYPE_BASE = _LEVEL_BASE + _LEVEL_COUNT
+_LOCATION_BASE = _TYPE_BASE + len(JOB_TYPES)
+_ANY_LOCATION = _LOCATION_BASE + LOCATION_BUCKETS # Set on every seeker, weighted when the job is remote
+_NO_SKILLS = _ANY_LOCATION + 1
+_NO_LEVEL = _NO_SKILLS + 1
+_NO_JOB_TYPE = _NO_LEVEL + 1
+_NO_LOCATION = _NO_JOB_TYPE + 1
+_ALWAYS = _NO_LOCATION + 1 # Set on every seeker, carries the half marks for fields the job leaves empty
+N_FEATURES = _ALWAYS + 1
+
+_NUMBER_RE = re.compile(r"\d+(?:\.\d+)?")
+
+def _level(value):
+    if not value:
+        return None
+    words = value.lower().replace("-", " ").split()
+    return LEVELS.get(words[0]) if words else None
+
+def _job_type(value):
+    if not value:
+        return None
+    value = value.strip().lower().replace(" ", "-")
+    return JOB_TYPES.index(value) if value in JOB_TYPES else None
+
+def _location_buckets(values):
+    buckets = set()
+    for value in values:
+        # "Nairobi, Kenya" -> "nairobi"; zlib.crc32 because hash() is salted per process
+        place = value.split(",")[0].strip().lower()
+        if place:
+            buckets.add(zlib.crc32(place.encode()) % LOCATION_BUCKETS)
+    return buckets
+
+def _salary(value):
+    # SeekerProfile.min_salary is free text ("$50,000", "50000", "50k")
+    if not value:
+        return 0.0
+    text = str(value).lower().replace(",", "")
+    match = _NUMBER_RE.search(text)
+    if not match:
+        return 0.0
+    amount = float(match.group())
+    if "k" in text[match.end():match.end() + 2]:
+        amount *= 1000
+    return amount
+
+def seeker_skills(seeker, cv_skills=()):
+    """
+    The seeker's known skills: those listed on the profile plus the ones
+    extracted from their CV (see utils/cv_features.py).
+    """
+    skills = set(extract_skills_from_text(seeker.skills or ""))
+    skills.update(cv_skills or ())
+    return skills
+
+def _seeker_row(seeker, cv_skills=()):
+    columns, values = [], []
+
+    skills = [_SKILL_INDEX[s] for s in seeker_skills(seeker, cv_skills) if s in _SKILL_INDEX]
+    if skills:
+        columns += skills
+        values += [1 / np.sqrt(len(skills))] * len(skills)
+    else:
+        columns.append(_NO_SKILLS)
+        values.append(1.0)
+
+    level = _level(seeker.experience_level)
+    columns.append(_NO_LEVEL if level is None else _LEVEL_BASE + level)
+    job_type = _job_type(seeker.job_type)
+    columns.append(_NO_JOB_TYPE if job_type is None else _TYPE_BASE + job_type)
+
+    locations = [seeker.location or ""] + (seeker.preferred_locations or "").split("|")
+    buckets = _location_buckets(locations)
+    columns += [_LOCATION_BASE + b for b in buckets] or [_NO_LOCATION]
+    columns += [_ANY_LOCATION, _ALWAYS]
+    values += [1.0] * (len(columns) - len(values))
+    return columns, values
+
+def seeker_matrix(seekers, cv_skills=None):
+    """
+    Builds the (len(seekers) x N_FEATURES) CSR matrix for a batch of
+    SeekerProfiles, plus their parsed minimum salaries. cv_skills optionally
+    maps seeker index -> skills from the CV they applied with.
+    """
+    indptr, indices, data = [0], [], []
+    for i, seeker in enumerate(seekers):
+        columns, values = _seeker_row(seeker, (cv_skills or {}).get(i, ()))
+        indices += columns
+        data += values
+        indptr.append(len(indices))
+    matrix = sparse.csr_matrix((data, indices, indptr), shape=(len(seekers), N_FEATURES), dtype=np.float64)
+    min_salaries = np.array([_salary(s.min_salary) for s in seekers], dtype=np.float64)
+    return matrix, min_salaries
+
+def job_vector(job):
+    """
+    The job's weight vector over the seeker feature space. Dense: it's
+    small, and a CSR matrix times a dense vector is the fast path in scipy.
+    """
+    vector = np.zeros(N_FEATURES)
+
+    skills = extract_skills_from_text(f"{job.title or ''} {job.description or ''} {job.requirements or ''}")
+    if skills:
+        vector[[_SKILL_INDEX[s] for s in skills]] = WEIGHTS["skills"] / np.sqrt(len(skills))
+        vector[_NO_SKILLS] = WEIGHTS["skills"] * UNKNOWN_SCORE
+    else:
+        vector[_ALWAYS] += WEIGHTS["skills"] * UNKNOWN_SCORE
+
+    level = _level(job.experience_level)
+    if level is None:
+        vector[_ALWAYS] += WEIGHTS["level"] * UNKNOWN_SCORE
+    else:
+        vector[_LEVEL_BASE + level] = WEIGHTS["level"]
+        for adjacent in (level - 1, level + 1):
+            if 0 <= adjacent < _LEVEL_COUNT:
+                vector[_LEVEL_BASE + adjacent] = WEIGHTS["level"] * 0.5
+        vector[_NO_LEVEL] = WEIGHTS["level"] * UNKNOWN_SCORE
+
+    job_type = _job_type(job.job_type)
+    if job_type is None:
+        vector[_ALWAYS] += WEIGHTS["job_type"] * UNKNOWN_SCORE
+    else:
+        vector[_TYPE_BASE + job_type] = WEIGHTS["job_type"]
+        vector[_NO_JOB_TYPE] = WEIGHTS["job_type"] * UNKNOWN_SCORE
+
+    location = (job.location or "").strip().lower()
+    if "remote" in location:
+        vector[_ANY_LOCATION] = WEIGHTS["location"]
+    elif location:
+        for bucket in _location_buckets([location]):
+            vector[_LOCATION_BASE + bucket] = WEIGHTS["location"]
+        vector[_NO_LOCATION] = WEIGHTS["location"] * UNKNOWN_SCORE
+    else:
+        vector[_ALWAYS] += WEIGHTS["location"] * UNKNOWN_SCORE
+    return vector
+
+def salary_fit(job, min_salaries):
+    # 1 when the job pays at least the seeker's minimum, scaling down to 0 at half of it
+    job_max = float(job.salary_max or 0)
+    if job_max <= 0:
+        return np.full(len(min_salaries), UNKNOWN_SCORE)
+    known = min_salaries > 0
+    ratio = np.divide(job_max, min_salaries, out=np.ones_like(min_salaries), where=known)
+    return np.where(known, np.clip(2 * ratio - 1, 0.0, 1.0), UNKNOWN_SCORE)
+
+def score_matrix(job, matrix, min_salaries, vector=None):
+    """
+    Match scores (0-100, one decimal) for every seeker row in the matrix.
+    """
+    if vector is None:
+        vector = job_vector(job)
+    total = matrix @ vector + WEIGHTS["salary"] * salary_fit(job, min_salaries)
+    return np.round(100 * total / sum(WEIGHTS.values()), 1)
+
+def score_seekers(job, seekers, cv_skills=None):
+    if not seekers:
+        return np.zeros(0)
+    matrix, min_salaries = seeker_matrix(seekers, cv_skills)
+    return score_matrix(job, matrix, min_salaries)
+
+def score_application(job, seeker, cv_skills=()):
+    # Same sum as score_matrix for a single row, without building a CSR matrix
+    columns, values = _seeker_row(seeker, cv_skills)
+    total = job_vector(job)[columns] @ np.array(values)
+    total += WEIGHTS["salary"] * salary_fit(job, np.array([_salary(seeker.min_salary)]))[0]
+    return round(float(100 * total / sum(WEIGHTS.values())), 1)
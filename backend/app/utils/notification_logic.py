@@ -1,28 +1,40 @@
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, joinedload
 from sqlalchemy import or_, and_
-from .. import models
+from .. import crud, models
 from .email_utils import send_job_alert
+from .skill_index import job_skill_terms, skill_in
+from .task_queue import task
 
 def match_seekers_for_job(db: Session, job: models.Job):
     """
-    Returns a list of SeekerProfiles that match the job criteria.
+    Returns (SeekerProfile, email_job_alerts, push_job_alerts) for every
+    seeker that matches the job criteria.
     Criteria:
-    1. Seeker has email_job_alerts enabled.
+    1. Seeker has email_job_alerts or push_job_alerts (in-app) enabled.
     2. Job Type match (or seeker has no preference).
     3. Experience Level match (or seeker has no preference).
     4. Location match:
        - Direct city/location match.
        - OR Job is remote and seeker is open to remote.
     5. Salary: Job salary_max >= Seeker min_salary (if set).
-    6. Skills match: Seeker skills found in Job title or description.
+    6. Skills match: one of the seeker's skills appears in the job title,
+       description or requirements (or the seeker has not listed any skills).
+       Resolved through the seeker_skills inverted index. A seeker whose
+       skills are all too short or long to index has listed skills but no
+       index rows, and matches no job (as with the substring match before).
     """
     # 1. Base query: Seeker with notification settings enabled
-    query = db.query(models.SeekerProfile).join(
+    query = db.query(
+        models.SeekerProfile,
+        models.UserSettings.email_job_alerts,
+        models.UserSettings.push_job_alerts
+    ).join(
         models.UserSettings, 
         models.UserSettings.user_id == models.SeekerProfile.user_id
-    ).filter(
-        models.UserSettings.email_job_alerts == True
-    )
+    ).filter(or_(
+        models.UserSettings.email_job_alerts == True,
+        models.UserSettings.push_job_alerts == True
+    )).options(joinedload(models.SeekerProfile.user)) # Email addresses, without a query per seeker
 
     # 2. Job Type Filter
     if job.job_type:
@@ -43,10 +55,22 @@ def match_seekers_for_job(db: Session, job: models.Job):
     # For now, we'll skip strict salary filtering if it's not a clean integer, 
     # or implement a helper to parse it.
 
+    # 6. Skills Filter: index lookup of the phrases found in the job text
+    skill_matches = db.query(models.SeekerSkill.seeker_id).filter(
+        skill_in(models.SeekerSkill.skill, job_skill_terms(job), db.get_bind().dialect.name)
+    )
+    # "Listed no skills" is the profile field, not the index: unindexable skills still count as listed
+    no_skills = or_(models.SeekerProfile.skills == None, models.SeekerProfile.skills == "")
+    query = query.filter(or_(
+        models.SeekerProfile.id.in_(skill_matches),
+        no_skills
+    ))
+
     potential_matches = query.all()
     final_matches = []
 
-    for seeker in potential_matches:
+    for row in potential_matches:
+        seeker = row[0]
         is_match = True
         
         # 5. Location Matching
@@ -63,24 +87,17 @@ def match_seekers_for_job(db: Session, job: models.Job):
         if not loc_match:
             is_match = False
 
-        # 6. Skills Matching (CV field / Skills string)
-        if is_match and seeker.skills:
-            seeker_skills = [s.strip().lower() for s in seeker.skills.split(',')]
-            job_text = f"{job.title} {job.description} {job.requirements}".lower()
-            
-            # Match if at least one skill is mentioned
-            skills_found = any(skill in job_text for skill in seeker_skills if len(skill) > 2)
-            if not skills_found:
-                is_match = False
-
         if is_match:
-            final_matches.append(seeker)
+            final_matches.append(row)
 
     return final_matches
 
+@task("trigger_job_alerts")
 def trigger_job_alerts(db: Session, job_id: int):
     """
-    Called as a background task.
+    Runs on the task worker. Queues the alert emails and in-app
+    notifications without committing; the worker commits them together
+    with the task's completion, so a retried task doesn't alert twice.
     """
     job = db.query(models.Job).filter(models.Job.id == job_id).first()
     if not job:
@@ -93,13 +110,22 @@ def trigger_job_alerts(db: Session, job_id: int):
 
     matches = match_seekers_for_job(db, job)
     
-    for seeker in matches:
-        if seeker.user and seeker.user.email:
+    notifications = []
+    for seeker, email_alerts, push_alerts in matches:
+        if email_alerts and seeker.user and seeker.user.email:
             send_job_alert(
                 to_email=seeker.user.email,
                 job_title=job.title,
                 company_name=company_name,
-                job_id=job.id
+                job_id=job.id,
+                db=db
             )
+        if push_alerts:
+            notifications.append({
+                "user_id": seeker.user_id,
+                "title": "New Job Match",
+                "message": f"{job.title} at {company_name} matches your profile"
+            })
+    crud.create_notifications(db, notifications)
     
     print(f"Triggered alerts for {len(matches)} seekers for Job {job_id}")
@@ -0,0 +1,187 @@
+import asyncio
+import json
+import threading
+from collections import defaultdict
+from sqlalchemy import event, text
+from sqlalchemy.engine import make_url
+from sqlalchemy.orm import Session
+from ..config import settings
+
+# Push of new notifications to the browser (GET /notifications/stream, SSE).
+#
+# crud queues every notification it creates with publish_on_commit(); once
+# the transaction commits the hub hands it to the streams of that user open
+# in this process. With the Postgres bridge (NOTIFICATION_PUBSUB=postgres,
+# the default on Postgres) it is sent with pg_notify instead, which Postgres
+# delivers on commit to every API worker LISTENing, so notifications created
+# in another worker or in the task worker reach the stream too. Without the
+# bridge only notifications created by this API process are pushed.
+
+CHANNEL = "notifications"
+MAX_NOTIFY_PAYLOAD = 7900 # Postgres caps a NOTIFY payload at 8000 bytes
+_PENDING_KEY = "pending_notifications"
+
+def bridge_enabled():
+    if settings.NOTIFICATION_PUBSUB != "auto":
+        return settings.NOTIFICATION_PUBSUB == "postgres"
+    return make_url(settings.DATABASE_URL).get_backend_name() == "postgresql"
+
+def to_event(notification):
+    # Same fields as schemas.NotificationResponse
+    return {
+        "id": notification["id"],
+        "user_id": notification["user_id"],
+        "title": notification["title"],
+        "message": notification["message"],
+        "is_read": bool(notification.get("is_read")),
+        "created_at": notification["created_at"].isoformat() if notification.get("created_at") else None,
+    }
+
+def _notify_payloads(events):
+    # Packs the events into as few NOTIFY payloads as fit the size limit
+    payloads, batch, size = [], [], 2
+    for e in events:
+        item = json.dumps(e)
+        if len(item) + 2 > MAX_NOTIFY_PAYLOAD:
+            # Too long to push whole; the client has the full text on its next fetch
+            e = dict(e, message=e["message"][:1000] + "...")
+            item = json.dumps(e)
+        if batch and size + len(item) + 1 > MAX_NOTIFY_PAYLOAD:
+            payloads.append("[" + ",".join(batch) + "]")
+            batch, size = [], 2
+        batch.append(item)
+        size += len(item) + 1
+    if batch:
+        payloads.append("[" + ",".join(batch) + "]")
+    return payloads
+
+def has_listeners():
+    """
+    Whether anything can receive a push from this process. When not,
+    callers can skip building the events (e.g. RETURNING the new ids).
+    """
+    return bridge_enabled() or notification_hub.subscriber_count() > 0
+
+def publish_on_commit(db: Session, notifications):
+    """
+    Pushes the notifications (dicts with the Notification columns) to their
+    users' streams once db's transaction commits; nothing is pushed if it
+    rolls back.
+    """
+    events = [to_event(n) for n in notifications]
+    if not events:
+        return
+    if bridge_enabled():
+        # NOTIFY is transactional: Postgres sends it on commit, drops it on rollback
+        db.execute(
+            text("SELECT pg_notify(:channel, payload) FROM unnest(CAST(:payloads AS text[])) AS payload"),
+            {"channel": CHANNEL, "payloads": _notify_payloads(events)},
+        )
+    else:
+        db.info.setdefault(_PENDING_KEY, []).extend(events)
+
+@event.listens_for(Session, "after_commit")
+def _publish_pending(session):
+    events = session.info.pop(_PENDING_KEY, None)
+    if events:
+        notification_hub.publish(events)
+
+@event.listens_for(Session, "after_soft_rollback")
+def _drop_pending(session, previous_transaction):
+    if not previous_transaction.nested:
+        session.info.pop(_PENDING_KEY, None)
+
+class NotificationHub:
+    """
+    In-process pub/sub between whoever creates notifications (any thread)
+    and the SSE streams (on the event loop). Each stream subscribes with a
+    bounded queue; a stream that falls QUEUE_SIZE events behind is closed
+    and the client catches up by reconnecting with Last-Event-ID.
+    """
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._subscribers = defaultdict(set) # user_id -> set of asyncio.Queue
+        self._loop = None
+        self._listener = None
+        self._listener_task = None
+
+    def subscribe(self, user_id: int):
+        queue = asyncio.Queue(maxsize=settings.NOTIFICATION_STREAM_QUEUE_SIZE)
+        with self._lock:
+            self._subscribers[user_id].add(queue)
+        return queue
+
+    def unsubscribe(self, user_id: int, queue):
+        with self._lock:
+            queues = self._subscribers.get(user_id)
+            if queues is not None:
+                queues.discard(queue)
+                if not queues:
+                    del self._subscribers[user_id]
+
+    def subscriber_count(self):
+        with self._lock:
+            return sum(len(queues) for queues in self._subscribers.values())
+
+    def publish(self, events):
+        """
+        Hands the events to the matching streams. Safe to call from any
+        thread; a no-op until start() has run (e.g. outside the API).
+        """
+        loop = self._loop
+        if loop is None or loop.is_closed():
+            return
+        if not self._subscribers:
+            return
+        loop.call_soon_threadsafe(self._deliver, events)
+
+    def _deliver(self, events):
+        with self._lock:
+            targets = [(e, list(self._subscribers.get(e["user_id"], ()))) for e in events]
+        for e, queues in targets:
+            for queue in queues:
+                try:
+                    queue.put_nowait(e)
+                except asyncio.QueueFull:
+                    # Too slow: end the stream (None), the client reconnects and catches up
+                    while not queue.empty():
+                        queue.get_nowait()
+                    queue.put_nowait(None)
+                    self.unsubscribe(e["user_id"], queue)
+
+    def _on_notify(self, connection, pid, channel, payload):
+        try:
+            self._deliver(json.loads(payload))
+        except ValueError as e:
+            print(f"Ignoring malformed notification payload: {e}")
+
+    async def _listen(self):
+        # Keeps a LISTEN connection open, reconnecting if it drops
+        import asyncpg
+        dsn = make_url(settings.DATABASE_URL).set(drivername="postgresql").render_as_string(hide_password=False)
+        while True:
+            try:
+                if self._listener is None or self._listener.is_closed():
+                    self._listener = await asyncpg.connect(dsn)
+                    await self._listener.add_listener(CHANNEL, self._on_notify)
+                    print("Listening for notifications on Postgres")
+            except Exception as e:
+                print(f"Notification listener could not connect, retrying: {e}")
+                self._listener = None
+            await asyncio.sleep(settings.NOTIFICATION_LISTEN_CHECK_SECONDS)
+
+    async def start(self):
+        self._loop = asyncio.get_running_loop()
+        if bridge_enabled():
+            self._listener_task = asyncio.create_task(self._listen())
+
+    async def stop(self):
+        if self._listener_task is not None:
+            self._listener_task.cancel()
+            self._listener_task = None
+        if self._listener is not None and not self._listener.is_closed():
+            await self._listener.close()
+        self._listener = None
+        self._loop = None
+
+notification_hub = NotificationHub()
@@ -0,0 +1,101 @@
+import base64
+import json
+from datetime import datetime
+from sqlalchemy import DateTime, String, TypeDecorator, literal, tuple_
+
+# Keyset ("cursor") pagination.
+#
+# Lists are ordered newest first on (sort_column, id) and the next page is
+# fetched with WHERE (sort_column, id) < (last_sort_value, last_id), so the
+# database seeks straight to the page instead of scanning OFFSET rows, and
+# rows inserted meanwhile never shift results between pages.
+#
+# The cursor is opaque to clients: base64 of the last row's key values.
+# It is returned in the X-Next-Cursor response header when the page is full.
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+class InvalidCursor(ValueError):
+    pass
+
+def _encode_value(value):
+    if isinstance(value, datetime):
+        return {"dt": value.isoformat()}
+    return value
+
+def _decode_value(value):
+    if isinstance(value, dict) and "dt" in value:
+        return datetime.fromisoformat(value["dt"])
+    return value
+
+def encode_cursor(*values):
+    payload = json.dumps([_encode_value(v) for v in values], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode()
+
+def decode_cursor(cursor: str, size: int = 2):
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        values = [_decode_value(v) for v in values]
+    except (ValueError, TypeError):
+        raise InvalidCursor("Invalid pagination cursor")
+    if not isinstance(values, list) or len(values) != size:
+        raise InvalidCursor("Invalid pagination cursor")
+    return values
+
+class KeysetDateTime(TypeDecorator):
+    """
+    Type a datetime cursor value is bound with for comparison with its sort
+    column. On SQLite datetimes are stored as text and compared as text,
+    and a plain DateTime bind would be 'YYYY-MM-DD HH:MM:SS.ffffff' while
+    CURRENT_TIMESTAMP defaults are stored as 'YYYY-MM-DD HH:MM:SS' (the row
+    the cursor came from would then sort before its own key). The value is
+    bound in the stored form instead, so the bare column (and its index)
+    is what gets compared and ordered on.
+    """
+    impl = DateTime
+    cache_ok = True
+
+    def load_dialect_impl(self, dialect):
+        if dialect.name == "sqlite":
+            return dialect.type_descriptor(String())
+        return dialect.type_descriptor(DateTime(timezone=True))
+
+    def process_bind_param(self, value, dialect):
+        if dialect.name == "sqlite" and value is not None:
+            # Server defaults have no fraction, ORM-written values six digits
+            return value.strftime("%Y-%m-%d %H:%M:%S.%f" if value.microsecond else "%Y-%m-%d %H:%M:%S")
+        return value
+
+def _check_value(value, column):
+    # A cursor is client input: wrong types would fail in the database (500) instead of a 400
+    if isinstance(column.type, DateTime):
+        valid = isinstance(value, datetime)
+    else:
+        valid = isinstance(value, (int, float)) and not isinstance(value, bool)
+    if not valid:
+        raise InvalidCursor("Invalid pagination cursor")
+    return value
+
+def apply_keyset(query, sort_column, id_column, cursor: str = None):
+    """
+    Orders the query newest first on (sort_column, id_column) and, if a
+    cursor is given, skips to the rows that come after it.
+    """
+    if cursor:
+        sort_value, id_value = decode_cursor(cursor)
+        _check_value(sort_value, sort_column)
+        if not isinstance(id_value, int) or isinstance(id_value, bool):
+            raise InvalidCursor("Invalid pagination cursor")
+        query = query.filter(
+            tuple_(sort_column, id_column) < tuple_(literal(sort_value, KeysetDateTime() if isinstance(sort_column.type, DateTime) else sort_column.type), literal(id_value, id_column.type))
+        )
+    return query.order_by(sort_column.desc(), id_column.desc())
+
+def next_cursor(items, limit: int, sort_attr: str):
+    """
+    Returns the cursor for the page after `items`, or None when this was the last page.
+    """
+    if not limit or len(items) < limit:
+        return None
+    last = items[-1]
+    return encode_cursor(getattr(last, sort_attr), last.id)
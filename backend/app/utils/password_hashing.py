@@ -0,0 +1,105 @@
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor, TimeoutError as FutureTimeout
+from concurrent.futures.process import BrokenProcessPool
+from passlib.context import CryptContext
+from ..config import settings
+
+# Argon2 is deliberately CPU- and memory-hard. Hashing runs in a dedicated
+# process pool so logins and registrations don't starve the request
+# threadpool (or hold the GIL), and the number of hashes in flight is
+# bounded: once PASSWORD_HASH_WORKERS + PASSWORD_HASH_QUEUE_SIZE requests
+# are queued, new ones fail fast with HashingBusy (served as 429).
+
+pwd_context = CryptContext(
+    schemes=["argon2"],
+    deprecated="auto",
+    argon2__rounds=settings.ARGON2_TIME_COST,
+    argon2__memory_cost=settings.ARGON2_MEMORY_COST,
+    argon2__parallelism=settings.ARGON2_PARALLELISM,
+)
+
+class HashingBusy(Exception):
+    pass
+
+def _hash(password: str):
+    return pwd_context.hash(password)
+
+def _verify_and_update(password: str, hashed_password: str):
+    # (verified, new_hash); new_hash is set when the stored hash uses outdated parameters
+    return pwd_context.verify_and_update(password, hashed_password)
+
+class HashingPool:
+    def __init__(self, workers: int, queue_size: int):
+        self.workers = workers
+        self._slots = threading.BoundedSemaphore(max(workers, 1) + queue_size)
+        self._executor = None
+        self._lock = threading.Lock()
+
+    def _get_executor(self):
+        with self._lock:
+            if self._executor is None:
+                # spawn, not fork: the API process has running threads
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=multiprocessing.get_context("spawn")
+                )
+            return self._executor
+
+    def _discard(self, executor):
+        # Drops a broken pool so the next call starts a fresh one
+        with self._lock:
+            if self._executor is executor:
+                self._executor = None
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    def _run(self, fn, *args):
+        if not self._slots.acquire(blocking=False):
+            raise HashingBusy("Too many password operations in progress, please retry shortly")
+        executor = self._get_executor()
+        try:
+            future = executor.submit(fn, *args)
+        except BaseException as e:
+            self._slots.release()
+            if isinstance(e, BrokenProcessPool):
+                self._discard(executor)
+            raise
+        # The slot is held until the hash is done, not just until we stop waiting
+        # for it, so timed-out work still counts against the bound
+        future.add_done_callback(lambda _: self._slots.release())
+        try:
+            return future.result(timeout=settings.PASSWORD_HASH_TIMEOUT)
+        except BrokenProcessPool:
+            self._discard(executor)
+            raise
+        except FutureTimeout:
+            raise HashingBusy("Password hashing is taking too long, please retry shortly")
+
+    def run(self, fn, *args):
+        if self.workers <= 0:
+            # Inline mode (PASSWORD_HASH_WORKERS=0), e.g. for tests
+            if not self._slots.acquire(blocking=False):
+                raise HashingBusy("Too many password operations in progress, please retry shortly")
+            try:
+                return fn(*args)
+            finally:
+                self._slots.release()
+        try:
+            return self._run(fn, *args)
+        except BrokenProcessPool:
+            # A worker died (e.g. OOM-killed) and took the pool down with it; retry once on a fresh pool
+            return self._run(fn, *args)
+
+    def shutdown(self):
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False, cancel_futures=True)
+                self._executor = None
+
+hashing_pool = HashingPool(settings.PASSWORD_HASH_WORKERS, settings.PASSWORD_HASH_QUEUE_SIZE)
+
+def hash_password(password: str):
+    return hashing_pool.run(_hash, password)
+
+def verify_and_update(password: str, hashed_password: str):
+    return hashing_pool.run(_verify_and_update, password, hashed_password)
@@ -0,0 +1,60 @@
+import json
+import time
+from .. import crud, models
+from . import cv_features, match_scoring
+from .task_queue import task
+
+# Job fields match_scoring reads; editing anything else leaves scores as they are
+SCORED_JOB_FIELDS = {"title", "description", "requirements", "experience_level", "job_type", "location", "salary_max"}
+
+RESCORE_CHUNK_SIZE = 5000 # Applications written per UPDATE / transaction
+
+def _cv_skills(db, rows):
+    # Stored CV features for each row; CVs without current features are computed (and saved) here
+    skills, stale = {}, {}
+    for i, row in enumerate(rows):
+        if row.cv_id is None:
+            continue
+        features = json.loads(row.features_json) if row.features_json else None
+        if features and features.get("version") == cv_features.FEATURES_VERSION:
+            skills[i] = features["skills"]
+        else:
+            stale.setdefault(row.cv_id, []).append(i)
+    if stale:
+        for cv in db.query(models.CV).filter(models.CV.id.in_(stale.keys())):
+            for i in stale[cv.id]:
+                skills[i] = cv_features.get_features(cv)["skills"]
+        db.commit()
+    return skills
+
+@task("rescore_job_applications", max_concurrency=1)
+def rescore_job_applications(db, job_id: int, chunk_size: int = RESCORE_CHUNK_SIZE):
+    """
+    Recomputes match_score for every application to the job, e.g. after the
+    employer edits it. Loads the applicants in one query, scores them in one
+    vectorized batch and writes back only the scores that changed, chunk_size
+    rows per UPDATE. Runs on the task worker (one at a time, it is CPU and
+    write heavy); safe to re-run. Returns the number of applications whose
+    score changed.
+    """
+    started = time.monotonic()
+    job = crud.get_job(db, job_id, with_content=True)
+    if not job:
+        print(f"Job {job_id} not found for re-scoring")
+        return 0
+
+    rows = crud.get_applicants_for_scoring(db, job_id)
+    matrix, min_salaries = match_scoring.seeker_matrix(rows, _cv_skills(db, rows))
+    scores = match_scoring.score_matrix(job, matrix, min_salaries)
+    changed = [
+        {"id": row.id, "match_score": float(score)}
+        for row, score in zip(rows, scores)
+        if row.match_score is None or abs(row.match_score - score) >= 0.05
+    ]
+
+    for start in range(0, len(changed), chunk_size):
+        crud.update_match_scores(db, changed[start:start + chunk_size])
+        print(f"Re-scoring job {job_id}: {min(start + chunk_size, len(changed))}/{len(changed)} updated")
+
+    print(f"Re-scored {len(rows)} applications for job {job_id} in {time.monotonic() - started:.2f}s ({len(changed)} changed)")
+    return len(changed)
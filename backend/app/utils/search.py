@@ -0,0 +1,84 @@
+import re
+from sqlalchemy import column, func, literal_column, table
+from sqlalchemy.orm import Query
+from .. import models
+
+# Full-text search over jobs.title / description / requirements.
+#
+# PostgreSQL: a `search_vector` tsvector column (weighted title >
+# description > requirements) backed by a GIN index. The column is
+# maintained by a trigger on every INSERT/UPDATE of those fields.
+# SQLite: an external-content FTS5 table `jobs_fts` kept in sync by triggers.
+# Both are created by migration 0002 (migrations/versions/0002_job_search.py).
+#
+# Any other backend falls back to the old ILIKE scan.
+
+TS_CONFIG = "english"
+HIGHLIGHT_START = "<mark>"
+HIGHLIGHT_STOP = "</mark>"
+
+jobs_fts = table("jobs_fts", column("rowid"))
+
+def search_terms(search: str):
+    """
+    Splits raw user input into plain word tokens so that operators and
+    punctuation typed into the search box can never break the query syntax.
+    """
+    return re.findall(r"\w+", search.lower())
+
+def _postgres_tsquery(terms):
+    # Prefix-match every term so results show up while the user is still typing.
+    return func.to_tsquery(TS_CONFIG, " & ".join(f"{term}:*" for term in terms))
+
+def _sqlite_match(terms):
+    return " ".join(f'"{term}"*' for term in terms)
+
+def apply_job_search(query: Query, search: str, rank: bool = False, highlight: bool = False):
+    """
+    Filters a Job query by full-text relevance and orders it best match first.
+
+    Returns the query plus the names of the extra columns that were added
+    (`rank` and/or `highlight`), so the caller can unpack rows accordingly.
+    """
+    terms = search_terms(search)
+    if not terms:
+        return query, []
+
+    dialect = query.session.get_bind().dialect.name
+    extra_columns = []
+
+    if dialect == "postgresql":
+        tsquery = _postgres_tsquery(terms)
+        vector = literal_column("jobs.search_vector")
+        score = func.ts_rank_cd(vector, tsquery)
+        query = query.filter(vector.op("@@")(tsquery)).order_by(score.desc(), models.Job.id.desc())
+        if rank:
+            query = query.add_columns(score.label("rank"))
+            extra_columns.append("rank")
+        if highlight:
+            options = f"StartSel={HIGHLIGHT_START}, StopSel={HIGHLIGHT_STOP}, MaxFragments=2, MaxWords=25, MinWords=8"
+            headline = func.ts_headline(TS_CONFIG, func.coalesce(models.Job.description, ""), tsquery, options)
+            query = query.add_columns(headline.label("highlight"))
+            extra_columns.append("highlight")
+
+    elif dialect == "sqlite":
+        query = query.join(jobs_fts, jobs_fts.c.rowid == models.Job.id).filter(literal_column("jobs_fts").op("MATCH")(_sqlite_match(terms)))
+        # bm25() is "lower is better", flip the sign so higher rank means more relevant
+        score = -func.bm25(literal_column("jobs_fts"), 10.0, 5.0, 2.0)
+        query = query.order_by(score.desc(), models.Job.id.desc())
+        if rank:
+            query = query.add_columns(score.label("rank"))
+            extra_columns.append("rank")
+        if highlight:
+            snippet = func.snippet(literal_column("jobs_fts"), 1, HIGHLIGHT_START, HIGHLIGHT_STOP, "…", 24)
+            query = query.add_columns(snippet.label("highlight"))
+            extra_columns.append("highlight")
+
+    else:
+        search_filter = f"%{search}%"
+        query = query.filter(
+            (models.Job.title.ilike(search_filter)) |
+            (models.Job.description.ilike(search_filter))
+        )
+
+    return query, extra_columns
@@ -0,0 +1,107 @@
+import html
+import re
+
+# Skill and certification extraction from CV text / HTML.
+#
+# All skill keywords are compiled once, at import, into a single alternation
+# regex that is run over the text in one pass. The pattern sits inside a
+# lookahead so matches are zero-width: every position is tried, and
+# overlapping skills are all found ("google analytics" and "analytics").
+# Only a shorter skill starting at the same position as a longer one is
+# hidden by it ("react" inside "react native"); those are added back from
+# the IMPLIED table below.
+
+SKILL_KEYWORDS = [
+    # Tech & Development
+    "python", "javascript", "typescript", "react", "node.js", "next.js",
+    "html", "css", "tailwind", "sql", "postgresql", "mongodb",
+    "docker", "kubernetes", "aws", "azure", "google cloud", "ci/cd",
+    "git", "java", "c++", "go", "rust", "flutter", "react native",
+    # Design & Creative
+    "figma", "ui/ux", "adobe xd", "photoshop", "illustrator", "branding",
+    "graphic design", "product design", "user research", "prototyping",
+    # Marketing & Growth
+    "marketing", "digital marketing", "seo", "sem", "content writing",
+    "copywriting", "social media", "email marketing", "google analytics",
+    "growth hacking", "public relations", "advertising",
+    # Business & Management
+    "agile", "scrum", "project management", "product management", "leadership",
+    "strategy", "business development", "sales", "crm", "operations",
+    "stakeholder management", "strategic planning", "financial analysis",
+    # Data & AI
+    "analytics", "data science", "machine learning", "tensorflow", "pytorch",
+    "pandas", "numpy", "powerbi", "tableau", "big data", "r", "nlp",
+    # HR & Professional
+    "recruitment", "human resources", "talent acquisition", "training",
+    "coaching", "soft skills", "communication", "negotiation", "customer success"
+]
+
+def _build_skill_pattern(keywords):
+    # Longest first, so at each position the regex prefers "react native" over "react".
+    # (?<!\w) / (?!\w) instead of \b so skills ending in symbols ("c++") still match.
+    alternation = "|".join(re.escape(k) for k in sorted(keywords, key=len, reverse=True))
+    return re.compile(rf"(?<!\w)(?=({alternation})(?!\w))")
+
+def _build_implied(keywords):
+    # {"react native": ["react"]}: matching the longer skill means the shorter one is present too
+    implied = {}
+    for long in keywords:
+        for short in keywords:
+            if long != short and long.startswith(short) and not re.match(r"\w", long[len(short)]):
+                implied.setdefault(long, []).append(short)
+    return implied
+
+SKILL_PATTERN = _build_skill_pattern(SKILL_KEYWORDS)
+IMPLIED = _build_implied(SKILL_KEYWORDS)
+_KEYWORD_ORDER = {k: i for i, k in enumerate(SKILL_KEYWORDS)}
+
+# Bounded word runs (at most 4 words around the marker) keep these linear on
+# large CVs, an unbounded [\w\s]+ backtracks over every long run of words.
+CERT_PATTERNS = [re.compile(p) for p in [
+    r'certified(?:\s+\w+){1,4}',
+    r'(?:\w+\s+){1,4}certification',
+    r'(?:\w+\s+){1,4}certified',
+    r'aws(?:\s+\w+){1,4}',
+    r'google(?:\s+\w+){1,4}\s+certified',
+    r'microsoft(?:\s+\w+){1,4}'
+]]
+
+_NON_CONTENT_RE = re.compile(r"<(script|style)\b.*?</\1\s*>", re.IGNORECASE | re.DOTALL)
+_TAG_RE = re.compile(r"<[^>]*>")
+
+def strip_html(text: str):
+    """
+    Plain text of a CV: drops <script>/<style> blocks and tags (so CSS and
+    attribute names aren't mistaken for skills) and decodes entities.
+    """
+    if "<" in text:
+        text = _TAG_RE.sub(" ", _NON_CONTENT_RE.sub(" ", text))
+    if "&" in text:
+        text = html.unescape(text)
+    return text
+
+def extract_skills_from_text(text: str):
+    """
+    Returns the known skills mentioned in the text, in SKILL_KEYWORDS order.
+    """
+    if not text:
+        return []
+
+    found = set()
+    for match in SKILL_PATTERN.finditer(strip_html(text).lower()):
+        found.add(match.group(1))
+    for skill in list(found):
+        found.update(IMPLIED.get(skill, ()))
+    return sorted(found, key=_KEYWORD_ORDER.__getitem__)
+
+def extract_certifications(text: str):
+    if not text:
+        return []
+
+    certs = []
+    text_lower = strip_html(text).lower()
+    for pattern in CERT_PATTERNS:
+        for match in pattern.finditer(text_lower):
+            certs.append(" ".join(match.group().split()).title())
+
+    return list(set(certs))[:5] # Limit to top 5
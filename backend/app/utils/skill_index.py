@@ -0,0 +1,68 @@
+import json
+import re
+from sqlalchemy import String, any_, bindparam, func, literal_column, select
+from sqlalchemy.dialects.postgresql import ARRAY
+
+# Inverted skill index (seeker_skills table): one row per (normalized skill, seeker).
+#
+# Seeker skills and job text go through the same tokenizer, so a job matches
+# a seeker when one of the seeker's skills appears in the job as a whole
+# word or phrase. Matching a new job is then a single indexed
+# `skill IN (<phrases found in the job>)` lookup instead of a scan of every
+# seeker profile. The phrases go to the database as a single parameter (see
+# skill_in), a long posting yields thousands of them.
+
+MIN_SKILL_LENGTH = 3 # Skills shorter than this are too ambiguous to match on
+MAX_SKILL_WORDS = 3 # Longest phrase (in words) we index, e.g. "google cloud platform"
+
+# Keep characters that are part of skill names (node.js, c++, c#, ci/cd, ui/ux)
+_TOKEN_RE = re.compile(r"[a-z0-9+#][a-z0-9+#./-]*")
+
+def _tokens(text: str):
+    # Drop trailing punctuation, e.g. the full stop in "We use Python."
+    return [t.rstrip("./-") or t for t in _TOKEN_RE.findall(text.lower())]
+
+def normalize_skill(skill: str):
+    return " ".join(_tokens(skill))
+
+def seeker_skill_tokens(skills: str):
+    """
+    Parses the comma-separated SeekerProfile.skills string into the set of
+    normalized skills stored in the index.
+    """
+    if not skills:
+        return set()
+    tokens = set()
+    for raw in skills.split(','):
+        skill = normalize_skill(raw)
+        if len(skill) >= MIN_SKILL_LENGTH and len(skill.split(' ')) <= MAX_SKILL_WORDS:
+            tokens.add(skill)
+    return tokens
+
+def job_skill_terms(job):
+    """
+    Returns every word / phrase (up to MAX_SKILL_WORDS long) in the job's
+    title, description and requirements, normalized like seeker skills.
+    """
+    words = _tokens(f"{job.title or ''} {job.description or ''} {job.requirements or ''}")
+    terms = set()
+    for size in range(1, MAX_SKILL_WORDS + 1):
+        for i in range(len(words) - size + 1):
+            term = " ".join(words[i:i + size])
+            if len(term) >= MIN_SKILL_LENGTH:
+                terms.add(term)
+    return terms
+
+def skill_in(column, terms, dialect_name: str):
+    """
+    `column IN terms` with all the terms bound as one parameter: an array on
+    PostgreSQL, a JSON list unpacked with json_each on SQLite. One bind
+    parameter per term would run into the driver's and SQLite's limits.
+    """
+    terms = sorted(terms)
+    if dialect_name == "postgresql":
+        return column == any_(bindparam("skill_terms", terms, type_=ARRAY(String)))
+    if dialect_name == "sqlite":
+        values = select(literal_column("value")).select_from(func.json_each(bindparam("skill_terms", json.dumps(terms))))
+        return column.in_(values)
+    return column.in_(terms)
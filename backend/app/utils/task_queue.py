@@ -0,0 +1,37 @@
+import json
+from sqlalchemy.orm import Session
+from .. import models
+
+# Durable background tasks (task_queue table).
+#
+# The API queues work with enqueue() in its own transaction instead of
+# running it in-process after the response; the task worker
+# (python -m app.task_worker) runs it with a session of its own, retries
+# failures with backoff and re-runs tasks whose worker died.
+#
+# Handlers are registered by name with @task and called as
+# handler(db, **payload). Best is to leave the commit to the worker: the
+# handler's writes are then committed with the task's completion and a
+# failed attempt leaves nothing behind. Handlers that commit as they go
+# (e.g. in chunks) may be run again after a crash and must be safe to repeat.
+
+TASKS = {} # name -> (handler, max_concurrency)
+
+def task(name: str, max_concurrency: int = None):
+    """
+    Registers a task handler. max_concurrency caps how many of these a
+    worker process runs at the same time (None: up to the pool size).
+    """
+    def register(handler):
+        TASKS[name] = (handler, max_concurrency)
+        return handler
+    return register
+
+def enqueue(db: Session, name: str, **payload):
+    """
+    Queues a task in the caller's transaction, the caller commits. The
+    payload must be JSON serializable.
+    """
+    db_task = models.Task(name=name, payload=json.dumps(payload), status=models.TaskStatus.PENDING, attempts=0)
+    db.add(db_task)
+    return db_task
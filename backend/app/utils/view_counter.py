@@ -0,0 +1,143 @@
+import threading
+import time
+from collections import OrderedDict, defaultdict
+from fastapi import Request
+from jose import JWTError, jwt
+from .. import crud
+from ..config import settings
+from ..database import SessionLocal
+
+class ViewBuffer:
+    """
+    Aggregates job page views in memory and writes them with one batched
+    UPDATE every VIEW_FLUSH_INTERVAL_SECONDS, or sooner once
+    VIEW_FLUSH_THRESHOLD views are pending, instead of one UPDATE + commit
+    per page view.
+    
+    With VIEW_DEDUP_UNIQUE enabled, repeat views of a job by the same viewer
+    (see viewer_id) within VIEW_DEDUP_WINDOW_SECONDS are only counted once.
+    The views remembered for that are kept oldest first, expire as new ones
+    come in and are capped at VIEW_DEDUP_MAX_ENTRIES.
+    """
+    def __init__(self, session_factory=SessionLocal):
+        self._session_factory = session_factory
+        self._lock = threading.Lock()
+        self._counts = defaultdict(int)
+        self._pending = 0
+        self._seen = OrderedDict() # (job_id, viewer) -> time of the counted view, oldest first
+        self._flush_requested = threading.Event()
+        self._stopped = threading.Event()
+        self._thread = None
+
+    def record(self, job_id: int, viewer: str = None):
+        """
+        Counts one view of the job. Returns False if it was dropped as a duplicate.
+        """
+        with self._lock:
+            if settings.VIEW_DEDUP_UNIQUE and viewer:
+                now = time.monotonic()
+                self._expire_seen(now)
+                key = (job_id, viewer)
+                if key in self._seen:
+                    return False
+                self._seen[key] = now
+                if len(self._seen) > settings.VIEW_DEDUP_MAX_ENTRIES:
+                    self._seen.popitem(last=False)
+            self._counts[job_id] += 1
+            self._pending += 1
+            if self._pending >= settings.VIEW_FLUSH_THRESHOLD:
+                # Let the flusher thread write it, keeping DB work off the request
+                self._flush_requested.set()
+        return True
+
+    def flush(self):
+        """
+        Writes all pending views to the database. Returns the number of views written.
+        """
+        with self._lock:
+            counts, self._counts = self._counts, defaultdict(int)
+            pending, self._pending = self._pending, 0
+        if not counts:
+            return 0
+
+        db = self._session_factory()
+        try:
+            crud.increment_job_views(db, dict(counts))
+            return pending
+        except Exception as e:
+            db.rollback()
+            print(f"Failed to flush job views, will retry: {e}")
+            # Put the counts back so they are written on the next flush
+            with self._lock:
+                for job_id, count in counts.items():
+                    self._counts[job_id] += count
+                self._pending += pending
+            return 0
+        finally:
+            db.close()
+
+    def _expire_seen(self, now: float):
+        # Entries are in time order, so only the expired ones at the front are looked at
+        cutoff = now - settings.VIEW_DEDUP_WINDOW_SECONDS
+        while self._seen:
+            key, seen_at = next(iter(self._seen.items()))
+            if seen_at > cutoff:
+                break
+            del self._seen[key]
+
+    def _run(self):
+        while not self._stopped.is_set():
+            self._flush_requested.wait(settings.VIEW_FLUSH_INTERVAL_SECONDS)
+            self._flush_requested.clear()
+            self.flush()
+
+    def start(self):
+        if self._thread is None:
+            self._stopped.clear()
+            self._thread = threading.Thread(target=self._run, name="view-buffer-flusher", daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        """
+        Stops the flusher thread and writes out whatever is still buffered.
+        """
+        if self._thread is not None:
+            self._stopped.set()
+            self._flush_requested.set()
+            self._thread.join()
+            self._thread = None
+        self.flush()
+
+def client_address(request: Request):
+    """
+    The address of the client, looking through X-Forwarded-For when the
+    request came from one of TRUSTED_PROXIES (otherwise the header could be
+    anything the client wanted).
+    """
+    host = request.client.host if request.client else None
+    if host not in settings.TRUSTED_PROXIES:
+        return host
+    forwarded = [a.strip() for a in request.headers.get("x-forwarded-for", "").split(",") if a.strip()]
+    # Rightmost first: each proxy appends the address it got the request from
+    for address in reversed(forwarded):
+        if address not in settings.TRUSTED_PROXIES:
+            return address
+    return host
+
+def viewer_id(request: Request):
+    """
+    Who is viewing, for deduplication: the signed-in user when the request
+    carries a valid token, else the client address.
+    """
+    authorization = request.headers.get("authorization", "")
+    if authorization.lower().startswith("bearer "):
+        try:
+            subject = jwt.decode(authorization[7:], settings.SECRET_KEY, algorithms=[settings.ALGORITHM]).get("sub")
+        except JWTError:
+            subject = None
+        if subject:
+            return f"user:{subject}"
+    address = client_address(request)
+    return f"ip:{address}" if address else None
+
+view_buffer = ViewBuffer()
@@ -0,0 +1,159 @@
+"""
+Benchmark of the hot crud queries with and without the indexes added in
+models.py (migration 0005).
+
+Builds two throwaway SQLite databases with the same synthetic data, one with
+the pre-index schema and one with the current schema, then times each crud
+call and prints the plan of the SQL it ran:
+
+    cd backend && python bench_indexes.py [scale]
+
+scale=1 is 500 employers, 5k seekers, 10k jobs, 100k applications,
+100k notifications and 50k saved jobs; fractions (e.g. 0.1) work for a
+quick run. Postgres numbers differ in absolute terms but the plans (index
+seek vs. full scan) are the same story.
+"""
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+
+from sqlalchemy import MetaData, UniqueConstraint, create_engine, event, insert, text
+from sqlalchemy.orm import sessionmaker
+from app.database import Base
+from app import crud, models
+
+# Indexes and unique constraints introduced by migration 0005
+NEW_INDEXES = {
+    "ix_seeker_profiles_user_id", "ix_employer_profiles_user_id",
+    "ix_jobs_employer_status", "ix_jobs_created", "ix_jobs_open_created",
+    "ix_applications_job_applied", "ix_saved_jobs_seeker_created", "ix_saved_jobs_job_id",
+    "ix_cvs_seeker_created", "ix_interviews_employer_start", "ix_interviews_seeker_start",
+    "ix_interviews_application_id", "ix_notifications_user_created", "ix_interview_history_interview_id",
+    "uq_applications_seeker_job", "uq_saved_jobs_seeker_job",
+}
+REPEAT = 20
+
+def baseline_metadata():
+    metadata = MetaData()
+    for table in Base.metadata.sorted_tables:
+        copy = table.to_metadata(metadata)
+        for index in list(copy.indexes):
+            if index.name in NEW_INDEXES:
+                copy.indexes.discard(index)
+        for constraint in list(copy.constraints):
+            if isinstance(constraint, UniqueConstraint) and constraint.name in NEW_INDEXES:
+                copy.constraints.discard(constraint)
+    return metadata
+
+def populate(engine, scale):
+    rng = random.Random(42)
+    n_employers, n_seekers = max(int(500 * scale), 1), max(int(5000 * scale), 1)
+    n_jobs, n_apps = max(int(10000 * scale), 1), max(int(100000 * scale), 1)
+    now = datetime(2024, 1, 1)
+    statuses = [s.value for s in models.ApplicationStatus]
+
+    with engine.begin() as conn:
+        conn.execute(insert(models.User.__table__), [
+            {"id": i, "email": f"user{i}@example.com", "hashed_password": "x", "role": "seeker" if i <= n_seekers else "employer"}
+            for i in range(1, n_seekers + n_employers + 1)
+        ])
+        conn.execute(insert(models.SeekerProfile.__table__), [
+            {"id": i, "user_id": i, "first_name": f"Seeker{i}", "last_name": "Test"} for i in range(1, n_seekers + 1)
+        ])
+        conn.execute(insert(models.EmployerProfile.__table__), [
+            {"id": i, "user_id": n_seekers + i, "company_name": f"Company {i}"} for i in range(1, n_employers + 1)
+        ])
+        conn.execute(insert(models.Job.__table__), [
+            {"id": i, "employer_id": rng.randint(1, n_employers), "title": f"Job {i}",
+             "status": rng.choice(["open", "open", "open", "paused", "closed"]), "views": rng.randint(0, 500),
+             "created_at": now - timedelta(minutes=i)}
+            for i in range(1, n_jobs + 1)
+        ])
+        pairs = set()
+        while len(pairs) < n_apps:
+            pairs.add((rng.randint(1, n_seekers), rng.randint(1, n_jobs)))
+        conn.execute(insert(models.Application.__table__), [
+            {"seeker_id": s, "job_id": j, "status": rng.choice(statuses), "match_score": 50.0,
+             "applied_at": now - timedelta(minutes=rng.randint(0, 100000))}
+            for s, j in pairs
+        ])
+        conn.execute(insert(models.Notification.__table__), [
+            {"user_id": rng.randint(1, n_seekers), "title": "New job", "message": "A job matches your profile",
+             "created_at": now - timedelta(seconds=i)}
+            for i in range(n_apps)
+        ])
+        saved = {(rng.randint(1, n_seekers), rng.randint(1, n_jobs)) for _ in range(n_apps // 2)}
+        conn.execute(insert(models.SavedJob.__table__), [
+            {"seeker_id": s, "job_id": j, "created_at": now - timedelta(minutes=rng.randint(0, 100000))} for s, j in saved
+        ])
+        conn.execute(text("ANALYZE"))
+    return n_employers, n_seekers, n_jobs
+
+def queries(n_employers, n_seekers, n_jobs):
+    rng = random.Random(7)
+    employer_ids = [rng.randint(1, n_employers) for _ in range(REPEAT)]
+    seeker_ids = [rng.randint(1, n_seekers) for _ in range(REPEAT)]
+    job_ids = [rng.randint(1, n_jobs) for _ in range(REPEAT)]
+    return {
+        "get_employer_dashboard": lambda db, i: crud.get_employer_dashboard(db, employer_ids[i]),
+        "get_employer_jobs": lambda db, i: crud.get_employer_jobs(db, employer_ids[i]),
+        "get_employer_applications": lambda db, i: crud.get_employer_applications(db, employer_ids[i], limit=20),
+        "get_application_by_seeker_and_job": lambda db, i: crud.get_application_by_seeker_and_job(db, seeker_ids[i], job_ids[i]),
+        "get_saved_jobs_by_seeker": lambda db, i: crud.get_saved_jobs_by_seeker(db, seeker_ids[i], limit=20),
+        "get_notifications": lambda db, i: crud.get_notifications(db, seeker_ids[i], limit=20),
+        "get_jobs(status=open)": lambda db, i: crud.get_jobs(db, limit=20, status="open"),
+    }
+
+def plan(conn, statements):
+    # Plans of the statements a crud call ran (EXPLAIN on the same SQL and parameters)
+    steps = []
+    for sql, parameters in statements:
+        steps.extend(row[-1] for row in conn.exec_driver_sql("EXPLAIN QUERY PLAN " + sql, parameters))
+    return "; ".join(steps)
+
+def run(scale):
+    timings = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        for label, metadata in (("before", baseline_metadata()), ("after", Base.metadata)):
+            engine = create_engine(f"sqlite:///{tmp}/{label}.db")
+            metadata.create_all(engine)
+            start = time.perf_counter()
+            sizes = populate(engine, scale)
+            print(f"[{label}] populated in {time.perf_counter() - start:.1f}s")
+
+            Session = sessionmaker(bind=engine)
+            for name, fn in queries(*sizes).items():
+                db = Session()
+                try:
+                    executed = []
+                    def capture(conn, cursor, statement, parameters, context, executemany):
+                        executed.append((statement, parameters))
+                    event.listen(engine, "before_cursor_execute", capture)
+                    try:
+                        fn(db, 0)
+                    finally:
+                        event.remove(engine, "before_cursor_execute", capture)
+                    db.expunge_all()
+                    with engine.connect() as conn:
+                        print(f"    {name}: {plan(conn, executed)}")
+
+                    start = time.perf_counter()
+                    for i in range(REPEAT):
+                        fn(db, i)
+                        db.expunge_all()
+                    timings.setdefault(name, {})[label] = (time.perf_counter() - start) / REPEAT * 1000
+                finally:
+                    db.close()
+            engine.dispose()
+
+    print(f"\n{'query':40} {'before ms':>10} {'after ms':>10} {'speedup':>8}")
+    for name, t in timings.items():
+        print(f"{name:40} {t['before']:10.2f} {t['after']:10.2f} {t['before'] / max(t['after'], 1e-6):7.1f}x")
+
+if __name__ == "__main__":
+    run(float(sys.argv[1]) if len(sys.argv) > 1 else 1)
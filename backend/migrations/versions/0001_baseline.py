@@ -0,0 +1,190 @@
+"""baseline schema
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-17
+
+The schema as it was before migrations: what create_all() produced plus the
+columns added by the old one-off scripts (add_column.py, add_phone_column.py,
+create_cv_table.py, update_interviews_*.py, update_settings_db.py,
+update_jobs_db.py, migrate_views.py, migrate_settings.py, migrate_identity.py).
+
+It only creates what is missing, so it brings a fresh database, an old
+database that never ran some of those scripts, and an up-to-date one to
+the same state.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = '0001'
+down_revision = None
+branch_labels = None
+depends_on = None
+
+metadata = sa.MetaData()
+
+sa.Table('users', metadata,
+    sa.Column('id', sa.Integer(), primary_key=True, index=True),
+    sa.Column('email', sa.String(), nullable=False, unique=True, index=True),
+    sa.Column('hashed_password', sa.String(), nullable=False),
+    sa.Column('role', sa.String()),
+    sa.Column('is_active', sa.Boolean()),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now()),
+)
+
+sa.Table('seeker_profiles', metadata,
+    sa.Column('id', sa.Integer(), primary_key=True, index=True),
+    sa.Column('user_id', sa.Integer(), sa.ForeignKey('users.id')),
+    sa.Column('first_name', sa.String()),
+    sa.Column('last_name', sa.String()),
+    sa.Column('headline', sa.String()),
+    sa.Column('bio', sa.Text()),
+    sa.Column('location', sa.String()),
+    sa.Column('phone', sa.String()),
+    sa.Column('cv_url', sa.String()),
+    sa.Column('cv_html', sa.Text()),
+    sa.Column('skills', sa.Text()),
+    sa.Column('education', sa.Text()),
+    sa.Column('experience', sa.Text()),
+    sa.Column('job_type', sa.String()),
+    sa.Column('work_mode', sa.String()),
+    sa.Column('experience_level', sa.String()),
+    sa.Column('min_salary', sa.String()),
+    sa.Column('preferred_locations', sa.Text()),
+)
+
+sa.Table('employer_profiles', metadata,
+    sa.Column('id', sa.Integer(), primary_key=True, index=True),
+    sa.Column('user_id', sa.Integer(), sa.ForeignKey('users.id')),
+    sa.Column('first_name', sa.String()),
+    sa.Column('last_name', sa.String()),
+    sa.Column('phone', sa.String()),
+    sa.Column('company_name', sa.String()),
+    sa.Column('description', sa.Text()),
+    sa.Column('industry', sa.String()),
+    sa.Column('website', sa.String()),
+    sa.Column('location', sa.String()),
+    sa.Column('logo_url', sa.String()),
+)
+
+sa.Table('jobs', metadata,
+    sa.Column('id', sa.Integer(), primary_key=True, index=True),
+    sa.Column('employer_id', sa.Integer(), sa.ForeignKey('employer_profiles.id')),
+    sa.Column('title', sa.String(), index=True),
+    sa.Column('description', sa.Text()),
+    sa.Column('requirements', sa.Text()),
+    sa.Column('location', sa.String()),
+    sa.Column('salary_range', sa.String()),
+    sa.Column('salary_min', sa.Integer(), server_default='0'),
+    sa.Column('salary_max', sa.Integer(), server_default='0'),
+    sa.Column('job_type', sa.String()),
+    sa.Column('experience_level', sa.String()),
+    sa.Column('status', sa.String()),
+    sa.Column('views', sa.Integer(), server_default='0'),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now()),
+)
+
+sa.Table('cvs', metadata,
+    sa.Column('id', sa.Integer(), primary_key=True, index=True),
+    sa.Column('seeker_id', sa.Integer(), sa.ForeignKey('seeker_profiles.id')),
+    sa.Column('title', sa.String()),
+    sa.Column('content_html', sa.Text()),
+    sa.Column('content_json', sa.Text()),
+    sa.Column('file_url', sa.String()),
+    sa.Column('is_uploaded', sa.Boolean()),
+    sa.Column('is_primary', sa.Boolean()),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now()),
+)
+
+sa.Table('applications', metadata,
+    sa.Column('id', sa.Integer(), primary_key=True, index=True),
+    sa.Column('job_id', sa.Integer(), sa.ForeignKey('jobs.id')),
+    sa.Column('seeker_id', sa.Integer(), sa.ForeignKey('seeker_profiles.id')),
+    sa.Column('status', sa.String()),
+    sa.Column('match_score', sa.Float()),
+    sa.Column('cv_snapshot_url', sa.String()),
+    sa.Column('cover_letter', sa.Text()),
+    sa.Column('cv_id', sa.Integer(), sa.ForeignKey('cvs.id', ondelete='SET NULL')),
+    sa.Column('applied_at', sa.DateTime(timezone=True), server_default=sa.func.now()),
+)
+
+sa.Table('saved_jobs', metadata,
+    sa.Column('id', sa.Integer(), primary_key=True, index=True),
+    sa.Column('job_id', sa.Integer(), sa.ForeignKey('jobs.id')),
+    sa.Column('seeker_id', sa.Integer(), sa.ForeignKey('seeker_profiles.id')),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now()),
+)
+
+sa.Table('interviews', metadata,
+    sa.Column('id', sa.Integer(), primary_key=True, index=True),
+    sa.Column('application_id', sa.Integer(), sa.ForeignKey('applications.id')),
+    sa.Column('employer_id', sa.Integer(), sa.ForeignKey('employer_profiles.id')),
+    sa.Column('seeker_id', sa.Integer(), sa.ForeignKey('seeker_profiles.id')),
+    sa.Column('title', sa.String()),
+    sa.Column('description', sa.Text()),
+    sa.Column('start_time', sa.DateTime(timezone=True)),
+    sa.Column('end_time', sa.DateTime(timezone=True)),
+    sa.Column('location', sa.String()),
+    sa.Column('seeker_notes', sa.Text()),
+    sa.Column('status', sa.String()),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now()),
+)
+
+sa.Table('notifications', metadata,
+    sa.Column('id', sa.Integer(), primary_key=True, index=True),
+    sa.Column('user_id', sa.Integer(), sa.ForeignKey('users.id')),
+    sa.Column('title', sa.String()),
+    sa.Column('message', sa.Text()),
+    sa.Column('is_read', sa.Boolean()),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now()),
+)
+
+sa.Table('interview_history', metadata,
+    sa.Column('id', sa.Integer(), primary_key=True, index=True),
+    sa.Column('interview_id', sa.Integer(), sa.ForeignKey('interviews.id')),
+    sa.Column('user_id', sa.Integer(), sa.ForeignKey('users.id')),
+    sa.Column('message', sa.Text()),
+    sa.Column('status_at_time', sa.String()),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now()),
+)
+
+sa.Table('user_settings', metadata,
+    sa.Column('id', sa.Integer(), primary_key=True, index=True),
+    sa.Column('user_id', sa.Integer(), sa.ForeignKey('users.id'), unique=True),
+    sa.Column('email_job_alerts', sa.Boolean(), server_default=sa.true()),
+    sa.Column('email_application_updates', sa.Boolean(), server_default=sa.true()),
+    sa.Column('email_new_applicants', sa.Boolean(), server_default=sa.true()),
+    sa.Column('email_interview_responses', sa.Boolean(), server_default=sa.true()),
+    sa.Column('email_weekly_digest', sa.Boolean(), server_default=sa.false()),
+    sa.Column('push_job_alerts', sa.Boolean(), server_default=sa.true()),
+    sa.Column('push_messages', sa.Boolean(), server_default=sa.true()),
+    sa.Column('sms_interviews', sa.Boolean(), server_default=sa.true()),
+    sa.Column('profile_visible', sa.Boolean(), server_default=sa.true()),
+    sa.Column('show_salary', sa.Boolean(), server_default=sa.false()),
+    sa.Column('allow_messages', sa.Boolean(), server_default=sa.true()),
+    sa.Column('show_activity', sa.Boolean(), server_default=sa.false()),
+)
+
+def upgrade():
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+    existing_tables = set(inspector.get_table_names())
+
+    for table in metadata.sorted_tables:
+        if table.name not in existing_tables:
+            table.create(bind)
+            continue
+
+        # Legacy database: add the columns the one-off scripts used to add
+        columns = {c['name'] for c in inspector.get_columns(table.name)}
+        for column in table.columns:
+            if column.name not in columns:
+                op.add_column(table.name, column._copy())
+
+        indexes = {ix['name'] for ix in inspector.get_indexes(table.name)}
+        for index in table.indexes:
+            if index.name not in indexes:
+                index.create(bind)
+
+def downgrade():
+    metadata.drop_all(op.get_bind())
@@ -0,0 +1,126 @@
+"""full-text job search index
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-17
+
+PostgreSQL: weighted `search_vector` tsvector column on jobs, filled by a
+trigger, with a GIN index. SQLite: external-content FTS5 table `jobs_fts`
+kept in sync by triggers. The query side lives in app/utils/search.py.
+
+On PostgreSQL the column is added nullable without a default, so the
+ALTER doesn't rewrite jobs under an ACCESS EXCLUSIVE lock. The trigger
+fills it for new writes, existing rows are backfilled in short batches,
+and the index is built CONCURRENTLY. Jobs stay readable and writable
+throughout; search finds a job once its row is backfilled.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = '0002'
+down_revision = '0001'
+branch_labels = None
+depends_on = None
+
+TS_CONFIG = "english" # Must match app.utils.search.TS_CONFIG
+BACKFILL_BATCH = 5000 # Rows per backfill UPDATE (one short transaction each)
+
+def _search_vector(row):
+    return (
+        f"setweight(to_tsvector('{TS_CONFIG}', coalesce({row}title, '')), 'A') || "
+        f"setweight(to_tsvector('{TS_CONFIG}', coalesce({row}description, '')), 'B') || "
+        f"setweight(to_tsvector('{TS_CONFIG}', coalesce({row}requirements, '')), 'C')"
+    )
+
+POSTGRES_DDL = [
+    "ALTER TABLE jobs ADD COLUMN IF NOT EXISTS search_vector tsvector",
+    f"""
+    CREATE OR REPLACE FUNCTION jobs_search_vector_update() RETURNS trigger AS $$
+    BEGIN
+        NEW.search_vector := {_search_vector("NEW.")};
+        RETURN NEW;
+    END
+    $$ LANGUAGE plpgsql
+    """,
+    "DROP TRIGGER IF EXISTS jobs_search_vector_trg ON jobs",
+    """
+    CREATE TRIGGER jobs_search_vector_trg BEFORE INSERT OR UPDATE OF title, description, requirements
+    ON jobs FOR EACH ROW EXECUTE FUNCTION jobs_search_vector_update()
+    """,
+]
+
+SQLITE_DDL = [
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS jobs_fts USING fts5(
+        title, description, requirements,
+        content='jobs', content_rowid='id', tokenize='porter unicode61'
+    )
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS jobs_fts_ai AFTER INSERT ON jobs BEGIN
+        INSERT INTO jobs_fts(rowid, title, description, requirements)
+        VALUES (new.id, new.title, new.description, new.requirements);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS jobs_fts_ad AFTER DELETE ON jobs BEGIN
+        INSERT INTO jobs_fts(jobs_fts, rowid, title, description, requirements)
+        VALUES ('delete', old.id, old.title, old.description, old.requirements);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS jobs_fts_au AFTER UPDATE OF title, description, requirements ON jobs BEGIN
+        INSERT INTO jobs_fts(jobs_fts, rowid, title, description, requirements)
+        VALUES ('delete', old.id, old.title, old.description, old.requirements);
+        INSERT INTO jobs_fts(rowid, title, description, requirements)
+        VALUES (new.id, new.title, new.description, new.requirements);
+    END
+    """,
+    "INSERT INTO jobs_fts(jobs_fts) VALUES ('rebuild')",
+]
+
+def _backfill(bind):
+    # By id range, so each batch is an index range scan rather than a search for NULLs
+    max_id = bind.execute(sa.text("SELECT max(id) FROM jobs")).scalar() or 0
+    for start in range(0, max_id, BACKFILL_BATCH):
+        bind.execute(sa.text(
+            f"UPDATE jobs SET search_vector = {_search_vector('')} "
+            "WHERE id > :start AND id <= :stop AND search_vector IS NULL"
+        ), {"start": start, "stop": start + BACKFILL_BATCH})
+
+def _upgrade_postgres(bind):
+    # Committed before the backfill so the trigger covers every write from here on
+    for statement in POSTGRES_DDL:
+        op.execute(statement)
+    with op.get_context().autocommit_block():
+        _backfill(bind)
+        invalid = bind.execute(sa.text(
+            "SELECT 1 FROM pg_index i JOIN pg_class c ON c.oid = i.indexrelid "
+            "WHERE NOT i.indisvalid AND c.relname = 'ix_jobs_search_vector' "
+            "AND c.relnamespace = to_regnamespace(current_schema())"
+        )).first()
+        if invalid:
+            print("Dropping invalid index ix_jobs_search_vector left by an interrupted build")
+            op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_jobs_search_vector")
+        op.execute("CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_jobs_search_vector ON jobs USING GIN (search_vector)")
+
+def upgrade():
+    bind = op.get_bind()
+    if bind.dialect.name == "postgresql":
+        _upgrade_postgres(bind)
+    elif bind.dialect.name == "sqlite":
+        for statement in SQLITE_DDL:
+            op.execute(statement)
+    # Search falls back to ILIKE on other backends
+
+def downgrade():
+    dialect = op.get_bind().dialect.name
+    if dialect == "postgresql":
+        op.execute("DROP INDEX IF EXISTS ix_jobs_search_vector")
+        op.execute("DROP TRIGGER IF EXISTS jobs_search_vector_trg ON jobs")
+        op.execute("DROP FUNCTION IF EXISTS jobs_search_vector_update()")
+        op.execute("ALTER TABLE jobs DROP COLUMN IF EXISTS search_vector")
+    elif dialect == "sqlite":
+        for trigger in ("jobs_fts_ai", "jobs_fts_ad", "jobs_fts_au"):
+            op.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+        op.execute("DROP TABLE IF EXISTS jobs_fts")
@@ -0,0 +1,42 @@
+"""seeker_skills inverted index
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-17
+
+Creates the skill index used for job alert matching and (re)builds it from
+seeker_profiles.skills.
+"""
+from alembic import op
+import sqlalchemy as sa
+from app.utils.skill_index import seeker_skill_tokens
+
+revision = '0003'
+down_revision = '0002'
+branch_labels = None
+depends_on = None
+
+def upgrade():
+    bind = op.get_bind()
+    if not sa.inspect(bind).has_table('seeker_skills'):
+        op.create_table('seeker_skills',
+            sa.Column('id', sa.Integer(), primary_key=True),
+            sa.Column('seeker_id', sa.Integer(), sa.ForeignKey('seeker_profiles.id', ondelete='CASCADE'), nullable=False),
+            sa.Column('skill', sa.String(), nullable=False),
+            sa.UniqueConstraint('skill', 'seeker_id', name='uq_seeker_skills_skill_seeker'),
+        )
+        op.create_index('ix_seeker_skills_id', 'seeker_skills', ['id'])
+        op.create_index('ix_seeker_skills_seeker_id', 'seeker_skills', ['seeker_id'])
+        op.create_index('ix_seeker_skills_skill', 'seeker_skills', ['skill'])
+
+    # Rebuild from scratch, databases indexed by the old migrate_skill_index.py may be stale
+    seeker_skills = sa.table('seeker_skills', sa.column('seeker_id'), sa.column('skill'))
+    profiles = bind.execute(sa.text("SELECT id, skills FROM seeker_profiles WHERE skills IS NOT NULL")).fetchall()
+    rows = [{"seeker_id": seeker_id, "skill": skill} for seeker_id, skills in profiles for skill in seeker_skill_tokens(skills)]
+    op.execute(seeker_skills.delete())
+    if rows:
+        op.bulk_insert(seeker_skills, rows)
+    print(f"Indexed {len(rows)} skills for {len(profiles)} seeker profiles")
+
+def downgrade():
+    op.drop_table('seeker_skills')
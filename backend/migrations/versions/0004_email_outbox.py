@@ -0,0 +1,37 @@
+"""email outbox
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-17
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = '0004'
+down_revision = '0003'
+branch_labels = None
+depends_on = None
+
+def upgrade():
+    if sa.inspect(op.get_bind()).has_table('email_outbox'):
+        return
+    op.create_table('email_outbox',
+        sa.Column('id', sa.Integer(), primary_key=True),
+        sa.Column('to_email', sa.String(), nullable=False),
+        sa.Column('subject', sa.String()),
+        sa.Column('body_html', sa.Text()),
+        sa.Column('reply_to', sa.String()),
+        sa.Column('from_name', sa.String()),
+        sa.Column('status', sa.String()),
+        sa.Column('attempts', sa.Integer()),
+        sa.Column('next_attempt_at', sa.DateTime(timezone=True), server_default=sa.func.now()),
+        sa.Column('last_error', sa.Text()),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now()),
+        sa.Column('sent_at', sa.DateTime(timezone=True)),
+    )
+    op.create_index('ix_email_outbox_id', 'email_outbox', ['id'])
+    op.create_index('ix_email_outbox_status', 'email_outbox', ['status'])
+    op.create_index('ix_email_outbox_next_attempt_at', 'email_outbox', ['next_attempt_at'])
+
+def downgrade():
+    op.drop_table('email_outbox')
@@ -0,0 +1,113 @@
+"""foreign-key and query indexes
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-17
+
+Composite indexes shaped after the crud queries (see bench_indexes.py).
+
+On PostgreSQL they are built with CREATE INDEX CONCURRENTLY outside the
+migration transaction, so the tables stay writable while it runs. Indexes
+left INVALID by an interrupted run are dropped and rebuilt on the next one.
+Unique constraints are built as a unique index first and then attached with
+ADD CONSTRAINT ... USING INDEX, which only takes a brief lock.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = '0005'
+down_revision = '0004'
+branch_labels = None
+depends_on = None
+
+OPEN_JOBS = "status = 'open'"
+
+# name, table, columns, partial index condition
+INDEXES = [
+    ("ix_seeker_profiles_user_id", "seeker_profiles", ["user_id"], None),
+    ("ix_employer_profiles_user_id", "employer_profiles", ["user_id"], None),
+    ("ix_jobs_employer_status", "jobs", ["employer_id", "status"], None),
+    ("ix_jobs_created", "jobs", ["created_at", "id"], None),
+    ("ix_jobs_open_created", "jobs", ["created_at", "id"], OPEN_JOBS),
+    ("ix_applications_job_applied", "applications", ["job_id", "applied_at"], None),
+    ("ix_saved_jobs_seeker_created", "saved_jobs", ["seeker_id", "created_at", "id"], None),
+    ("ix_saved_jobs_job_id", "saved_jobs", ["job_id"], None),
+    ("ix_cvs_seeker_created", "cvs", ["seeker_id", "created_at"], None),
+    ("ix_interviews_application_id", "interviews", ["application_id"], None),
+    ("ix_interviews_employer_start", "interviews", ["employer_id", "start_time"], None),
+    ("ix_interviews_seeker_start", "interviews", ["seeker_id", "start_time"], None),
+    ("ix_notifications_user_created", "notifications", ["user_id", "created_at", "id"], None),
+    ("ix_interview_history_interview_id", "interview_history", ["interview_id"], None),
+]
+
+# name, table, columns, whether duplicate rows may be deleted (a saved job is
+# just a bookmark; applications carry interviews and history, so those stop
+# the migration instead)
+UNIQUE_CONSTRAINTS = [
+    ("uq_saved_jobs_seeker_job", "saved_jobs", ["seeker_id", "job_id"], True),
+    ("uq_applications_seeker_job", "applications", ["seeker_id", "job_id"], False),
+]
+
+def _drop_invalid_indexes(bind):
+    # Only the indexes this migration builds: an invalid index of anyone else's
+    # may be a CREATE INDEX CONCURRENTLY still in progress
+    names = [name for name, *_ in INDEXES] + [name for name, *_ in UNIQUE_CONSTRAINTS]
+    invalid = bind.execute(sa.text(
+        "SELECT c.relname FROM pg_index i JOIN pg_class c ON c.oid = i.indexrelid "
+        "WHERE NOT i.indisvalid AND c.relname = ANY(:names) "
+        "AND c.relnamespace = to_regnamespace(current_schema())"
+    ), {"names": names}).scalars().all()
+    for name in invalid:
+        print(f"Dropping invalid index {name} left by an interrupted build")
+        op.execute(f'DROP INDEX CONCURRENTLY IF EXISTS "{name}"')
+
+def _deduplicate(bind, name, table, columns, may_delete):
+    cols = ", ".join(columns)
+    duplicates = bind.execute(sa.text(
+        f"SELECT {cols} FROM {table} GROUP BY {cols} HAVING count(*) > 1"
+    )).fetchall()
+    if not duplicates:
+        return
+    if not may_delete:
+        raise RuntimeError(f"Cannot create {name}: {len(duplicates)} duplicate ({cols}) groups in {table}, resolve them by hand first")
+    print(f"Removing duplicate rows from {table} ({len(duplicates)} groups)")
+    matches = " AND ".join(f"a.{c} = b.{c}" for c in columns)
+    op.execute(f"DELETE FROM {table} WHERE id IN (SELECT a.id FROM {table} a JOIN {table} b ON {matches} AND a.id > b.id)")
+
+def upgrade():
+    bind = op.get_bind()
+    postgres = bind.dialect.name == "postgresql"
+    concurrently = "CONCURRENTLY " if postgres else ""
+
+    with op.get_context().autocommit_block():
+        if postgres:
+            _drop_invalid_indexes(bind)
+
+        for name, table, columns, where in INDEXES:
+            condition = f" WHERE {where}" if where else ""
+            op.execute(f"CREATE INDEX {concurrently}IF NOT EXISTS {name} ON {table} ({', '.join(columns)}){condition}")
+
+        inspector = sa.inspect(bind)
+        for name, table, columns, may_delete in UNIQUE_CONSTRAINTS:
+            existing = {uc['name'] for uc in inspector.get_unique_constraints(table)}
+            if name in existing:
+                continue
+            _deduplicate(bind, name, table, columns, may_delete)
+            if postgres:
+                op.execute(f"CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS {name} ON {table} ({', '.join(columns)})")
+                op.execute(f"ALTER TABLE {table} ADD CONSTRAINT {name} UNIQUE USING INDEX {name}")
+            else:
+                # SQLite can't add constraints in place, batch mode rebuilds the table
+                with op.batch_alter_table(table) as batch_op:
+                    batch_op.create_unique_constraint(name, columns)
+
+        if postgres:
+            # Fresh statistics so the planner starts using the new indexes right away
+            op.execute("ANALYZE")
+
+def downgrade():
+    for name, table, columns, may_delete in UNIQUE_CONSTRAINTS:
+        with op.batch_alter_table(table) as batch_op:
+            batch_op.drop_constraint(name, type_="unique")
+    for name, table, columns, where in INDEXES:
+        op.execute(f"DROP INDEX IF EXISTS {name}")
@@ -0,0 +1,74 @@
+"""employer analytics rollups
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-17
+
+employer_stats and job_daily_stats back the employer dashboard. From here on
+they are maintained incrementally by crud.bump_rollups; this backfills them
+from the existing applications and job view counters. Past views have no
+date, so they only count towards employer_stats.job_views.
+"""
+from datetime import date
+from alembic import op
+import sqlalchemy as sa
+
+revision = '0006'
+down_revision = '0005'
+branch_labels = None
+depends_on = None
+
+def upgrade():
+    op.create_table('employer_stats',
+        sa.Column('employer_id', sa.Integer(), sa.ForeignKey('employer_profiles.id', ondelete='CASCADE'), primary_key=True),
+        sa.Column('total_applicants', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('interviews', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('job_views', sa.Integer(), nullable=False, server_default='0'),
+    )
+    op.create_table('job_daily_stats',
+        sa.Column('job_id', sa.Integer(), sa.ForeignKey('jobs.id', ondelete='CASCADE'), primary_key=True),
+        sa.Column('day', sa.Date(), primary_key=True),
+        sa.Column('employer_id', sa.Integer(), sa.ForeignKey('employer_profiles.id', ondelete='CASCADE'), nullable=False),
+        sa.Column('applications', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('views', sa.Integer(), nullable=False, server_default='0'),
+    )
+    op.create_index('ix_job_daily_stats_employer_day', 'job_daily_stats', ['employer_id', 'day'])
+
+    bind = op.get_bind()
+    if bind.dialect.name == "postgresql":
+        day = "(a.applied_at AT TIME ZONE 'UTC')::date"
+    else:
+        day = "date(a.applied_at)"
+
+    totals = {}
+    for employer_id, views in bind.execute(sa.text(
+        "SELECT employer_id, coalesce(sum(views), 0) FROM jobs WHERE employer_id IS NOT NULL GROUP BY employer_id"
+    )):
+        totals[employer_id] = {"employer_id": employer_id, "total_applicants": 0, "interviews": 0, "job_views": views}
+    for employer_id, applicants, interviews in bind.execute(sa.text(
+        "SELECT j.employer_id, count(*), count(CASE WHEN a.status = 'interviewed' THEN 1 END) "
+        "FROM applications a JOIN jobs j ON j.id = a.job_id WHERE j.employer_id IS NOT NULL GROUP BY j.employer_id"
+    )):
+        totals[employer_id]["total_applicants"] = applicants
+        totals[employer_id]["interviews"] = interviews
+
+    daily = [
+        {"job_id": job_id, "day": d if isinstance(d, date) else date.fromisoformat(d), "employer_id": employer_id, "applications": n, "views": 0}
+        for job_id, employer_id, d, n in bind.execute(sa.text(
+            f"SELECT a.job_id, j.employer_id, {day} AS day, count(*) "
+            f"FROM applications a JOIN jobs j ON j.id = a.job_id "
+            f"WHERE j.employer_id IS NOT NULL AND a.applied_at IS NOT NULL GROUP BY a.job_id, j.employer_id, {day}"
+        ))
+    ]
+
+    employer_stats = sa.table('employer_stats', sa.column('employer_id'), sa.column('total_applicants'), sa.column('interviews'), sa.column('job_views'))
+    job_daily_stats = sa.table('job_daily_stats', sa.column('job_id'), sa.column('day', sa.Date()), sa.column('employer_id'), sa.column('applications'), sa.column('views'))
+    if totals:
+        op.bulk_insert(employer_stats, list(totals.values()))
+    if daily:
+        op.bulk_insert(job_daily_stats, daily)
+    print(f"Backfilled stats for {len(totals)} employers, {len(daily)} job-days")
+
+def downgrade():
+    op.drop_table('job_daily_stats')
+    op.drop_table('employer_stats')
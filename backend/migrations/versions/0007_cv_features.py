@@ -0,0 +1,25 @@
+"""cached CV features
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-10-17
+
+Existing CVs get their features computed the first time analytics reads
+them (see app/utils/cv_features.py), so no backfill here.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = '0007'
+down_revision = '0006'
+branch_labels = None
+depends_on = None
+
+def upgrade():
+    op.add_column('cvs', sa.Column('content_hash', sa.String(length=64)))
+    op.add_column('cvs', sa.Column('features_json', sa.Text()))
+
+def downgrade():
+    with op.batch_alter_table('cvs') as batch_op:
+        batch_op.drop_column('features_json')
+        batch_op.drop_column('content_hash')
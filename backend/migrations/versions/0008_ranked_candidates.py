@@ -0,0 +1,29 @@
+"""ranked candidates index
+
+Revision ID: 0008
+Revises: 0007
+Create Date: 2026-10-17
+
+(job_id, match_score DESC, id DESC) serves the employer's ranked candidate
+list: the top K applicants of a job, and each following page, are read off
+the index in order. Built CONCURRENTLY on PostgreSQL like 0005.
+"""
+from alembic import op
+
+revision = '0008'
+down_revision = '0007'
+branch_labels = None
+depends_on = None
+
+def upgrade():
+    # Rows without a score would sort apart from everyone else (NULLS FIRST) and can't be paged past
+    op.execute("UPDATE applications SET match_score = 0 WHERE match_score IS NULL")
+
+    bind = op.get_bind()
+    concurrently = "CONCURRENTLY " if bind.dialect.name == "postgresql" else ""
+    with op.get_context().autocommit_block():
+        op.execute(f"DROP INDEX {concurrently}IF EXISTS ix_applications_job_score")
+        op.execute(f"CREATE INDEX {concurrently}ix_applications_job_score ON applications (job_id, match_score DESC, id DESC)")
+
+def downgrade():
+    op.drop_index('ix_applications_job_score', table_name='applications')
@@ -0,0 +1,39 @@
+"""job updated_at and listing versions
+
+Revision ID: 0009
+Revises: 0008
+Create Date: 2026-10-17
+
+Validators for HTTP caching of GET /jobs/{id} (jobs.updated_at) and
+GET /jobs/ (listing_versions, see crud.bump_listing_version). Existing
+jobs start with updated_at = created_at.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = '0009'
+down_revision = '0008'
+branch_labels = None
+depends_on = None
+
+def upgrade():
+    bind = op.get_bind()
+    if bind.dialect.name == "postgresql":
+        op.add_column('jobs', sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.func.now()))
+    else:
+        # SQLite can't ADD COLUMN with a non-constant default. Rows inserted without one
+        # read as created_at until their first edit (crud.get_job_validators)
+        op.add_column('jobs', sa.Column('updated_at', sa.DateTime(timezone=True)))
+    op.execute("UPDATE jobs SET updated_at = coalesce(created_at, CURRENT_TIMESTAMP)")
+
+    op.create_table('listing_versions',
+        sa.Column('name', sa.String(), primary_key=True),
+        sa.Column('version', sa.Integer(), nullable=False),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.func.now()),
+    )
+    op.execute("INSERT INTO listing_versions (name, version, updated_at) VALUES ('jobs', 1, CURRENT_TIMESTAMP)")
+
+def downgrade():
+    op.drop_table('listing_versions')
+    # Not batch mode: recreating jobs on SQLite would drop the search triggers
+    op.drop_column('jobs', 'updated_at')
@@ -0,0 +1,28 @@
+"""jobs.applicants_count counter
+
+Revision ID: 0010
+Revises: 0009
+Create Date: 2026-10-17
+
+Applicant count per job, maintained by crud.create_application. Backfilled
+here in the same transaction as the ADD COLUMN, which keeps jobs locked
+until the counts are in, so no application slips between the two.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = '0010'
+down_revision = '0009'
+branch_labels = None
+depends_on = None
+
+def upgrade():
+    op.add_column('jobs', sa.Column('applicants_count', sa.Integer(), nullable=False, server_default='0'))
+    op.execute(
+        "UPDATE jobs SET applicants_count = "
+        "(SELECT count(*) FROM applications WHERE applications.job_id = jobs.id)"
+    )
+
+def downgrade():
+    # Not batch mode: recreating jobs on SQLite would drop the search triggers
+    op.drop_column('jobs', 'applicants_count')
@@ -0,0 +1,39 @@
+"""task_queue table
+
+Revision ID: 0011
+Revises: 0010
+Create Date: 2026-10-17
+
+Durable queue for background work (job alert fan-out, applicant
+re-scoring), run by app/task_worker.py instead of in the API process.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = '0011'
+down_revision = '0010'
+branch_labels = None
+depends_on = None
+
+def upgrade():
+    op.create_table(
+        'task_queue',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('name', sa.String(), nullable=False),
+        sa.Column('payload', sa.Text(), nullable=True),
+        sa.Column('status', sa.String(), nullable=False),
+        sa.Column('attempts', sa.Integer(), nullable=False),
+        sa.Column('next_attempt_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+        sa.Column('locked_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('last_error', sa.Text(), nullable=True),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+        sa.Column('finished_at', sa.DateTime(timezone=True), nullable=True),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_task_queue_id', 'task_queue', ['id'], unique=False)
+    op.create_index('ix_task_queue_due', 'task_queue', ['status', 'next_attempt_at'], unique=False)
+
+def downgrade():
+    op.drop_index('ix_task_queue_due', table_name='task_queue')
+    op.drop_index('ix_task_queue_id', table_name='task_queue')
+    op.drop_table('task_queue')
@@ -0,0 +1,33 @@
+"""unread notifications partial index
+
+Revision ID: 0012
+Revises: 0011
+Create Date: 2026-10-17
+
+Partial index on notifications (user_id) WHERE is_read = false for the
+unread count. It only holds unread rows, so it stays small however many
+notifications users have read. Built CONCURRENTLY on PostgreSQL like 0005.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = '0012'
+down_revision = '0011'
+branch_labels = None
+depends_on = None
+
+def upgrade():
+    # Rows inserted without the ORM default would be neither read nor counted as unread
+    op.execute(sa.text("UPDATE notifications SET is_read = :false WHERE is_read IS NULL").bindparams(false=False))
+
+    bind = op.get_bind()
+    if bind.dialect.name == "postgresql":
+        concurrently, unread = "CONCURRENTLY ", "is_read = false"
+    else:
+        concurrently, unread = "", "is_read = 0"
+    with op.get_context().autocommit_block():
+        op.execute(f"DROP INDEX {concurrently}IF EXISTS ix_notifications_user_unread")
+        op.execute(f"CREATE INDEX {concurrently}ix_notifications_user_unread ON notifications (user_id) WHERE {unread}")
+
+def downgrade():
+    op.drop_index('ix_notifications_user_unread', table_name='notifications')
@@ -0,0 +1,25 @@
+"""email outbox lease
+
+Revision ID: 0013
+Revises: 0012
+Create Date: 2026-10-17
+
+email_outbox.locked_at: the email worker claims rows (status 'sending')
+and commits before it talks to SMTP, instead of holding row locks for the
+whole batch. A claimed row whose lease expired is picked up again.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = '0013'
+down_revision = '0012'
+branch_labels = None
+depends_on = None
+
+def upgrade():
+    op.add_column('email_outbox', sa.Column('locked_at', sa.DateTime(timezone=True), nullable=True))
+
+def downgrade():
+    # Claimed rows go back to the queue, they were not confirmed sent
+    op.execute(sa.text("UPDATE email_outbox SET status = 'pending' WHERE status = 'sending'"))
+    op.drop_column('email_outbox', 'locked_at')
@@ -0,0 +1,22 @@
+import os
+import sys
+import tempfile
+
+# Tests run against a throwaway SQLite database; set before the app is imported
+os.environ.setdefault("DATABASE_URL", "sqlite:///" + os.path.join(tempfile.gettempdir(), "afritalent_test.db"))
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+from app.database import Base, engine, SessionLocal
+from app import models  # noqa: F401 (registers the tables)
+
+@pytest.fixture
+def db():
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    session = SessionLocal()
+    try:
+        yield session
+    finally:
+        session.close()
+        Base.metadata.drop_all(bind=engine)
@@ -0,0 +1,108 @@
+import socket
+from datetime import datetime, timedelta, timezone
+import pytest
+from app import models
+from app.config import settings
+from app.database import SessionLocal
+from app.email_worker import SMTPSession, claim_batch, process_batch
+
+pytest.importorskip("aiosmtpd")
+from aiosmtpd.controller import Controller
+from aiosmtpd.smtp import AuthResult
+
+class Handler:
+    def __init__(self):
+        self.received = []
+
+    async def handle_RCPT(self, server, session, envelope, address, rcpt_options):
+        if address.startswith("gone@"):
+            return "550 5.1.1 No such user"
+        if address.startswith("full@"):
+            return "452 4.2.2 Mailbox full"
+        envelope.rcpt_tos.append(address)
+        return "250 OK"
+
+    async def handle_DATA(self, server, session, envelope):
+        self.received.extend(envelope.rcpt_tos)
+        return "250 OK"
+
+def _free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+@pytest.fixture
+def smtp_server(monkeypatch):
+    handler = Handler()
+    controller = Controller(
+        handler, hostname="127.0.0.1", port=_free_port(), auth_require_tls=False,
+        authenticator=lambda server, session, envelope, mechanism, auth_data: AuthResult(success=auth_data.password == b"secret", handled=False),
+    )
+    controller.start()
+    monkeypatch.setattr(settings, "SMTP_HOST", "127.0.0.1")
+    monkeypatch.setattr(settings, "SMTP_PORT", controller.port)
+    monkeypatch.setattr(settings, "SMTP_USE_TLS", False)
+    monkeypatch.setattr(settings, "SMTP_USER", "worker")
+    monkeypatch.setattr(settings, "SMTP_PASSWORD", "secret")
+    try:
+        yield handler
+    finally:
+        controller.stop()
+
+def _queue(db, *addresses):
+    emails = [models.EmailOutbox(to_email=a, subject="Hi", body_html="<p>Hi</p>", status=models.EmailStatus.PENDING, attempts=0)
+              for a in addresses]
+    db.add_all(emails)
+    db.commit()
+    return [e.id for e in emails]
+
+def _statuses(db, ids):
+    db.expire_all()
+    return [(e.status, e.attempts) for e in (db.get(models.EmailOutbox, i) for i in ids)]
+
+def test_sends_batch_and_commits_each_outcome(db, smtp_server):
+    ids = _queue(db, "a@example.com", "gone@example.com", "full@example.com", "b@example.com")
+    session = SMTPSession()
+    try:
+        assert process_batch(db, session) == 4
+    finally:
+        session.close()
+
+    assert smtp_server.received == ["a@example.com", "b@example.com"]
+    assert _statuses(db, ids) == [
+        ("sent", 1),
+        ("dead", 1), # 5xx to RCPT: permanent for this message
+        ("pending", 1), # 4xx: retried later
+        ("sent", 1),
+    ]
+
+def test_login_failure_requeues_batch_without_using_attempts(db, smtp_server, monkeypatch):
+    monkeypatch.setattr(settings, "SMTP_PASSWORD", "wrong")
+    ids = _queue(db, "a@example.com", "b@example.com")
+    session = SMTPSession()
+    try:
+        assert process_batch(db, session) == 0
+    finally:
+        session.close()
+
+    assert smtp_server.received == []
+    assert _statuses(db, ids) == [("pending", 0), ("pending", 0)]
+    email = db.get(models.EmailOutbox, ids[0])
+    assert email.next_attempt_at.replace(tzinfo=timezone.utc) > datetime.now(timezone.utc)
+    assert "535" in email.last_error
+
+def test_claim_is_committed_and_expired_leases_are_reclaimed(db, monkeypatch):
+    ids = _queue(db, "a@example.com")
+    assert [e.id for e in claim_batch(db, 10)] == ids
+
+    # Visible to other workers before anything is sent, and not claimed twice
+    other = SessionLocal()
+    try:
+        assert other.get(models.EmailOutbox, ids[0]).status == models.EmailStatus.SENDING
+        assert claim_batch(other, 10) == []
+        monkeypatch.setattr(settings, "EMAIL_LEASE_SECONDS", 0)
+        other.query(models.EmailOutbox).update({models.EmailOutbox.locked_at: datetime.now(timezone.utc) - timedelta(seconds=1)})
+        other.commit()
+        assert [e.id for e in claim_batch(other, 10)] == ids
+    finally:
+        other.close()
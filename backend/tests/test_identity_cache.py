@@ -0,0 +1,32 @@
+from app import models
+from app.utils.identity_cache import identity_cache, snapshot_user
+
+def test_cached_profile_ids_are_used_without_loading_the_profile(db):
+    user = models.User(email="ada@example.com", hashed_password="x", role="seeker")
+    db.add(user)
+    db.commit()
+    profile = models.SeekerProfile(user_id=user.id, first_name="Ada")
+    db.add(profile)
+    db.commit()
+    identity_cache.put(user.email, snapshot_user(user), (profile.id, None))
+    db.close()
+
+    cached = identity_cache.get(db, "ada@example.com")
+    assert cached.seeker_profile_id == profile.id
+    assert "seeker_profile" not in cached.__dict__ # Not loaded
+    assert cached.employer_profile_id is None
+
+def test_creating_a_profile_drops_the_users_entry(db):
+    user = models.User(email="bo@example.com", hashed_password="x", role="employer")
+    db.add(user)
+    db.commit()
+    identity_cache.put(user.email, snapshot_user(user), (None, None))
+
+    db.add(models.EmployerProfile(user_id=user.id, company_name="Co"))
+    db.flush()
+    db.rollback()
+    assert identity_cache.get(db, "bo@example.com") is not None
+
+    db.add(models.EmployerProfile(user_id=user.id, company_name="Co"))
+    db.commit()
+    assert identity_cache.get(db, "bo@example.com") is None
@@ -0,0 +1,32 @@
+from app import crud, models, schemas
+
+def _job_and_seeker(db):
+    employer = models.EmployerProfile(company_name="Co")
+    seeker = models.SeekerProfile(first_name="Ada", last_name="L")
+    db.add_all([employer, seeker])
+    db.commit()
+    job = models.Job(employer_id=employer.id, title="Engineer", status="open")
+    db.add(job)
+    db.commit()
+    return job, seeker
+
+def test_new_application_moves_job_and_listing_validators(db):
+    job, seeker = _job_and_seeker(db)
+    before, listing_before = crud.get_job_validators(db, job.id), crud.get_listing_version(db)[0]
+
+    crud.create_application(db, schemas.ApplicationCreate(job_id=job.id), seeker.id)
+
+    after = crud.get_job_validators(db, job.id)
+    assert after[0] == before[0] # Not an edit: Last-Modified stays
+    assert after[2] == before[2] + 1
+    assert crud.get_listing_version(db)[0] > listing_before
+
+def test_view_flush_moves_job_and_listing_validators(db):
+    job, _ = _job_and_seeker(db)
+    listing_before = crud.get_listing_version(db)[0]
+
+    crud.increment_job_views(db, {job.id: 3})
+
+    assert crud.get_job_validators(db, job.id)[1] == 3
+    assert crud.get_listing_version(db)[0] > listing_before
+    assert crud.get_job_validators(db, job.id + 1) is None
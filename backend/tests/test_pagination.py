@@ -0,0 +1,79 @@
+from datetime import datetime
+import pytest
+from sqlalchemy import event, insert
+from app import models
+from app.utils.pagination import apply_keyset, next_cursor, encode_cursor, InvalidCursor
+
+def _page(db, cursor=None, limit=2):
+    query = apply_keyset(db.query(models.Job), models.Job.created_at, models.Job.id, cursor)
+    items = query.limit(limit).all()
+    return [job.id for job in items], next_cursor(items, limit, "created_at")
+
+def test_cursor_moves_forward_with_duplicate_timestamps(db):
+    employer = models.EmployerProfile(company_name="Co")
+    db.add(employer)
+    db.commit()
+    # One INSERT: every row gets the same CURRENT_TIMESTAMP server default
+    db.execute(insert(models.Job), [{"employer_id": employer.id, "title": f"Job {i}"} for i in range(5)])
+    db.commit()
+
+    seen, cursor = [], None
+    for _ in range(5):
+        ids, cursor = _page(db, cursor)
+        seen.extend(ids)
+        if cursor is None:
+            break
+    assert seen == [5, 4, 3, 2, 1]
+
+def test_cursor_mixes_server_and_client_timestamps(db):
+    employer = models.EmployerProfile(company_name="Co")
+    db.add(employer)
+    db.commit()
+    db.execute(insert(models.Job), [{"employer_id": employer.id, "title": "server default"}])
+    db.add(models.Job(employer_id=employer.id, title="client set", created_at=datetime(2000, 1, 1, 0, 0, 0, 500000)))
+    db.commit()
+
+    first, cursor = _page(db, limit=1)
+    second, _ = _page(db, cursor, limit=1)
+    assert first == [1] and second == [2]
+
+@pytest.mark.parametrize("values", [[1, "x"], ["x", 1], [{"dt": "2026-01-01T00:00:00"}, "1"], [{"dt": "2026-01-01T00:00:00"}, True]])
+def test_cursor_with_wrong_value_types_is_rejected(db, values):
+    cursor = encode_cursor(*values)
+    with pytest.raises(InvalidCursor):
+        apply_keyset(db.query(models.Job), models.Job.created_at, models.Job.id, cursor)
+
+def test_cursor_value_is_not_cached_across_pages(db):
+    # Same statement shape with different cursors: each page must use its own value
+    employer = models.EmployerProfile(company_name="Co")
+    db.add(employer)
+    db.commit()
+    for i in range(6):
+        db.add(models.Job(employer_id=employer.id, title=f"Job {i}", created_at=datetime(2024, 1, 1, 0, 0, i, 250000 if i % 2 else 0)))
+    db.commit()
+
+    seen, cursor = [], None
+    while True:
+        ids, cursor = _page(db, cursor)
+        seen.extend(ids)
+        if cursor is None:
+            break
+    assert seen == [6, 5, 4, 3, 2, 1]
+
+def test_open_jobs_page_orders_on_the_index(db):
+    # The keyset column stays bare so SQLite can read the page off ix_jobs_open_created
+    query = apply_keyset(db.query(models.Job.id).filter(models.Job.status == "open"), models.Job.created_at, models.Job.id,
+                         encode_cursor(datetime(2024, 1, 1), 10)).limit(20)
+    executed = []
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        executed.append((statement, parameters))
+    engine = db.get_bind()
+    event.listen(engine, "before_cursor_execute", capture)
+    try:
+        query.all()
+    finally:
+        event.remove(engine, "before_cursor_execute", capture)
+    statement, parameters = executed[-1]
+    plan = db.connection().exec_driver_sql("EXPLAIN QUERY PLAN " + statement, parameters).all()
+    details = " ".join(row[-1] for row in plan)
+    assert "ix_jobs_open_created" in details and "TEMP B-TREE" not in details
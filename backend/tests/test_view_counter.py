@@ -0,0 +1,35 @@
+from starlette.requests import Request
+from app.config import settings
+from app.routers.auth import create_access_token
+from app.utils.view_counter import ViewBuffer, viewer_id
+
+def _request(client="10.0.0.1", headers=()):
+    return Request({
+        "type": "http", "method": "GET", "path": "/jobs/1", "client": (client, 1234),
+        "headers": [(k.lower().encode(), v.encode()) for k, v in headers],
+    })
+
+def test_dedup_is_bounded_and_expires_lazily(monkeypatch):
+    monkeypatch.setattr(settings, "VIEW_DEDUP_UNIQUE", True)
+    monkeypatch.setattr(settings, "VIEW_DEDUP_MAX_ENTRIES", 2)
+    buffer = ViewBuffer(session_factory=None)
+
+    assert buffer.record(1, viewer="a") and not buffer.record(1, viewer="a")
+    buffer.record(2, viewer="a")
+    buffer.record(3, viewer="a")
+    assert list(buffer._seen) == [(2, "a"), (3, "a")] # Oldest dropped past the cap
+    assert buffer.record(1, viewer="a")
+
+    monkeypatch.setattr(settings, "VIEW_DEDUP_WINDOW_SECONDS", 0)
+    assert buffer.record(1, viewer="a") # Expired on the way in
+    assert len(buffer._seen) == 1
+
+def test_viewer_id_prefers_the_user_then_the_trusted_forwarded_address(monkeypatch):
+    monkeypatch.setattr(settings, "TRUSTED_PROXIES", ["10.0.0.1"])
+    token = create_access_token({"sub": "ada@example.com"})
+
+    assert viewer_id(_request(headers=[("Authorization", f"Bearer {token}")])) == "user:ada@example.com"
+    assert viewer_id(_request(headers=[("X-Forwarded-For", "1.2.3.4, 10.0.0.1")])) == "ip:1.2.3.4"
+    # From an untrusted peer the header is ignored
+    assert viewer_id(_request(client="5.6.7.8", headers=[("X-Forwarded-For", "1.2.3.4")])) == "ip:5.6.7.8"
+    assert viewer_id(_request(headers=[("Authorization", "Bearer garbage")])) == "ip:10.0.0.1"
@@ -1,7 +1,7 @@
 import React, { useState, useEffect, useRef } from 'react';
 import { Bell, Check, Clock } from 'lucide-react';
 import { motion, AnimatePresence } from 'framer-motion';
-import { getNotifications, markNotificationRead, Notification } from '../../lib/api';
+import { getNotifications, getUnreadNotificationCount, markNotificationRead, markAllNotificationsRead, streamNotifications, Notification } from '../../lib/api';
 import { formatTime } from '../../lib/utils';
 import { Button } from '../common/Button';
 
@@ -11,24 +11,52 @@ export function NotificationsPopover() {
     const [unreadCount, setUnreadCount] = useState(0);
     const [loading, setLoading] = useState(false);
     const containerRef = useRef<HTMLDivElement>(null);
+    const loadedRef = useRef(false); // Whether the list has been fetched yet
 
+    const fetchUnreadCount = async () => {
+        try {
+            setUnreadCount(await getUnreadNotificationCount());
+        } catch (error) {
+            console.error('Failed to fetch unread count:', error);
+        }
+    };
+
+    // The list is only needed once the popover is opened; after the first
+    // load only notifications newer than the newest one we have are fetched
     const fetchNotifications = async () => {
         try {
-            const data = await getNotifications();
-            // Sort by Date (newest first) - assuming ID or created_at
-            // The API returns them, let's assume backend sorts or we sort here if needed
-            setNotifications(data.reverse());
-            setUnreadCount(data.filter(n => !n.is_read).length);
+            if (!loadedRef.current) {
+                const data = await getNotifications();
+                loadedRef.current = true;
+                setNotifications(data.reverse());
+                setUnreadCount(data.filter(n => !n.is_read).length);
+                return;
+            }
+            const newestId = notifications.reduce((max, n) => Math.max(max, n.id), 0);
+            const data = await getNotifications(newestId);
+            if (data.length > 0) {
+                setNotifications(prev => [...prev, ...data.reverse().filter(n => !prev.some(p => p.id === n.id))]);
+            }
         } catch (error) {
             console.error('Failed to fetch notifications:', error);
         }
     };
 
-    // Initial fetch and periodic poll
+    // Badge count on load, then new notifications are pushed over the stream
     useEffect(() => {
-        fetchNotifications();
-        const interval = setInterval(fetchNotifications, 30000); // Poll every 30s
-        return () => clearInterval(interval);
+        fetchUnreadCount();
+        const controller = new AbortController();
+        streamNotifications((notification) => {
+            setNotifications(prev => prev.some(n => n.id === notification.id) ? prev : [...prev, notification]);
+            if (!notification.is_read) {
+                setUnreadCount(prev => prev + 1);
+            }
+        }, controller.signal, () => {
+            // Missed too many while disconnected: reload the list and the badge
+            loadedRef.current = false;
+            fetchNotifications().then(fetchUnreadCount);
+        });
+        return () => controller.abort();
     }, []);
 
     // Close on click outside
@@ -60,9 +88,8 @@ export function NotificationsPopover() {
         setNotifications(prev => prev.map(n => ({ ...n, is_read: true })));
         setUnreadCount(0);
 
-        // Process in background
-        for (const id of unreadIds) {
-            markNotificationRead(id).catch(console.error);
+        if (unreadIds.length > 0 || unreadCount > 0) {
+            markAllNotificationsRead().catch(console.error);
         }
     };
 
@@ -443,11 +443,71 @@ export interface Notification {
     created_at: string;
 }
 
-export const getNotifications = async () => {
-    const response = await api.get<Notification[]>('/notifications/');
+// Newest first. sinceId: only those newer than the newest one already loaded
+export const getNotifications = async (sinceId?: number) => {
+    const response = await api.get<Notification[]>('/notifications/', {
+        params: sinceId !== undefined ? { since_id: sinceId } : undefined,
+    });
     return response.data;
 };
 
+export const getUnreadNotificationCount = async () => {
+    const response = await api.get<{ unread: number }>('/notifications/unread-count');
+    return response.data.unread;
+};
+
+export const markAllNotificationsRead = async () => {
+    const response = await api.put<{ updated: number }>('/notifications/read-all');
+    return response.data.updated;
+};
+
+// Pushes new notifications as they are created (Server-Sent Events). Uses
+// fetch rather than EventSource so the Authorization header can be sent;
+// reconnects with Last-Event-ID so nothing is missed in between. When too
+// much was missed to replay, onResync is called instead and the caller
+// reloads from the REST endpoints. Stop it by aborting the signal.
+export const streamNotifications = async (onNotification: (n: Notification) => void, signal: AbortSignal, onResync?: () => void) => {
+    let lastEventId: string | null = null;
+    while (!signal.aborted) {
+        try {
+            const headers: Record<string, string> = { Accept: 'text/event-stream' };
+            const token = localStorage.getItem('token');
+            if (token) headers['Authorization'] = `Bearer ${token}`;
+            if (lastEventId) headers['Last-Event-ID'] = lastEventId;
+
+            const response = await fetch(`${API_URL}/notifications/stream`, { headers, signal });
+            if (response.status === 401) return; // Logged out
+            if (!response.ok || !response.body) throw new Error(`Stream failed: ${response.status}`);
+
+            const reader = response.body.pipeThrough(new TextDecoderStream()).getReader();
+            let buffer = '';
+            while (true) {
+                const { value, done } = await reader.read();
+                if (done) break;
+                buffer += value;
+                const events = buffer.split('\n\n');
+                buffer = events.pop() ?? '';
+                for (const event of events) {
+                    let name = 'message';
+                    let data = '';
+                    for (const line of event.split('\n')) {
+                        if (line.startsWith('id:')) lastEventId = line.slice(3).trim();
+                        else if (line.startsWith('event:')) name = line.slice(6).trim();
+                        else if (line.startsWith('data:')) data += line.slice(5).trim();
+                    }
+                    if (name === 'resync') onResync?.();
+                    else if (data) onNotification(JSON.parse(data));
+                }
+            }
+        } catch (error) {
+            if (signal.aborted) return;
+            console.error('Notification stream error:', error);
+        }
+        // Connection closed or failed, reconnect shortly
+        await new Promise(resolve => setTimeout(resolve, 5000));
+    }
+};
+
 export const markNotificationRead = async (id: number) => {
     const response = await api.put<Notification>(`/notifications/${id}/read`);
     return response.data;
@@ -31,7 +31,7 @@ import {
   AlertCircle
 } from 'lucide-react';
 import { motion, AnimatePresence } from 'framer-motion';
-import { getSeekerProfile, updateSeekerProfile, createCV, getCVs, uploadCV, deleteCV, updateCV, setPrimaryCV, CV } from '../../lib/api';
+import { getSeekerProfile, updateSeekerProfile, createCV, getCVs, getCV, uploadCV, deleteCV, updateCV, setPrimaryCV, CV } from '../../lib/api';
 
 interface Education {
   id: string;
@@ -149,13 +149,25 @@ export function CVBuilderPage() {
     } catch (e) { console.error(e); }
   };
 
-  const selectVersion = (cv: CV | null) => {
-    setActiveCV(cv);
+  // The versions list comes without CV bodies (content_html / content_json), fetch them when needed
+  const withContent = async (cv: CV) => {
+    if (cv.is_uploaded) return cv;
+    return { ...cv, ...(await getCV(cv.id)) };
+  };
+
+  const selectVersion = async (cv: CV | null) => {
     if (!cv) {
+      setActiveCV(null);
       // Switch back to builder - could optionally reload profile here
       setShowPreview(false);
       return;
     }
+    try {
+      cv = await withContent(cv);
+    } catch (e) {
+      console.error(e);
+    }
+    setActiveCV(cv);
 
     if (!cv.is_uploaded && cv.content_html) {
       // If it's a builder version, we might want to "load" it into the editor 
@@ -247,11 +259,18 @@ export function CVBuilderPage() {
     }
   };
 
-  const handleLoadForEditing = (cv: CV) => {
+  const handleLoadForEditing = async (cv: CV) => {
     if (cv.is_uploaded) {
       setMessage({ type: 'error', text: 'Uploaded PDFs cannot be edited in the builder' });
       return;
     }
+    try {
+      cv = await withContent(cv);
+    } catch (e) {
+      console.error(e);
+      setMessage({ type: 'error', text: 'Failed to load CV data' });
+      return;
+    }
     if (cv.content_json) {
       try {
         const data = JSON.parse(cv.content_json);